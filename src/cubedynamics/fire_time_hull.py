@@ -9,8 +9,11 @@ from the fire/time-hull prototype used in notebooks.
 """
 
 from dataclasses import dataclass, field, replace
+import functools
+import math
 import shutil
 import tempfile
+from types import MappingProxyType
 from pathlib import Path
 import zipfile
 import warnings
@@ -22,18 +25,26 @@ import xarray as xr
 import geopandas as gpd
 import plotly.graph_objects as go
 import requests
-from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+from shapely.geometry import MultiPolygon, Point, Polygon
 from shapely.ops import unary_union
 from shapely.prepared import prep
 
+try:  # Shapely >= 2: predicates evaluated over whole geometry arrays in GEOS.
+    from shapely import box as _shapely_box, covers as _shapely_covers, points as _shapely_points
+    from shapely import equals as _shapely_equals, prepare as _shapely_prepare
+    from shapely import union_all as _shapely_union_all
+except ImportError:  # pragma: no cover - shapely < 2
+    _shapely_box = _shapely_covers = _shapely_points = None
+    _shapely_equals = _shapely_prepare = _shapely_union_all = None
 
-def _union_all(geoms):
-    try:
-        from shapely import union_all  # type: ignore
 
-        return union_all(geoms)
-    except Exception:
-        return unary_union(geoms)
+def _union_all(geoms):
+    if _shapely_union_all is not None:
+        try:
+            return _shapely_union_all(geoms)
+        except Exception:
+            pass
+    return unary_union(geoms)
 
 
 def log(verbose: bool, *args) -> None:
@@ -361,6 +372,8 @@ class FireHull:
     t_norm_vert: np.ndarray
     metrics: HullMetrics
     environment: dict[str, "HullEnvironmentField"] = field(default_factory=dict)
+    # Signed per-vertex speed/acceleration for hulls from compute_derivative_hull.
+    vertex_field: np.ndarray | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         if not isinstance(self.metrics, HullMetrics):
@@ -528,6 +541,27 @@ class HullClimateSummary:
     values_inside: np.ndarray
     values_outside: np.ndarray
     per_day_mean: pd.Series
+    _day_values: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Samples only feed histograms and NaN filters, so they are held as
+        # flat contiguous float32 arrays whatever the producer handed in.
+        self.values_inside = np.ascontiguousarray(self.values_inside, dtype=np.float32).ravel()
+        self.values_outside = np.ascontiguousarray(self.values_outside, dtype=np.float32).ravel()
+
+    def day_values(self) -> np.ndarray:
+        """Return ``per_day_mean`` in date order as float64, computed once.
+
+        The sampler emits days in cube order, so the sort is skipped when the
+        index is already monotonic.
+        """
+
+        if self._day_values is None:
+            per_day = self.per_day_mean
+            if not per_day.index.is_monotonic_increasing:
+                per_day = per_day.sort_index()
+            self._day_values = per_day.to_numpy(dtype=np.float64, copy=False)
+        return self._day_values
 
 
 @dataclass
@@ -627,6 +661,9 @@ def clean_event_daily_rows(
     eg[date_col] = normalize_dates(eg[date_col])
     eg = eg.sort_values(date_col)
 
+    if _shapely_equals is not None:
+        return _clean_event_rows_vectorized(eg, gdf_daily.crs)
+
     rows: list[pd.Series] = []
     last_geom = None
 
@@ -655,6 +692,33 @@ def clean_event_daily_rows(
     return out
 
 
+def _clean_event_rows_vectorized(eg: gpd.GeoDataFrame, crs) -> Optional[gpd.GeoDataFrame]:
+    """Array form of the :func:`clean_event_daily_rows` loop (shapely >= 2).
+
+    Drops missing/empty perimeters, dissolves MultiPolygons, and removes rows
+    whose geometry equals the previous row. Topological equality is
+    transitive, so comparing neighbours matches comparing against the last
+    kept perimeter.
+    """
+
+    eg = eg.loc[~(eg.geometry.isna() | eg.geometry.is_empty).to_numpy()]
+    if eg.empty:
+        return None
+
+    geoms = np.asarray(eg.geometry.values, dtype=object)
+    for i in np.flatnonzero((eg.geometry.geom_type == "MultiPolygon").to_numpy()):
+        try:
+            geoms[i] = unary_union(geoms[i])
+        except Exception:
+            pass
+
+    keep = np.ones(geoms.size, dtype=bool)
+    keep[1:] = ~_shapely_equals(geoms[1:], geoms[:-1])
+    out = eg.loc[keep].copy()
+    out[out.geometry.name] = gpd.GeoSeries(geoms[keep], index=out.index, crs=eg.crs)
+    return gpd.GeoDataFrame(out, crs=crs).reset_index(drop=True)
+
+
 def _largest_polygon(geom) -> Optional[Polygon]:
     if geom is None or geom.is_empty:
         return None
@@ -672,17 +736,21 @@ def _sample_ring_equal_steps(poly: Polygon, n_samples: int = 100) -> Optional[np
     if poly is None or poly.is_empty:
         return None
 
-    ring = LineString(poly.exterior.coords)
-    if len(ring.coords) > 1 and ring.coords[0] == ring.coords[-1]:
-        ring = LineString(list(ring.coords)[:-1])
+    coords = np.asarray(poly.exterior.coords, dtype=float)[:, :2]
+    if len(coords) > 1 and np.array_equal(coords[0], coords[-1]):
+        coords = coords[:-1]
+    if len(coords) < 2:
+        return None
 
-    L = ring.length
+    # Arc-length parametrisation of the open ring; np.interp places every
+    # sample in one pass instead of one LineString.interpolate call each.
+    arc = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(coords, axis=0).T))))
+    L = float(arc[-1])
     if not np.isfinite(L) or L <= 0:
         return None
 
     distances = np.linspace(0.0, L, n_samples, endpoint=False)
-    coords = [ring.interpolate(d) for d in distances]
-    return np.array([[p.x, p.y] for p in coords], dtype=float)
+    return np.column_stack((np.interp(distances, arc, coords[:, 0]), np.interp(distances, arc, coords[:, 1])))
 
 
 def _tri_area(p1, p2, p3) -> float:
@@ -770,6 +838,57 @@ def build_fire_event(
     return build_fire_event_daily(fired_daily=fired_daily, event_id=event_id, date_col=date_col)
 
 
+@dataclass
+class PreparedFireEvent:
+    """Date-parsed, time-sorted perimeters of a :class:`FireEventDaily`.
+
+    Built once by :func:`_prepare_event` and shared by
+    :func:`compute_time_hull_geometry` and :func:`sample_inside_outside`, so an
+    event's GeoDataFrame is parsed and sorted once. Reprojections and the
+    largest polygon of each perimeter are cached per CRS on first use.
+    """
+
+    event: FireEventDaily
+    date_col: str
+    gdf: gpd.GeoDataFrame
+    _by_crs: Dict[str, gpd.GeoDataFrame] = field(default_factory=dict, repr=False)
+    _polygons: Dict[Tuple[str, int], Tuple[Optional[Polygon], Any]] = field(default_factory=dict, repr=False)
+
+    def matches(self, event: FireEventDaily, date_col: str) -> bool:
+        return self.event is event and self.date_col == date_col
+
+    def to_crs(self, crs: str) -> gpd.GeoDataFrame:
+        gdf = self._by_crs.get(crs)
+        if gdf is None:
+            gdf = self.gdf if self.gdf.crs is not None else self.gdf.set_crs("EPSG:4326")
+            if gdf.crs.to_string().upper() != crs.upper():
+                gdf = gdf.to_crs(crs)
+            self._by_crs[crs] = gdf
+        return gdf
+
+    def polygon(self, crs: str, row: int) -> Tuple[Optional[Polygon], Any]:
+        """Return the largest polygon of perimeter ``row`` and its prepared form."""
+
+        key = (crs, row)
+        if key not in self._polygons:
+            poly = _largest_polygon(self.to_crs(crs).geometry.iloc[row])
+            if poly is not None and _shapely_prepare is not None:
+                # Lets the vectorized predicates reuse the GEOS prepared index.
+                _shapely_prepare(poly)
+            self._polygons[key] = (poly, prep(poly) if poly is not None else None)
+        return self._polygons[key]
+
+
+def _prepare_event(event: FireEventDaily, date_col: str = "date") -> PreparedFireEvent:
+    """Parse and sort ``event`` perimeters by date once (see :class:`PreparedFireEvent`)."""
+
+    eg = event.gdf.copy()
+    eg[date_col] = pd.to_datetime(eg[date_col], errors="coerce")
+    eg = eg.sort_values(date_col, kind="mergesort").reset_index(drop=True)
+    eg["date_norm"] = normalize_dates(eg[date_col])
+    return PreparedFireEvent(event=event, date_col=date_col, gdf=eg)
+
+
 def compute_time_hull_geometry(
     event: FireEventDaily,
     *,
@@ -780,6 +899,7 @@ def compute_time_hull_geometry(
     crs_epsg_xy: int = 5070,
     center_each_day: bool = True,
     verbose: bool = False,
+    prepared: PreparedFireEvent | None = None,
 ) -> TimeHull:
     """
     Build a 3-D time hull mesh from per-day fire perimeters.
@@ -806,6 +926,9 @@ def compute_time_hull_geometry(
         stacking into the hull grid.
     verbose
         If True, prints derived hull metrics for debugging.
+    prepared
+        Optional :class:`PreparedFireEvent` for ``event`` and ``date_col``
+        whose already sorted perimeters are reused.
 
     Returns
     -------
@@ -825,9 +948,9 @@ def compute_time_hull_geometry(
     >>> hull.metrics["surface_km_day"] > 0
     True
     """
-    eg = event.gdf.copy()
-    eg[date_col] = pd.to_datetime(eg[date_col], errors="coerce")
-    eg = eg.sort_values(date_col).reset_index(drop=True)
+    if prepared is None or not prepared.matches(event, date_col):
+        prepared = _prepare_event(event, date_col)
+    eg = prepared.gdf
 
     if z_col in eg.columns:
         Z = eg[z_col].to_numpy(float)
@@ -896,32 +1019,32 @@ def compute_time_hull_geometry(
         hull_volume_m2_days = 0.0
     hull_volume_km2_days = hull_volume_m2_days / 1e6
 
-    tris: list[tuple[int, int, int]] = []
-    surface = 0.0
-
-    for i in range(M - 1):
-        for j in range(T):
-            jn = (j + 1) % T
-
-            v1k = P_km[i, j]
-            v2k = P_km[i, jn]
-            v3k = P_km[i + 1, jn]
-            v4k = P_km[i + 1, j]
-
-            surface += _tri_area(v1k, v2k, v3k) + _tri_area(v1k, v3k, v4k)
-
-            idx_v1 = i * T + j
-            idx_v2 = i * T + jn
-            idx_v3 = (i + 1) * T + jn
-            idx_v4 = (i + 1) * T + j
-
-            tris.append((idx_v1, idx_v2, idx_v3))
-            tris.append((idx_v1, idx_v3, idx_v4))
-
+    # Quad (i, j) joins ring i to ring i + 1 between angles j and j + 1
+    # (wrapping), split into two triangles; built for all quads at once.
+    v1 = P_km[:-1]
+    v2 = np.roll(v1, -1, axis=1)
+    v4 = P_km[1:]
+    v3 = np.roll(v4, -1, axis=1)
+    surface = 0.5 * (
+        np.linalg.norm(np.cross(v2 - v1, v3 - v1), axis=-1).sum()
+        + np.linalg.norm(np.cross(v3 - v1, v4 - v1), axis=-1).sum()
+    )
     hull_surface_km_day = float(surface)
 
+    idx = np.arange(M * T).reshape(M, T)
+    idx_v1 = idx[:-1]
+    idx_v2 = np.roll(idx_v1, -1, axis=1)
+    idx_v4 = idx[1:]
+    idx_v3 = np.roll(idx_v4, -1, axis=1)
+    tris_arr = np.stack(
+        (
+            np.stack((idx_v1, idx_v2, idx_v3), axis=-1),
+            np.stack((idx_v1, idx_v3, idx_v4), axis=-1),
+        ),
+        axis=2,
+    ).reshape(-1, 3)
+
     verts_km = P_km.reshape(-1, 3)
-    tris_arr = np.asarray(tris, dtype=int)
 
     Z_grid = np.array(Z[:M], float)[:, None] * np.ones((1, T), float)
     t_days_vert = Z_grid.ravel()
@@ -958,7 +1081,10 @@ def sample_inside_outside(
     date_col: str = "date",
     fast: bool = False,
     verbose: bool = False,
+    prepared: PreparedFireEvent | None = None,
 ) -> HullClimateSummary:
+    if prepared is None or not prepared.matches(event, date_col):
+        prepared = _prepare_event(event, date_col)
     da = cube_da
     y_dim, x_dim = infer_spatial_dims(da)
     epsg = infer_epsg(da)
@@ -975,13 +1101,11 @@ def sample_inside_outside(
     dx = abs(dx)
 
     dates_clim = normalize_dates(da["time"].values)
-    event_gdf = event.gdf.copy()
-    event_gdf["date_norm"] = normalize_dates(event_gdf[date_col])
     cube_crs = f"EPSG:{epsg}"
-    if event_gdf.crs is None:
-        event_gdf = event_gdf.set_crs("EPSG:4326")
-    if event_gdf.crs.to_string().upper() != cube_crs.upper():
-        event_gdf = event_gdf.to_crs(cube_crs)
+    # Perimeters are sorted by date with NaT last, so the latest perimeter on
+    # or before a climate day is one searchsorted over the dated prefix.
+    dates_evt = prepared.gdf["date_norm"].to_numpy()
+    dates_evt = dates_evt[: int(prepared.gdf["date_norm"].notna().sum())]
 
     half_dx = dx / 2.0 if dx else 0.0
     half_dy = dy / 2.0 if dy else 0.0
@@ -989,7 +1113,11 @@ def sample_inside_outside(
     XX, YY = np.meshgrid(x_vals, y_vals)
     cell_polys = None
     use_polys = dx > 0 and dy > 0
-    if use_polys:
+    if use_polys and _shapely_box is not None:
+        # Built once as a (ny, nx) geometry array; each day is then classified
+        # by a single vectorized covers() call instead of a per-cell loop.
+        cell_polys = _shapely_box(XX - half_dx, YY - half_dy, XX + half_dx, YY + half_dy)
+    elif use_polys:
         cell_polys = [
             [
                 Polygon(
@@ -1005,26 +1133,43 @@ def sample_inside_outside(
             for yc in y_vals
         ]
 
-    values_inside: list[np.ndarray] = []
-    values_outside: list[np.ndarray] = []
-    per_day_mean: dict[pd.Timestamp, float] = {}
+    # fast=True burns each perimeter with GDAL's scanline rasterizer. The
+    # transform is anchored on the first pixel with signed steps so row/column
+    # order follows the cube even when y (or x) is descending.
+    rasterize = None
+    if fast:
+        try:
+            from affine import Affine
+            from rasterio.features import rasterize
+        except ImportError:
+            rasterize = None
+        else:
+            step_x = math.copysign(dx or 1.0, x_vals[-1] - x_vals[0]) if nx > 1 else (dx or 1.0)
+            step_y = math.copysign(dy or 1.0, y_vals[-1] - y_vals[0]) if ny > 1 else (dy or 1.0)
+            transform = Affine.translation(x_vals[0] - step_x / 2.0, y_vals[0] - step_y / 2.0) * Affine.scale(
+                step_x, step_y
+            )
 
-    for idx, t_val in enumerate(dates_clim):
-        eg_mask = event_gdf[event_gdf["date_norm"] <= t_val]
-        if eg_mask.empty:
-            continue
-        latest = eg_mask.sort_values("date_norm").iloc[-1]
-        poly = _largest_polygon(latest.geometry)
-        if poly is None:
-            continue
+    # Pixel centres for the point-in-polygon fallback, built on first use and
+    # shared by every day that needs it.
+    centers = None
 
-        if fast:
+    def _center_mask(poly, poly_prep) -> np.ndarray:
+        nonlocal centers
+        if centers is None:
+            if _shapely_points is not None:
+                centers = _shapely_points(XX, YY)
+            else:
+                centers = [Point(xc, yc) for xc, yc in zip(XX.ravel(), YY.ravel())]
+        if isinstance(centers, np.ndarray):
+            return _shapely_covers(poly, centers)
+        return np.array([poly_prep.covers(p) for p in centers]).reshape((ny, nx))
+
+    def _classify(poly, poly_prep) -> np.ndarray:
+        mask = None
+        if rasterize is not None:
             try:
-                import rasterio.features
-                from affine import Affine
-
-                transform = Affine.translation(x_vals.min() - dx / 2.0, y_vals.min() - dy / 2.0) * Affine.scale(dx or 1.0, dy or 1.0)
-                mask = rasterio.features.rasterize(
+                mask = rasterize(
                     [(poly, 1)],
                     out_shape=(ny, nx),
                     transform=transform,
@@ -1034,36 +1179,70 @@ def sample_inside_outside(
                 ).astype(bool)
             except Exception:
                 mask = None
-        else:
-            mask = None
 
         if mask is None:
-            poly_prep = prep(poly)
             if use_polys and cell_polys is not None:
-                mask = np.zeros((ny, nx), dtype=bool)
-                for iy in range(ny):
-                    for ix in range(nx):
-                        mask[iy, ix] = poly_prep.covers(cell_polys[iy][ix])
+                if isinstance(cell_polys, np.ndarray):
+                    mask = _shapely_covers(poly, cell_polys)
+                else:
+                    mask = np.zeros((ny, nx), dtype=bool)
+                    for iy in range(ny):
+                        for ix in range(nx):
+                            mask[iy, ix] = poly_prep.covers(cell_polys[iy][ix])
                 if not mask.any():
-                    pts = [Point(xc, yc) for xc, yc in zip(XX.ravel(), YY.ravel())]
-                    inside = np.array([poly_prep.covers(p) for p in pts])
-                    mask = inside.reshape((ny, nx))
+                    mask = _center_mask(poly, poly_prep)
             else:
-                pts = [Point(xc, yc) for xc, yc in zip(XX.ravel(), YY.ravel())]
-                inside = np.array([poly_prep.covers(p) for p in pts])
-                mask = inside.reshape((ny, nx))
+                mask = _center_mask(poly, poly_prep)
+        return mask
 
-        da_slice = da.isel(time=idx)
-        vals = da_slice.values
-        vals_inside = vals[mask]
-        vals_outside = vals[~mask]
+    # A day's mask only depends on which perimeter is current, so consecutive
+    # days sharing a perimeter (and every day after the last one) reuse it.
+    masks_by_row: dict[int, Optional[np.ndarray]] = {}
+    day_idx: list[int] = []
+    day_times: list[pd.Timestamp] = []
+    day_masks: list[np.ndarray] = []
 
-        per_day_mean[t_val] = float(np.nanmean(vals_inside)) if vals_inside.size else np.nan
-        values_inside.append(vals_inside.ravel())
-        values_outside.append(vals_outside.ravel())
+    for idx, t_val in enumerate(dates_clim):
+        if pd.isna(t_val):
+            continue
+        latest = int(np.searchsorted(dates_evt, np.datetime64(t_val, "ns"), side="right")) - 1
+        if latest < 0:
+            continue
+        if latest not in masks_by_row:
+            poly, poly_prep = prepared.polygon(cube_crs, latest)
+            masks_by_row[latest] = _classify(poly, poly_prep) if poly is not None else None
+        mask = masks_by_row[latest]
+        if mask is None:
+            continue
+        day_idx.append(idx)
+        day_times.append(t_val)
+        day_masks.append(mask)
 
-    values_inside_flat = np.concatenate(values_inside) if values_inside else np.array([])
-    values_outside_flat = np.concatenate(values_outside) if values_outside else np.array([])
+    values_inside: list[np.ndarray] = []
+    values_outside: list[np.ndarray] = []
+    per_day_mean: dict[pd.Timestamp, float] = {}
+
+    if day_idx:
+        # Every sampled day is read in a single request, so a dask-backed cube
+        # fetches its chunks in parallel on the threaded scheduler instead of
+        # computing one day at a time.
+        block = da.isel(time=day_idx).transpose("time", ...).values
+        for vals, t_val, mask in zip(block, day_times, day_masks):
+            vals_inside = vals[mask]
+            vals_outside = vals[~mask]
+
+            per_day_mean[t_val] = float(np.nanmean(vals_inside)) if vals_inside.size else np.nan
+            values_inside.append(vals_inside.ravel())
+            values_outside.append(vals_outside.ravel())
+
+    # Concatenate straight into float32 so the summary does not recast a
+    # float64 intermediate.
+    values_inside_flat = (
+        np.concatenate(values_inside, dtype=np.float32) if values_inside else np.empty(0, dtype=np.float32)
+    )
+    values_outside_flat = (
+        np.concatenate(values_outside, dtype=np.float32) if values_outside else np.empty(0, dtype=np.float32)
+    )
 
     return HullClimateSummary(
         values_inside=values_inside_flat,
@@ -1105,7 +1284,8 @@ def time_hull_to_vase(hull: TimeHull) -> Vase:
         metadata={
             "metrics": hull.metrics,
             "event_id": hull.event.event_id,
-            "t_days_vert": hull.t_days_vert,
+            # Stored as float64 once here so plot paths can use it directly.
+            "t_days_vert": np.asarray(hull.t_days_vert, dtype=np.float64),
             "t_norm_vert": hull.t_norm_vert,
         },
     )
@@ -1356,6 +1536,7 @@ def build_inside_outside_climate_samples(
     *,
     date_col: str = "date",
     verbose: bool = False,
+    prepared: PreparedFireEvent | None = None,
 ) -> HullClimateSummary:
     da = cube.da if hasattr(cube, "da") else cube
     time_vals = normalize_dates(da["time"].values)
@@ -1364,7 +1545,9 @@ def build_inside_outside_climate_samples(
         raise ValueError("Climate cube has no timesteps overlapping the fire time window.")
 
     da_evt = da.isel(time=np.where(mask_time)[0])
-    return sample_inside_outside(event, da_evt, date_col=date_col, fast=False, verbose=verbose)
+    return sample_inside_outside(
+        event, da_evt, date_col=date_col, fast=False, verbose=verbose, prepared=prepared
+    )
 
 
 def _infer_vertex_slice_index(hull: FireHull) -> tuple[np.ndarray, np.ndarray]:
@@ -1533,7 +1716,7 @@ def plot_climate_filled_hull(
             "percentiles": dict(
                 zip(
                     [str(p) for p in pct],
-                    np.nanpercentile(finite, pct).tolist() if finite.size else [float("nan")] * len(pct),
+                    np.percentile(finite, pct).tolist() if finite.size else [float("nan")] * len(pct),
                 )
             ),
             "approx_unique_count": int(np.unique(finite).size),
@@ -1577,8 +1760,7 @@ def plot_climate_filled_hull(
         finite = intensities[np.isfinite(intensities)]
         if color_limits is None and finite.size:
             # Display-only robust normalization to preserve visible scalar bands.
-            cmin = float(np.nanpercentile(finite, 2))
-            cmax = float(np.nanpercentile(finite, 98))
+            cmin, cmax = (float(q) for q in np.percentile(finite, [2, 98]))
             if not np.isfinite(cmin) or not np.isfinite(cmax) or cmax <= cmin:
                 cmin = float(np.nanmin(finite))
                 cmax = float(np.nanmax(finite))
@@ -1644,42 +1826,150 @@ def plot_climate_filled_hull(
     return fig
 
 
-def plot_inside_outside_hist(
+def _fill_vertex_intensities(
+    t_days_vert: np.ndarray, day_vals: np.ndarray, n_layers: int, out: np.ndarray
+) -> np.ndarray:
+    """Write ``day_vals`` of each vertex's day layer into ``out`` in one pass.
+
+    A vertex at ``t`` days maps to layer ``int(t - 1)`` clipped to
+    ``[0, n_layers - 1]``; layers past the end of ``day_vals`` repeat its last
+    value (edge padding). NaN times map to the first layer.
+    """
+
+    last = day_vals.shape[0] - 1
+    for i in range(t_days_vert.shape[0]):
+        t = t_days_vert[i] - 1.0
+        li = 0
+        if t >= n_layers - 1:
+            li = n_layers - 1
+        elif t > 0:
+            li = int(t)
+        if li > last:
+            li = last
+        out[i] = day_vals[li]
+    return out
+
+
+@functools.cache
+def _vertex_intensity_kernel():
+    """Return ``_fill_vertex_intensities`` compiled with numba, or ``None``.
+
+    Resolved on the first ``_vertex_layer_values`` call so importing this
+    module does not load numba.
+    """
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - numba is optional
+        return None
+    return numba.njit(cache=True)(_fill_vertex_intensities)
+
+
+# Shared read-only fallbacks for vases without metadata, so plot calls do not
+# allocate fresh empty containers.
+_EMPTY_DAYS = np.empty(0, dtype=np.float64)
+_EMPTY_DAYS.setflags(write=False)
+_EMPTY_META = MappingProxyType({})
+
+
+def _vertex_layer_values(t_days_vert: np.ndarray, day_vals: np.ndarray, n_layers: int) -> np.ndarray:
+    """Return the per-day value for each hull vertex (see ``_fill_vertex_intensities``)."""
+
+    t_days_vert = np.ascontiguousarray(t_days_vert, dtype=float).ravel()
+    day_vals = np.ascontiguousarray(day_vals, dtype=float)
+    kernel = _vertex_intensity_kernel()
+    if kernel is not None:
+        return kernel(t_days_vert, day_vals, n_layers, np.empty_like(t_days_vert))
+    # One float temporary clipped in place (the day_vals edge folds into the
+    # upper bound), then int32 indices: day counts never need 64 bits.
+    shifted = np.subtract(t_days_vert, 1.0)
+    np.clip(shifted, 0, min(n_layers, day_vals.size) - 1, out=shifted)
+    np.nan_to_num(shifted, copy=False, nan=0.0)
+    return day_vals[shifted.astype(np.int32)]
+
+
+def _finite_1d(values: Any) -> np.ndarray:
+    """Return ``values`` flattened with NaN/inf dropped, keeping float32 as is."""
+
+    arr = np.asarray(values).ravel()
+    if arr.dtype.kind not in "fc":
+        arr = arr.astype(float)
+    return arr[np.isfinite(arr)]
+
+
+def _has_finite_samples(summary: HullClimateSummary) -> bool:
+    """Return True if either inside or outside sample holds a finite value."""
+
+    return any(
+        np.isfinite(np.asarray(values)).any()
+        for values in (summary.values_inside, summary.values_outside)
+    )
+
+
+def _shared_hist_bins(bins: Any, *arrays: np.ndarray) -> Any:
+    """Return one set of bin edges covering all non-empty ``arrays``.
+
+    Integer ``bins`` only need the joint min/max; other specs (``"auto"``,
+    explicit edges) go through ``np.histogram_bin_edges`` on the joined data.
+    ``bins`` is returned unchanged when there is no finite spread to bin.
+    """
+
+    arrays = tuple(arr for arr in arrays if arr.size)
+    if not arrays:
+        return bins
+    lo = min(float(arr.min()) for arr in arrays)
+    hi = max(float(arr.max()) for arr in arrays)
+    if not hi > lo:
+        return bins
+    if isinstance(bins, (int, np.integer)):
+        return np.linspace(lo, hi, int(bins) + 1)
+    return np.histogram_bin_edges(np.concatenate(arrays), bins=bins, range=(lo, hi))
+
+
+def _inside_outside_hist_on_ax(
+    ax,
     summary: HullClimateSummary,
     *,
     bins: int = 40,
     var_label: str = "value",
-):
-    import matplotlib.pyplot as plt
+) -> None:
+    """Draw the inside/outside density histograms for ``summary`` onto ``ax``."""
 
-    inside = np.asarray(summary.values_inside).ravel()
-    outside = np.asarray(summary.values_outside).ravel()
+    inside = _finite_1d(summary.values_inside)
+    outside = _finite_1d(summary.values_outside)
+    # Shared edges keep inside/outside comparable and spare matplotlib a
+    # separate edge computation per array.
+    bins = _shared_hist_bins(bins, inside, outside)
 
-    plt.figure(figsize=(5, 3))
+    # One np.histogram pass per sample; stairs draws the precomputed
+    # densities without matplotlib re-binning the data.
     if inside.size:
-        plt.hist(
-            inside,
-            bins=bins,
-            alpha=0.6,
-            density=True,
-            label="inside",
-            histtype="stepfilled",
-        )
+        density, edges = np.histogram(inside, bins=bins, density=True)
+        ax.stairs(density, edges, fill=True, alpha=0.6, label="inside")
     if outside.size:
-        plt.hist(
-            outside,
-            bins=bins,
-            alpha=0.6,
-            density=True,
-            label="outside",
-            histtype="step",
-        )
+        density, edges = np.histogram(outside, bins=bins, density=True)
+        ax.stairs(density, edges, alpha=0.6, label="outside")
+
+    ax.set_xlabel(var_label)
+    ax.set_ylabel("Density")
+    ax.set_title(f"{var_label}: inside vs outside fire perimeters")
+    ax.legend()
+
+
+def plot_inside_outside_hist(
+    summary: HullClimateSummary,
+    *,
+    bins: int = 40,
+    var_label: str = "value",
+):
+    if not _has_finite_samples(summary):
+        warnings.warn("climate_hist: no finite values inside or outside; skipping plot.")
+        return
 
-    plt.xlabel(var_label)
-    plt.ylabel("Density")
-    plt.title(f"{var_label}: inside vs outside fire perimeters")
-    plt.legend()
-    plt.tight_layout()
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(5, 3), constrained_layout=True)
+    _inside_outside_hist_on_ax(fig.add_subplot(111), summary, bins=bins, var_label=var_label)
     plt.show()
 
 
@@ -1709,6 +1999,25 @@ def _hull_grid(hull: TimeHull) -> tuple[np.ndarray, int, int]:
     return P, days, T
 
 
+_DERIVATIVE_FIELD_NAMES = {1: "speed_km_per_day", 2: "accel_km_per_day2"}
+
+
+def _derivative_field(xy: np.ndarray, order: int) -> np.ndarray:
+    """
+    Perimeter speed (order 1, km/day) or acceleration (order 2, km/day²)
+    on the (M, T) hull grid from vertex positions ``xy`` of shape (M, T, 2).
+
+    Central differences along time; the speed magnitude is taken per
+    component with ``np.hypot`` so no (M, T, 2) norm temporary is built.
+    """
+    dx_dt = np.gradient(xy[..., 0], axis=0)
+    dy_dt = np.gradient(xy[..., 1], axis=0)
+    speed = np.hypot(dx_dt, dy_dt, out=dx_dt)  # (M, T), km/day
+    if order == 1:
+        return speed
+    return np.gradient(speed, axis=0)
+
+
 def compute_derivative_hull(
     hull: TimeHull,
     *,
@@ -1733,7 +2042,8 @@ def compute_derivative_hull(
     TimeHull
         A new hull with the same topology (tris) and time coordinates,
         but with radius at each (day, theta) proportional to speed or
-        acceleration, respectively.
+        acceleration, respectively. The signed field itself is kept on
+        ``vertex_field`` for plot_derivative_hull.
     """
     if order not in (1, 2):
         raise ValueError("order must be 1 or 2")
@@ -1741,32 +2051,20 @@ def compute_derivative_hull(
     P, M, T = _hull_grid(hull)      # (M, T, 3)
     xy = P[..., :2]                 # (M, T, 2), km coordinates
 
-    # First derivative of perimeter position in time: km/day
-    dxy_dt = np.gradient(xy, axis=0)  # central differences along time axis
-    speed = np.linalg.norm(dxy_dt, axis=-1)  # (M, T), km/day
-
-    if order == 1:
-        field = speed
-        field_name = "speed_km_per_day"
-    else:
-        # Second derivative of spread speed: km/day²
-        accel = np.gradient(speed, axis=0)
-        field = accel
-        field_name = "accel_km_per_day2"
-
-    # Use derivative magnitude as new radius, preserving angular direction
-    r_orig = np.linalg.norm(xy, axis=-1)  # (M, T)
-    U = np.zeros_like(xy)                 # unit directions (M, T, 2)
-
-    mask = r_orig > eps
-    U[mask] = xy[mask] / r_orig[mask][..., None]
-    U[~mask] = np.array([1.0, 0.0])  # arbitrary direction for degenerate centers
+    field = _derivative_field(xy, order)
+    field_name = _DERIVATIVE_FIELD_NAMES[order]
 
+    # Use derivative magnitude as new radius, preserving angular direction.
+    # Degenerate centers (r <= eps) get the arbitrary direction (1, 0).
+    r_orig = np.hypot(xy[..., 0], xy[..., 1])  # (M, T)
+    nondegenerate = r_orig > eps
     R_new = np.abs(field)  # radius encodes magnitude of derivative field
+    scale = np.divide(R_new, r_orig, out=np.zeros_like(R_new), where=nondegenerate)
 
-    P_new = np.zeros_like(P)
-    P_new[..., :2] = R_new[..., None] * U
-    P_new[..., 2]  = P[..., 2]  # keep same time (days)
+    P_new = np.empty_like(P)
+    np.multiply(xy, scale[..., None], out=P_new[..., :2])
+    P_new[..., 0][~nondegenerate] = R_new[~nondegenerate]
+    P_new[..., 2] = P[..., 2]  # keep same time (days)
 
     verts_new = P_new.reshape(-1, 3)
 
@@ -1786,6 +2084,7 @@ def compute_derivative_hull(
         t_days_vert=hull.t_days_vert,
         t_norm_vert=hull.t_norm_vert,
         metrics=HullMetrics(metrics),
+        vertex_field=field.ravel(),
     )
 
 
@@ -1800,34 +2099,31 @@ def plot_derivative_hull(
     Plot a derivative hull with color and radius encoding the same
     derivative quantity (speed or acceleration).
 
-    base_hull is used to recompute the underlying derivative field
-    (speed or acceleration) so that intensity and geometry agree.
+    The derivative field stored on deriv_hull by compute_derivative_hull
+    colours the mesh, so intensity and geometry agree without recomputing
+    it. base_hull is only differenced again when deriv_hull carries no
+    field for this order.
     """
-    P, M, T = _hull_grid(base_hull)
-    xy = P[..., :2]
-
-    # First derivative: km/day
-    dxy_dt = np.gradient(xy, axis=0)
-    speed = np.linalg.norm(dxy_dt, axis=-1)  # (M, T)
-
+    field = deriv_hull.vertex_field
+    if field is None or deriv_hull.metrics.get("field_name") != _DERIVATIVE_FIELD_NAMES.get(order):
+        P, M, T = _hull_grid(base_hull)
+        field = _derivative_field(P[..., :2], order)
     if order == 1:
-        field = speed
         var_label = "Perimeter speed (km/day)"
     else:
-        accel = np.gradient(speed, axis=0)
-        field = accel
         var_label = "Perimeter acceleration (km/day²)"
 
     intensities = np.abs(field).ravel()
+    finite = intensities[np.isfinite(intensities)]
 
     verts = deriv_hull.verts_km
     tris  = deriv_hull.tris
     x, y, z = verts[:, 0], verts[:, 1], verts[:, 2]
     i, j, k = tris.T
 
-    if np.isfinite(intensities).any():
-        vmin = float(np.nanpercentile(intensities, 5))
-        vmax = float(np.nanpercentile(intensities, 95))
+    if finite.size:
+        # One partition-based pass for both limits on NaN-free values.
+        vmin, vmax = (float(q) for q in np.percentile(finite, [5, 95]))
     else:
         vmin, vmax = 0.0, 1.0
 
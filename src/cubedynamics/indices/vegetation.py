@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import xarray as xr
 
 from ..config import BAND_DIM
@@ -17,6 +18,36 @@ def _get_band_dataarray(s2: xr.Dataset | xr.DataArray) -> xr.DataArray:
     raise ValueError("Unable to determine data variable containing Sentinel-2 bands.")
 
 
+def _ndvi_kernel(nir: np.ndarray, red: np.ndarray, eps: float = 0.0) -> np.ndarray:
+    """Return float32 ``(nir - red) / (nir + red + eps)`` for one block.
+
+    The numerator buffer is reused for the quotient so each block allocates
+    only two float32 temporaries instead of a float64 array per operation.
+    """
+
+    nir = np.asarray(nir, dtype=np.float32)
+    red = np.asarray(red, dtype=np.float32)
+    num = np.subtract(nir, red)
+    den = np.add(nir, red)
+    if eps:
+        den += np.float32(eps)
+    return np.divide(num, den, out=num)
+
+
+def ndvi_ufunc(nir: xr.DataArray, red: xr.DataArray, eps: float = 0.0) -> xr.DataArray:
+    """Apply :func:`_ndvi_kernel` blockwise, staying lazy for dask inputs."""
+
+    return xr.apply_ufunc(
+        _ndvi_kernel,
+        nir,
+        red,
+        kwargs={"eps": eps},
+        dask="parallelized",
+        output_dtypes=[np.float32],
+        keep_attrs=False,
+    )
+
+
 def compute_ndvi_from_s2(
     s2: xr.Dataset | xr.DataArray,
     band_nir: str = "B08",
@@ -28,8 +59,7 @@ def compute_ndvi_from_s2(
     arr = _get_band_dataarray(s2)
     nir = arr.sel({BAND_DIM: band_nir})
     red = arr.sel({BAND_DIM: band_red})
-    ndvi = (nir - red) / (nir + red + eps)
-    ndvi = ndvi.astype("float32")
+    ndvi = ndvi_ufunc(nir, red, eps=eps)
     ndvi.name = "ndvi"
     ndvi.attrs = {
         "long_name": "Normalized Difference Vegetation Index",
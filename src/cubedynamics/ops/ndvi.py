@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import xarray as xr
 
+from ..indices.vegetation import ndvi_ufunc
+
 
 def ndvi_from_s2(nir_band: str = "B08", red_band: str = "B04"):
     """Factory returning a Sentinel-2 NDVI transform for pipe chains."""
@@ -15,8 +17,7 @@ def ndvi_from_s2(nir_band: str = "B08", red_band: str = "B04"):
         nir = s2.sel(band=nir_band)
         red = s2.sel(band=red_band)
 
-        ndvi = (nir - red) / (nir + red)
-        ndvi = ndvi.rename("ndvi").astype("float32")
+        ndvi = ndvi_ufunc(nir, red).rename("ndvi")
         ndvi.attrs.update(
             {
                 "long_name": "Normalized Difference Vegetation Index",
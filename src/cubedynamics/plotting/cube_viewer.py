@@ -28,7 +28,7 @@ from cubedynamics.utils import _infer_time_y_x_dims
 from cubedynamics.utils.drift_centering import drift_centering_script
 from cubedynamics.plotting.progress import _CubeProgress
 from cubedynamics.plotting.viewer import show_cube_viewer
-from cubedynamics.vase import VasePanel
+from cubedynamics.vase import VasePanel, VasePanels
 
 # Cube viewer pipeline:
 # - :func:`cube_from_dataarray` prepares PNG faces and metadata.
@@ -207,7 +207,7 @@ def _render_cube_html(
     top: str,
     bottom: str,
     interior_planes: list[tuple[str, int, str, Dict[str, int]]] | None,
-    vase_panels: list[VasePanel] | None = None,
+    vase_panels: VasePanels | list[VasePanel] | None = None,
     theme: Dict[str, str],
     coord: "CoordCube" | None,
     legend_html: str,
@@ -986,10 +986,9 @@ def cube_from_dataarray(
     if fill_limits is not None:
         vmin, vmax = fill_limits
     else:
-        mask = np.isfinite(all_vals)
-        if mask.any():
-            vmin = float(np.nanpercentile(all_vals[mask], 2))
-            vmax = float(np.nanpercentile(all_vals[mask], 98))
+        finite = all_vals[np.isfinite(all_vals)]
+        if finite.size:
+            vmin, vmax = (float(q) for q in np.percentile(finite, [2, 98]))
         else:
             vmin, vmax = -1.0, 1.0
 
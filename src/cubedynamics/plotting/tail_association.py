@@ -4,14 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import xarray as xr
 
 from ..stats.tails import _rank_1d
 
+if TYPE_CHECKING:  # pragma: no cover - pyplot is imported lazily at plot time
+    import matplotlib.pyplot as plt
+
 PreprocessMode = Optional[Union[str, Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]]]
 Selector = Optional[Union[Mapping[str, object], Sequence[int]]]
 
@@ -319,6 +321,8 @@ def plot_tail_association_triptych(
     upper-tail partial Spearman correlations.
     """
 
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(1, 3, figsize=(12.0, 3.7), constrained_layout=False)
     fig.subplots_adjust(left=0.07, right=0.985, bottom=0.16, top=0.78, wspace=0.32)
     _plot_tail_association_row(
@@ -353,6 +357,8 @@ def plot_tail_association_grid(
 ) -> plt.Figure:
     """Plot a publication-style 2x3 grid for multiple paired series."""
 
+    import matplotlib.pyplot as plt
+
     pair_list = list(pairs)
     if not pair_list:
         raise ValueError("pairs must contain at least one (x, y) pair")
@@ -6,9 +6,10 @@ import errno
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from IPython.display import IFrame
+if TYPE_CHECKING:  # pragma: no cover - IPython is imported lazily when displaying
+    from IPython.display import IFrame
 
 
 def _write_cube_html(html: str, prefix: str = "cube_viewer") -> str:
@@ -38,6 +39,8 @@ def show_cube_viewer(html: str, *, width: int = 850, height: int = 850, prefix:
 
     html_prefix = prefix or "cube_viewer"
     path = _write_cube_html(html, prefix=html_prefix)
+    from IPython.display import IFrame
+
     iframe = IFrame(path, width=width, height=height)
     iframe.cube_viewer_path = path  # type: ignore[attr-defined]
     return iframe
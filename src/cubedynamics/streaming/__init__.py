@@ -1,12 +1,13 @@
 """Streaming data helpers for CubeDynamics."""
 from .global_climate import stream_global_climate_cube
 from .gridmet import stream_gridmet_to_cube
-from .virtual import VirtualCube, make_spatial_tiler, make_time_tiler
+from .virtual import VirtualCube, make_spatial_tiler, make_time_tiler, no_spatial_tiler
 
 __all__ = [
     "VirtualCube",
     "make_spatial_tiler",
     "make_time_tiler",
+    "no_spatial_tiler",
     "stream_global_climate_cube",
     "stream_gridmet_to_cube",
 ]
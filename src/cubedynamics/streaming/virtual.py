@@ -8,14 +8,24 @@ demand.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, Mapping, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import xarray as xr
 
 
+def no_spatial_tiler(kwargs: Mapping[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Spatial tiler that yields a single empty spec (no spatial tiling).
+
+    :class:`VirtualCube` recognizes this function by identity and skips the
+    spatial tiling machinery entirely, so prefer it over ad-hoc no-op lambdas.
+    """
+
+    yield {}
+
+
 @dataclass
 class VirtualCube:
     """Representation of a lazily tiled cube.
@@ -63,6 +73,8 @@ class VirtualCube:
     loader_kwargs: Dict[str, Any]
     time_tiler: Callable[[Dict[str, Any]], Iterable[Dict[str, Any]]]
     spatial_tiler: Callable[[Dict[str, Any]], Iterable[Dict[str, Any]]]
+    _materialized: Optional[xr.DataArray] = field(default=None, init=False, repr=False, compare=False)
+    _extra_attrs: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def iter_time_tiles(self) -> Iterable[xr.DataArray]:
         """Iterate over time-tiled cubes (full spatial AOI per tile)."""
@@ -74,6 +86,10 @@ class VirtualCube:
     def iter_spatial_tiles(self) -> Iterable[xr.DataArray]:
         """Iterate over cubes tiled in space (full time range per tile)."""
 
+        if self.spatial_tiler is no_spatial_tiler:
+            yield self.loader(**self.loader_kwargs)
+            return
+
         for s_kwargs in self.spatial_tiler(self.loader_kwargs):
             kwargs = {**self.loader_kwargs, **s_kwargs}
             yield self.loader(**kwargs)
@@ -82,10 +98,15 @@ class VirtualCube:
         """Iterate over time × space tiles produced by both tilers."""
 
         time_specs = list(self.time_tiler(self.loader_kwargs))
-        space_specs = list(self.spatial_tiler(self.loader_kwargs))
-
         if not time_specs:
             time_specs = [{}]
+
+        if self.spatial_tiler is no_spatial_tiler:
+            for t_kwargs in time_specs:
+                yield self.loader(**{**self.loader_kwargs, **t_kwargs})
+            return
+
+        space_specs = list(self.spatial_tiler(self.loader_kwargs))
         if not space_specs:
             space_specs = [{}]
 
@@ -94,9 +115,51 @@ class VirtualCube:
                 kwargs = {**self.loader_kwargs, **t_kwargs, **s_kwargs}
                 yield self.loader(**kwargs)
 
-    def materialize(self) -> xr.DataArray:
-        """Materialize the virtual cube as a single :class:`xarray.DataArray`."""
+    def materialize(self, cache: bool = False) -> xr.DataArray:
+        """Materialize the virtual cube as a single :class:`xarray.DataArray`.
+
+        With ``cache=True`` the result is kept on the cube and returned by later
+        cached calls, so a chain of verbs loads the tiles only once. Call
+        :meth:`invalidate_cache` if the underlying store changes. Attrs added
+        with :meth:`with_attrs` are applied to every materialization.
+        """
+
+        if cache and self._materialized is not None:
+            return self._materialized
+        combined = self._combine_tiles()
+        if self._extra_attrs:
+            combined.attrs = {**combined.attrs, **self._extra_attrs}
+        if cache:
+            self._materialized = combined
+        return combined
+
+    def with_attrs(self, attrs: Mapping[str, Any]) -> "VirtualCube":
+        """Return a copy of this cube whose materializations carry ``attrs``.
+
+        The copy shares the loader, tilers and (shallowly) the cached data of
+        this cube, so no tiles are reloaded and this cube's attrs are left
+        untouched. The attrs are kept on the copy itself, so they survive
+        :meth:`invalidate_cache` and uncached ``materialize`` calls.
+        """
+
+        base = self.materialize(cache=True)
+        cube = replace(self)
+        cube._extra_attrs = {**self._extra_attrs, **attrs}
+        annotated = base.copy(deep=False)
+        annotated.attrs = {**base.attrs, **cube._extra_attrs}
+        cube._materialized = annotated
+        return cube
+
+    def invalidate_cache(self) -> None:
+        """Drop the DataArray kept by ``materialize(cache=True)``.
+
+        Attrs added with :meth:`with_attrs` are kept and reapplied on the next
+        materialization.
+        """
+
+        self._materialized = None
 
+    def _combine_tiles(self) -> xr.DataArray:
         tiles = list(self.iter_tiles())
         if not tiles:
             raise ValueError("VirtualCube has no tiles to materialize")
@@ -204,4 +267,5 @@ __all__ = [
     "VirtualCube",
     "make_spatial_tiler",
     "make_time_tiler",
+    "no_spatial_tiler",
 ]
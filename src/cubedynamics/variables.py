@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import datetime
+from functools import partial
+from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence, Literal
 import warnings
 
+import numpy as np
 import pandas as pd
 import xarray as xr
 
@@ -17,11 +20,9 @@ from cubedynamics.streaming import (
     VirtualCube,
     make_spatial_tiler,
     make_time_tiler,
+    no_spatial_tiler,
 )
-from cubedynamics.sentinel import (
-    load_sentinel2_ndvi_cube,
-    load_sentinel2_ndvi_zscore_cube,
-)
+from cubedynamics.sentinel import load_sentinel2_ndvi_cube
 
 
 TEMP_SOURCES: dict[str, dict[str, str]] = {
@@ -66,8 +67,9 @@ def estimate_cube_size(
 
     area = 1.0
     if bbox is not None:
-        xmin, ymin, xmax, ymax = bbox
-        area = max((xmax - xmin) * (ymax - ymin), 1.0)
+        area = (float(bbox[2]) - float(bbox[0])) * (float(bbox[3]) - float(bbox[1]))
+        if area < 1.0:
+            area = 1.0
     elif aoi_geojson is not None:
         # Without geometry computation fall back to a conservative factor.
         area = 2.0
@@ -81,6 +83,28 @@ def estimate_cube_size(
     return float(area * days)
 
 
+def _default_chunks(
+    lat: Optional[float],
+    lon: Optional[float],
+    bbox: Optional[Sequence[float]],
+    aoi_geojson: Optional[Mapping[str, Any]],
+    start: Any,
+    end: Any,
+    source: str,
+) -> dict[str, int] | None:
+    """Return a dask chunk mapping sized to the requested cube.
+
+    Small requests return ``None`` so the provider loader keeps its own
+    defaults. Requests above :data:`STREAMING_SIZE_THRESHOLD` get yearly time
+    chunks so slicing a few time steps does not read the whole time axis.
+    """
+
+    size_estimate = estimate_cube_size(lat, lon, bbox, aoi_geojson, start, end, source)
+    if size_estimate <= STREAMING_SIZE_THRESHOLD:
+        return None
+    return {"time": 365, "y": 256, "x": 256}
+
+
 def _resolve_temp_variable(source: str, kind: str) -> str:
     if source not in TEMP_SOURCES:
         raise ValueError(f"Unsupported temperature source '{source}'. Expected one of {sorted(TEMP_SOURCES)}")
@@ -105,6 +129,9 @@ def _load_temperature(
     **kwargs: Any,
 ) -> xr.DataArray:
     var_name = _resolve_temp_variable(source, kind)
+    chunks = kwargs.pop("chunks", None)
+    if chunks is None:
+        chunks = _default_chunks(lat, lon, bbox, aoi_geojson, start, end, source)
     if source == "gridmet":
         ds = load_gridmet_cube(
             variable=var_name,
@@ -114,6 +141,7 @@ def _load_temperature(
             aoi_geojson=aoi_geojson,
             start=start,
             end=end,
+            chunks=chunks,
             **kwargs,
         )
     else:
@@ -125,17 +153,17 @@ def _load_temperature(
             aoi_geojson=aoi_geojson,
             start=start,
             end=end,
+            chunks=chunks,
             **kwargs,
         )
 
-    if isinstance(ds, xr.DataArray):
-        da = ds
-    else:
-        da = ds[var_name]
-        da = da.copy()
-    da.attrs.setdefault("variable", var_name)
-    da.attrs.setdefault("source", source)
-    return da
+    da = ds if isinstance(ds, xr.DataArray) else ds[var_name]
+    # ``assign_attrs`` returns a shallow copy sharing the underlying data, so
+    # tagging metadata never copies (or computes) the array itself.
+    return da.assign_attrs(
+        variable=da.attrs.get("variable", var_name),
+        source=da.attrs.get("source", source),
+    )
 
 
 def temperature(
@@ -165,8 +193,7 @@ def temperature(
     size_estimate = estimate_cube_size(lat, lon, bbox, aoi_geojson, start, end, source)
     threshold = streaming_threshold if streaming_threshold is not None else STREAMING_SIZE_THRESHOLD
 
-    def base_loader(**loader_kwargs: Any) -> xr.DataArray:
-        return _load_temperature(kind="mean", **loader_kwargs)
+    base_loader = partial(_load_temperature, kind="mean")
 
     loader_kwargs: dict[str, Any] = {
         "lat": lat,
@@ -184,7 +211,7 @@ def temperature(
 
     time_tiler = make_time_tiler(start, end, freq=time_chunk)
     if spatial_tile is None or bbox is None:
-        spatial_tiler = lambda kw: ({} for _ in [None])  # type: ignore[misc]
+        spatial_tiler = no_spatial_tiler
     else:
         spatial_tiler = make_spatial_tiler(bbox, dlon=spatial_tile, dlat=spatial_tile)
 
@@ -260,6 +287,13 @@ def temperature_max(
     )
 
 
+_TEMPERATURE_LOADERS = {
+    "mean": temperature,
+    "min": temperature_min,
+    "max": temperature_max,
+}
+
+
 def temperature_anomaly(
     *,
     lat: Optional[float] = None,
@@ -273,86 +307,119 @@ def temperature_anomaly(
     baseline: Optional[xr.DataArray] = None,
     baseline_start: Any = None,
     baseline_end: Any = None,
+    groupby: Optional[str] = None,
     **kwargs: Any,
 ) -> xr.DataArray:
     """
     Compute a temperature anomaly cube along the time dimension.
 
-    Uses the semantic temperature loaders and ``verbs.anomaly``.
+    Uses the semantic temperature loaders and ``verbs.anomaly``. Pass
+    ``groupby`` (e.g. ``"time.month"`` or ``"time.dayofyear"``) to subtract a
+    per-group climatology of the baseline instead of a single baseline mean.
     """
 
-    if kind == "mean":
-        temp_cube = temperature(
-            lat=lat,
-            lon=lon,
-            bbox=bbox,
-            aoi_geojson=aoi_geojson,
-            start=start,
-            end=end,
-            source=source,
-            **kwargs,
-        )
-    elif kind == "min":
-        temp_cube = temperature_min(
-            lat=lat,
-            lon=lon,
-            bbox=bbox,
-            aoi_geojson=aoi_geojson,
-            start=start,
-            end=end,
-            source=source,
-            **kwargs,
-        )
-    elif kind == "max":
-        temp_cube = temperature_max(
-            lat=lat,
-            lon=lon,
-            bbox=bbox,
-            aoi_geojson=aoi_geojson,
-            start=start,
-            end=end,
-            source=source,
-            **kwargs,
+    try:
+        loader = _TEMPERATURE_LOADERS[kind]
+    except KeyError:
+        raise ValueError("Unsupported temperature anomaly kind: {0}".format(kind)) from None
+
+    load = partial(loader, lat=lat, lon=lon, bbox=bbox, aoi_geojson=aoi_geojson, source=source)
+
+    if baseline is None and baseline_start is None and baseline_end is None and groupby is None:
+        temp_cube = load(start=start, end=end, **kwargs)
+        return (pipe(temp_cube) | v.anomaly(dim="time")).unwrap()
+
+    fetch_start, fetch_end = start, end
+    if baseline is None:
+        # Fetch the union of the requested and baseline windows once, so a
+        # baseline reaching outside (start, end) is not silently truncated.
+        fetch_start = _time_bound(min, start, baseline_start)
+        fetch_end = _time_bound(max, end, baseline_end)
+    full = load(start=fetch_start, end=fetch_end, **kwargs)
+    same_window = fetch_start is start and fetch_end is end
+
+    if baseline is None and isinstance(full, VirtualCube):
+        # Push the baseline window down into a separate, narrower request
+        # instead of materializing the whole streamed cube just to slice it.
+        temp_cube = full if same_window else load(start=start, end=end, **kwargs)
+        baseline_data = load(
+            start=start if baseline_start is None else baseline_start,
+            end=end if baseline_end is None else baseline_end,
+            **{**kwargs, "streaming_strategy": "materialize"},
         )
     else:
-        raise ValueError("Unsupported temperature anomaly kind: {0}".format(kind))
+        temp_cube = full if same_window else full.sel(time=slice(start, end))
+        baseline_data = baseline if baseline is not None else full
+        if baseline_start is not None or baseline_end is not None:
+            baseline_data = baseline_data.sel(time=slice(baseline_start, baseline_end))
+
+    # Subtracting relies on xarray's broadcasting by dim name, so the baseline
+    # mean is never expanded to the full cube shape.
+    if groupby is None:
+        reference = baseline_data.mean(dim="time", skipna=True, keep_attrs=True)
+    else:
+        reference = baseline_data.groupby(groupby).mean(dim="time", skipna=True, keep_attrs=True)
+    if isinstance(temp_cube, VirtualCube):
+        return _subtract_virtual(temp_cube, reference, groupby)
+    return _subtract_reference(temp_cube, reference, groupby)
 
-    if baseline is None and baseline_start is None and baseline_end is None:
-        return (pipe(temp_cube) | v.anomaly(dim="time")).unwrap()
 
-    baseline_data: xr.DataArray = baseline if baseline is not None else temp_cube
-    if baseline_start is not None or baseline_end is not None:
-        baseline_data = baseline_data.sel(time=slice(baseline_start, baseline_end))
+def _subtract_reference(cube: xr.DataArray, reference: xr.DataArray, groupby: Optional[str]) -> xr.DataArray:
+    """Subtract a baseline mean, or a climatology grouped by ``groupby``.
 
-    baseline_mean = baseline_data.mean(dim="time", skipna=True, keep_attrs=True)
-    baseline_mean = baseline_mean.broadcast_like(temp_cube)
-    return temp_cube - baseline_mean
+    The climatology is expanded along ``time`` with one vectorized ``sel`` on
+    the group labels rather than a Python loop over groups.
+    """
 
+    if groupby is not None:
+        label = groupby.split(".")[-1]
+        reference = reference.sel({label: getattr(cube["time"].dt, label)}).drop_vars(label)
+    return cube - reference
 
-def _year_chunks(start: str, end: str, years_per_chunk: int = 1):
+
+def _time_bound(pick, bound: Any, baseline_bound: Any) -> Any:
+    """Return whichever of two window bounds ``pick`` (min/max) selects.
+
+    A missing baseline bound defers to the requested one, and a missing
+    requested bound stays open so the loader applies its own default.
     """
-    Yield (start_str, end_str) for consecutive chunks of up to years_per_chunk.
+
+    if bound is None or baseline_bound is None:
+        return bound
+    return pick((bound, baseline_bound), key=pd.Timestamp)
+
+
+def _subtract_virtual(vc: VirtualCube, other: xr.DataArray, groupby: Optional[str] = None) -> xr.DataArray:
+    """Subtract ``other`` from each tile of ``vc`` and combine the results."""
+
+    tiles = [_subtract_reference(tile, other, groupby) for tile in vc.iter_tiles()]
+    if not tiles:
+        raise ValueError("VirtualCube produced no tiles during anomaly computation")
+    combined = xr.combine_by_coords(tiles)
+    if isinstance(combined, xr.Dataset) and len(combined.data_vars) == 1:
+        return combined[next(iter(combined.data_vars))]
+    return combined
+
+
+def _year_chunks(start: str, end: str, years_per_chunk: int = 1) -> list[tuple[str, str]]:
+    """
+    Return (start_str, end_str) pairs for consecutive chunks of up to years_per_chunk.
     Both start and end are 'YYYY-MM-DD' strings.
 
-    The last chunk is clamped so it never extends beyond the requested `end`.
+    Chunk boundaries fall on January 1st; the first chunk is clamped to the
+    requested `start` and the last chunk never extends beyond `end`.
     """
-    start_dt = datetime.fromisoformat(start).date()
-    end_dt = datetime.fromisoformat(end).date()
+    start_dt = pd.Timestamp(datetime.fromisoformat(start).date())
+    end_dt = pd.Timestamp(datetime.fromisoformat(end).date())
+    if start_dt > end_dt:
+        return []
 
-    # Start at the beginning of the start year, but clamp to requested start.
-    current = date(start_dt.year, 1, 1)
-    if start_dt > current:
-        current = start_dt
+    step = pd.DateOffset(years=years_per_chunk)
+    starts = pd.date_range(start=f"{start_dt.year}-01-01", end=end_dt, freq=step)
+    ends = (starts + step - pd.Timedelta(days=1)).where(starts + step <= end_dt, end_dt)
+    starts = starts.where(starts >= start_dt, start_dt)
 
-    while current <= end_dt:
-        chunk_end_year = current.year + years_per_chunk - 1
-        chunk_end = date(chunk_end_year, 12, 31)
-        if chunk_end > end_dt:
-            chunk_end = end_dt
-        chunk_start = max(current, start_dt)
-        yield chunk_start.isoformat(), chunk_end.isoformat()
-        # Next chunk starts at Jan 1 of the year after this chunk_end
-        current = date(chunk_end.year + 1, 1, 1)
+    return [(s.date().isoformat(), e.date().isoformat()) for s, e in zip(starts, ends)]
 
 
 def ndvi_chunked(
@@ -362,6 +429,7 @@ def ndvi_chunked(
     end: str,
     years_per_chunk: int = 1,
     drop_bad: bool = True,
+    zarr_cache: str | Path | None = None,
     **ndvi_kwargs,
 ) -> xr.DataArray:
     """
@@ -385,6 +453,13 @@ def ndvi_chunked(
     drop_bad : bool, default True
         If True, applies `v.drop_bad_assets()` to each chunk to remove any
         time slices whose assets fail to load (e.g., 403 errors).
+    zarr_cache : str or Path, optional
+        When given, each chunk is appended to a Zarr store at this path
+        (overwriting any existing store) instead of being held for an
+        in-memory ``xr.concat``. The result is reopened lazily from the store,
+        so long ranges produce one flat dask array rather than a deep
+        concatenation graph. The store holds one time step per chunk.
+        Requires ``zarr``.
     **ndvi_kwargs :
         Additional keyword arguments forwarded to `cd.ndvi` (e.g., edge_size,
         max_cloud, etc.).
@@ -399,7 +474,14 @@ def ndvi_chunked(
     RuntimeError
         If no chunks could be loaded (e.g. due to bad dates).
     """
+    if zarr_cache is not None:
+        try:
+            import zarr
+        except ImportError as exc:  # pragma: no cover - relies on optional dep
+            raise ImportError("ndvi_chunked(zarr_cache=...) requires zarr.") from exc
+
     all_cubes: list[xr.DataArray] = []
+    name: str | None = None
 
     for s_chunk, e_chunk in _year_chunks(start, end, years_per_chunk=years_per_chunk):
         print(f"Loading NDVI chunk: {s_chunk} \u2192 {e_chunk}")
@@ -413,7 +495,38 @@ def ndvi_chunked(
         if drop_bad:
             # Use the existing pipe/verbs API; unwrap back to DataArray.
             cube = (pipe(cube) | v.drop_bad_assets()).unwrap()
-        all_cubes.append(cube)
+        if zarr_cache is None:
+            all_cubes.append(cube)
+            continue
+
+        # One scene per Zarr chunk along time, so every append starts on a
+        # chunk boundary; spatial chunks are fixed by the first chunk and each
+        # later chunk is rechunked to match before writing.
+        if name is None:
+            name = str(cube.name or "ndvi")
+            zarr_chunks = {
+                dim: 1 if dim == "time" else (cube.chunksizes[dim][0] if cube.chunks else cube.sizes[dim])
+                for dim in cube.dims
+            }
+            cube = cube.chunk(zarr_chunks)
+            cube.to_dataset(name=name).to_zarr(
+                zarr_cache,
+                mode="w",
+                consolidated=False,
+                encoding={name: {"chunks": tuple(zarr_chunks[dim] for dim in cube.dims)}},
+            )
+        else:
+            cube = cube.chunk(zarr_chunks)
+            cube.to_dataset(name=name).to_zarr(zarr_cache, append_dim="time", consolidated=False)
+
+    if zarr_cache is not None:
+        if name is None:
+            raise RuntimeError("ndvi_chunked: no chunks loaded – check dates and query area.")
+        zarr.consolidate_metadata(str(zarr_cache))
+        ndvi = xr.open_zarr(zarr_cache, consolidated=True)[name]
+        if not ndvi.indexes["time"].is_monotonic_increasing:
+            ndvi = ndvi.sortby("time")
+        return ndvi
 
     if not all_cubes:
         raise RuntimeError("ndvi_chunked: no chunks loaded – check dates and query area.")
@@ -421,11 +534,30 @@ def ndvi_chunked(
     if len(all_cubes) == 1:
         ndvi = all_cubes[0]
     else:
-        ndvi = xr.concat(all_cubes, dim="time").sortby("time")
+        # _year_chunks yields disjoint windows in chronological order and every
+        # chunk shares the same spatial grid, so skip alignment and only sort
+        # when a loader hands back out-of-order scenes.
+        ndvi = xr.concat(all_cubes, dim="time", join="override", combine_attrs="override")
+        if not ndvi.indexes["time"].is_monotonic_increasing:
+            ndvi = ndvi.sortby("time")
 
     return ndvi
 
 
+NDVI_SCALE_FACTOR = 1e-4
+NDVI_FILL_VALUE = -32768
+
+
+def _quantize_ndvi(ndvi: xr.DataArray) -> xr.DataArray:
+    """Pack float NDVI into CF-encoded ``int16`` (``value * 1e-4``)."""
+
+    packed = (ndvi / NDVI_SCALE_FACTOR).round().clip(-10000, 10000)
+    packed = packed.fillna(NDVI_FILL_VALUE).astype(np.int16)
+    return packed.assign_attrs(
+        {**ndvi.attrs, "scale_factor": NDVI_SCALE_FACTOR, "_FillValue": NDVI_FILL_VALUE}
+    )
+
+
 def ndvi(
     *,
     lat: Optional[float] = None,
@@ -436,6 +568,7 @@ def ndvi(
     end: Any = None,
     source: Literal["sentinel2"] = "sentinel2",
     as_zscore: bool = False,
+    quantize: bool = False,
     show_progress: bool = True,
     **kwargs: Any,
 ) -> xr.DataArray:
@@ -449,6 +582,12 @@ def ndvi(
 
     Parameters
     ----------
+    quantize : bool, default False
+        Return NDVI packed as ``int16`` scaled by 10000 (the Sentinel-2 L2A
+        convention) with ``scale_factor``/``_FillValue`` attrs, halving memory
+        for masking and visualization. ``xr.decode_cf`` (or writing and
+        reopening with xarray) restores float values. Ignored when
+        ``as_zscore`` is set.
     show_progress : bool, default True
         Whether to display a progress bar for time-stepped NDVI building when
         available. Progress reporting is a no-op when ``tqdm`` is not
@@ -458,13 +597,6 @@ def ndvi(
     if source != "sentinel2":
         raise ValueError("Only the 'sentinel2' source is supported for NDVI.")
 
-    if as_zscore:
-        warnings.warn(
-            "`as_zscore` is deprecated. Call v.zscore(dim='time') on the raw NDVI cube instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-
     ndvi = load_sentinel2_ndvi_cube(
         lat=lat,
         lon=lon,
@@ -474,11 +606,15 @@ def ndvi(
         show_progress=show_progress,
         **kwargs,
     )
+    if not as_zscore:
+        return _quantize_ndvi(ndvi) if quantize else ndvi
 
-    if as_zscore:
-        ndvi = (pipe(ndvi) | v.zscore(dim="time", keep_dim=True)).unwrap()
-
-    return ndvi
+    warnings.warn(
+        "`as_zscore` is deprecated. Call v.zscore(dim='time') on the raw NDVI cube instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return (pipe(ndvi) | v.zscore(dim="time", keep_dim=True)).unwrap()
 
 
 __all__ = [
@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 import datetime as _dt
-import math
+import functools
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Union
 
 import numpy as np
 import xarray as xr
-from shapely.geometry import Point, Polygon
-from shapely.prepared import prep
+from shapely.geometry import Polygon
+
+try:  # Shapely >= 2.0 ships vectorized functions at the top level.
+    from shapely import get_coordinates as _get_coordinates
+    from shapely import intersects_xy as _intersects_xy
+    from shapely import line_interpolate_point as _line_interpolate_point
+except ImportError:  # pragma: no cover - Shapely < 2.0
+    _get_coordinates = None
+    _intersects_xy = None
+    _line_interpolate_point = None
 
 TimeLike = Union[np.datetime64, float, int, _dt.datetime, _dt.date]
 
@@ -19,6 +27,7 @@ __all__ = [
     "VaseSection",
     "VaseDefinition",
     "VasePanel",
+    "VasePanels",
     "build_vase_mask",
     "build_vase_panels",
     "extract_vase_from_attrs",
@@ -50,6 +59,7 @@ class VaseDefinition:
 
     sections: List[VaseSection]
     interp: str = "nearest"
+    _section_times: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.sections:
@@ -62,12 +72,17 @@ class VaseDefinition:
                 raise ValueError("Polygon provided in VaseSection is not valid")
 
         self.sections = sorted(self.sections, key=lambda s: s.time)
+        # Cached once so per-timestamp lookups never rebuild the array.
+        self._section_times = np.array([sec.time for sec in self.sections])
 
     def sorted_sections(self) -> "VaseDefinition":
-        """Return a new VaseDefinition with sections sorted by time."""
+        """Return this definition; sections are kept sorted by time.
+
+        ``__post_init__`` already sorts and validates the sections, so building
+        a new definition here would only repeat the polygon validity checks.
+        """
 
-        sorted_secs = sorted(self.sections, key=lambda s: s.time)
-        return VaseDefinition(sorted_secs, interp=self.interp)
+        return self
 
 
 @dataclass
@@ -85,6 +100,40 @@ class VasePanel:
     yaw: float
 
 
+@dataclass
+class VasePanels:
+    """Structure-of-arrays collection of :class:`VasePanel` values.
+
+    Each field is a 1-D float array with one entry per panel, so downstream
+    code can work on whole columns at once. Indexing and iteration still yield
+    :class:`VasePanel` objects for callers that expect a list of panels.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    yaw: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, idx: int) -> VasePanel:
+        return VasePanel(
+            x=float(self.x[idx]),
+            y=float(self.y[idx]),
+            z=float(self.z[idx]),
+            width=float(self.width[idx]),
+            height=float(self.height[idx]),
+            yaw=float(self.yaw[idx]),
+        )
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
 def _polygon_at_time(vase: VaseDefinition, t: TimeLike) -> Polygon:
     """Return the polygon cross-section for a target time ``t``.
 
@@ -95,14 +144,13 @@ def _polygon_at_time(vase: VaseDefinition, t: TimeLike) -> Polygon:
     datetime-like, matching the cube's time coordinate type.
     """
 
-    vase_sorted = vase.sorted_sections()
-    sections = vase_sorted.sections
-    times = np.array([sec.time for sec in sections])
+    sections = vase.sections
+    times = vase._section_times
 
-    if vase_sorted.interp not in {"nearest", "linear"}:
+    if vase.interp not in {"nearest", "linear"}:
         raise ValueError("interp must be either 'nearest' or 'linear'")
 
-    if vase_sorted.interp == "nearest" or len(sections) == 1:
+    if vase.interp == "nearest" or len(sections) == 1:
         idx = int(np.abs(times - t).argmin())
         return sections[idx].polygon
 
@@ -129,14 +177,57 @@ def _polygon_at_time(vase: VaseDefinition, t: TimeLike) -> Polygon:
     return Polygon(interp_coords)
 
 
+def _polygons_at_times(vase: VaseDefinition, t_values: np.ndarray) -> List[Polygon]:
+    """Vectorized ``linear`` counterpart of :func:`_polygon_at_time`.
+
+    The bracketing sections and interpolation ratios for every entry of
+    ``t_values`` come from one batched ``searchsorted``; only the vertex
+    interpolation itself runs per time.
+    """
+
+    sections = vase.sections
+    times = vase._section_times
+    t_values = np.asarray(t_values)
+    if len(sections) == 1:
+        return [sections[0].polygon] * len(t_values)
+
+    idx_upper = np.clip(np.searchsorted(times, t_values, side="right"), 1, len(sections) - 1)
+    idx_lower = idx_upper - 1
+    before = t_values <= times[0]
+    after = t_values >= times[-1]
+
+    t0 = times[idx_lower]
+    span = times[idx_upper] - t0
+    ratios = np.zeros(len(t_values), dtype=float)
+    nonzero = span != span.dtype.type(0)
+    ratios[nonzero] = (t_values[nonzero] - t0[nonzero]) / span[nonzero]
+
+    polygons: List[Polygon] = []
+    for k in range(len(t_values)):
+        if before[k]:
+            polygons.append(sections[0].polygon)
+            continue
+        if after[k]:
+            polygons.append(sections[-1].polygon)
+            continue
+        coords0 = np.asarray(sections[idx_lower[k]].polygon.exterior.coords)
+        coords1 = np.asarray(sections[idx_upper[k]].polygon.exterior.coords)
+        if coords0.shape != coords1.shape:
+            raise ValueError("Polygons for linear interpolation must share vertex layout")
+        polygons.append(Polygon(coords0 + ratios[k] * (coords1 - coords0)))
+    return polygons
+
+
 def _sample_polygon_boundary(polygon: Polygon, n_samples: int) -> np.ndarray:
     """Sample ``n_samples`` equally spaced points along the polygon boundary."""
 
     n_samples = max(4, int(n_samples))
     length = polygon.exterior.length
     distances = np.linspace(0, length, num=n_samples, endpoint=False)
-    points = [polygon.exterior.interpolate(d).coords[0] for d in distances]
-    return np.asarray(points)
+    if _line_interpolate_point is None:  # pragma: no cover - Shapely < 2.0
+        points = [polygon.exterior.interpolate(d).coords[0] for d in distances]
+        return np.asarray(points)
+    return _get_coordinates(_line_interpolate_point(polygon.exterior, distances))
 
 
 def _to_numeric_time(t: TimeLike) -> float:
@@ -160,71 +251,334 @@ def _normalize_value(value: TimeLike, vmin: TimeLike, vmax: TimeLike) -> float:
     return (v_num - vmin_num) / (vmax_num - vmin_num)
 
 
+def _normalizer(vmin: float, vmax: float) -> tuple[float, float]:
+    """Return ``(scale, offset)`` with ``(v - vmin) * scale + offset`` in [0, 1].
+
+    Mirrors :func:`_normalize_value`: a degenerate range maps everything to 0.5.
+    """
+
+    if vmax == vmin:
+        return 0.0, 0.5
+    return 1.0 / (vmax - vmin), 0.0
+
+
 def build_vase_panels(
     vase: VaseDefinition,
     time_min: float,
     time_max: float,
     *,
     angle_samples: int = 24,
-) -> List[VasePanel]:
+) -> VasePanels:
     """Approximate the vase hull with rectangular panels.
 
     The panels are laid out by sampling each section's polygon boundary and
     connecting successive time slices, producing a coarse mesh aligned to the
-    cube's normalized coordinate system.
+    cube's normalized coordinate system. Panels are returned as a
+    :class:`VasePanels` structure of arrays, ordered by section pair and then
+    by boundary sample.
     """
 
-    sections = vase.sorted_sections().sections
-    if len(sections) < 2:
-        return []
+    sections = vase.sections
+    n = int(angle_samples)
+    if len(sections) < 2 or n <= 0:
+        empty = np.empty(0, dtype=float)
+        return VasePanels(empty, empty, empty, empty, empty, empty)
 
     # Gather bounds for normalization
     all_coords = np.vstack([np.asarray(sec.polygon.exterior.coords) for sec in sections])
     x_min, y_min = all_coords[:, 0].min(), all_coords[:, 1].min()
     x_max, y_max = all_coords[:, 0].max(), all_coords[:, 1].max()
 
-    panels: List[VasePanel] = []
+    inv_dx, off_x = _normalizer(x_min, x_max)
+    inv_dy, off_y = _normalizer(y_min, y_max)
+    inv_dw, off_w = _normalizer(0.0, max(x_max - x_min, y_max - y_min))
+    t_lo = _to_numeric_time(time_min)
+    inv_dt, off_t = _normalizer(t_lo, _to_numeric_time(time_max))
+
+    # (sections, samples, 2) boundary rings and normalized section times.
+    rings = np.stack([_sample_polygon_boundary(sec.polygon, n)[:n] for sec in sections])
+    t_num = np.array([_to_numeric_time(sec.time) for sec in sections])
+    t_norm = (t_num - t_lo) * inv_dt + off_t
+
+    # Panel ``i`` of a section pair joins samples ``i`` and ``i + 1`` (wrapping)
+    # on the lower and upper rings.
+    mids = 0.5 * (rings + np.roll(rings, -1, axis=1))
+    mid_lower = mids[:-1]
+    mid_upper = mids[1:]
+    centers = 0.5 * (mid_lower + mid_upper)
+    width_vecs = mid_lower - mid_upper
+    widths = np.hypot(width_vecs[..., 0], width_vecs[..., 1])
+    yaws = np.where(widths > 0, np.degrees(np.arctan2(width_vecs[..., 1], width_vecs[..., 0])), 0.0)
+
+    heights = np.repeat(np.abs(t_norm[1:] - t_norm[:-1]), n)
+    zs = np.repeat(0.5 * (t_norm[:-1] + t_norm[1:]), n)
+    xs_norm = (centers[..., 0] - x_min) * inv_dx + off_x
+    ys_norm = (centers[..., 1] - y_min) * inv_dy + off_y
+    widths_norm = widths * inv_dw + off_w
+
+    return VasePanels(
+        x=xs_norm.ravel(),
+        y=ys_norm.ravel(),
+        z=zs,
+        width=widths_norm.ravel(),
+        height=heights,
+        yaw=yaws.ravel(),
+    )
 
-    for lower, upper in zip(sections[:-1], sections[1:]):
-        pts_lower = _sample_polygon_boundary(lower.polygon, angle_samples)
-        pts_upper = _sample_polygon_boundary(upper.polygon, angle_samples)
 
-        t0_norm = _normalize_value(lower.time, time_min, time_max)
-        t1_norm = _normalize_value(upper.time, time_min, time_max)
+def _points_in_polygon(polygon: Polygon, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Vectorized boundary-inclusive point-in-polygon test.
 
-        for idx in range(angle_samples):
-            i_next = (idx + 1) % angle_samples
-            p0 = pts_lower[idx]
-            p1 = pts_lower[i_next]
-            p2 = pts_upper[i_next]
-            p3 = pts_upper[idx]
+    Uses Shapely 2's ``intersects_xy`` so the whole grid is evaluated in one
+    GEOS call; Shapely 1.x falls back to ``shapely.vectorized``.
+    """
 
-            mid_lower = 0.5 * (p0 + p1)
-            mid_upper = 0.5 * (p3 + p2)
-            center_xy = 0.5 * (mid_lower + mid_upper)
+    if _intersects_xy is None:  # pragma: no cover - Shapely < 2.0
+        from shapely import vectorized
 
-            width_vec = mid_lower - mid_upper
-            width = float(np.linalg.norm(width_vec))
-            height = float(abs(t1_norm - t0_norm))
+        return vectorized.contains(polygon, xs, ys) | vectorized.touches(polygon, xs, ys)
+    return _intersects_xy(polygon, xs, ys)
 
-            x_norm = _normalize_value(center_xy[0], x_min, x_max)
-            y_norm = _normalize_value(center_xy[1], y_min, y_max)
-            z_norm = 0.5 * (t0_norm + t1_norm)
 
-            yaw = math.degrees(math.atan2(width_vec[1], width_vec[0])) if width > 0 else 0.0
+def _regular_grid_transform(xs: np.ndarray, ys: np.ndarray):
+    """Return the pixel-center affine for evenly spaced numeric ``xs``/``ys``.
 
-            panels.append(
-                VasePanel(
-                    x=x_norm,
-                    y=y_norm,
-                    z=z_norm,
-                    width=_normalize_value(width, 0.0, max(x_max - x_min, y_max - y_min)),
-                    height=height,
-                    yaw=yaw,
-                )
-            )
+    ``None`` signals an irregular (or degenerate) grid, where callers should
+    fall back to testing every grid point. Without ``affine`` the six
+    coefficients are returned as a plain tuple.
+    """
 
-    return panels
+    if len(xs) < 2 or len(ys) < 2:
+        return None
+    if not (np.issubdtype(xs.dtype, np.number) and np.issubdtype(ys.dtype, np.number)):
+        return None
+    dx_all = np.diff(xs.astype(float))
+    dy_all = np.diff(ys.astype(float))
+    dx = dx_all[0]
+    dy = dy_all[0]
+    if dx == 0 or dy == 0 or not (np.allclose(dx_all, dx) and np.allclose(dy_all, dy)):
+        return None
+
+    coefficients = (dx, 0.0, xs[0] - dx / 2.0, 0.0, dy, ys[0] - dy / 2.0)
+    try:
+        from affine import Affine
+    except ImportError:  # pragma: no cover - affine ships with rasterio
+        # Only rasterio consumes the transform; the scanline fallback just
+        # needs to know the grid is regular.
+        return coefficients
+    return Affine(*coefficients)
+
+
+def _make_scanline_fill(prange):
+    """Return the scanline fill kernel with its row loop driven by ``prange``.
+
+    numba only parallelizes loops over ``numba.prange``; passing the builtin
+    ``range`` gives the same kernel as plain Python.
+    """
+
+    def scanline_fill(edges: np.ndarray, xs: np.ndarray, ys: np.ndarray, out: np.ndarray) -> None:
+        """Boundary-inclusive even-odd scanline fill of polygon ``edges``.
+
+        ``edges`` is an ``(E, 4)`` array of ``(x1, y1, x2, y2)`` segments covering
+        every ring of the polygon. Each row ``ys[j]`` collects the crossings of the
+        non-horizontal edges (half-open in y), fills ``xs`` between crossing pairs
+        and then marks grid points lying exactly on an edge. Rows are independent,
+        so the loop runs in parallel when compiled with numba.
+        """
+
+        n_edges = edges.shape[0]
+        for j in prange(ys.shape[0]):
+            y = ys[j]
+            crossings = np.empty(n_edges)
+            n_cross = 0
+            for e in range(n_edges):
+                x1 = edges[e, 0]
+                y1 = edges[e, 1]
+                x2 = edges[e, 2]
+                y2 = edges[e, 3]
+                if (y1 <= y < y2) or (y2 <= y < y1):
+                    crossings[n_cross] = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                    n_cross += 1
+            crossings = np.sort(crossings[:n_cross])
+            for k in range(xs.shape[0]):
+                x = xs[k]
+                inside = False
+                for c in range(0, n_cross - 1, 2):
+                    if crossings[c] <= x <= crossings[c + 1]:
+                        inside = True
+                        break
+                if not inside:
+                    for e in range(n_edges):
+                        x1 = edges[e, 0]
+                        y1 = edges[e, 1]
+                        x2 = edges[e, 2]
+                        y2 = edges[e, 3]
+                        if y < min(y1, y2) or y > max(y1, y2):
+                            continue
+                        if y1 == y2:
+                            on_edge = min(x1, x2) <= x <= max(x1, x2)
+                        else:
+                            on_edge = x == x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                        if on_edge:
+                            inside = True
+                            break
+                out[j, k] = inside
+
+    return scanline_fill
+
+
+@functools.cache
+def _scanline_kernel():
+    """Return the scanline fill compiled with numba, or ``None`` without numba.
+
+    Only the rasterio-less fallback needs the kernel, so numba is imported and
+    the JIT runs on first use rather than when this module is imported.
+    """
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - numba is optional
+        return None
+
+    return numba.njit(parallel=True)(_make_scanline_fill(numba.prange))
+
+
+def _polygon_edges(polygon: Polygon) -> np.ndarray:
+    """Return the ``(E, 4)`` edge array for all rings of ``polygon``."""
+
+    rings = [polygon.exterior, *polygon.interiors]
+    parts = []
+    for ring in rings:
+        coords = np.asarray(ring.coords, dtype=float)[:, :2]
+        parts.append(np.hstack([coords[:-1], coords[1:]]))
+    return np.vstack(parts)
+
+
+def _rasterize_polygon(
+    polygon: Polygon,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    transform,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Boundary-inclusive mask of grid points inside ``polygon`` on a regular grid.
+
+    ``rasterio.features.rasterize`` scan-converts the polygon with
+    ``all_touched=True`` to find every cell the polygon reaches; only those
+    candidate cells are then checked exactly, so the result matches
+    :func:`_points_in_polygon` without testing the whole grid. When ``out`` is
+    given the mask is written into it instead of a new array.
+
+    Without rasterio the slice is filled by the numba scanline kernel when
+    numba is installed, otherwise by a full-grid ``intersects_xy`` test.
+    """
+
+    try:
+        import rasterio.features
+    except ImportError:  # pragma: no cover - rasterio is a core dependency
+        slice_mask = out if out is not None else np.empty((len(ys), len(xs)), dtype=bool)
+        kernel = _scanline_kernel()
+        if kernel is not None:
+            kernel(_polygon_edges(polygon), xs.astype(float), ys.astype(float), slice_mask)
+        else:
+            grid_x, grid_y = np.meshgrid(xs, ys)
+            slice_mask[...] = _points_in_polygon(polygon, grid_x.ravel(), grid_y.ravel()).reshape(slice_mask.shape)
+        return slice_mask
+
+    candidates = rasterio.features.rasterize(
+        [(polygon, 1)],
+        out_shape=(len(ys), len(xs)),
+        transform=transform,
+        fill=0,
+        dtype="uint8",
+        all_touched=True,
+    )
+    jj, kk = np.nonzero(candidates)
+    if out is None:
+        slice_mask = np.zeros((len(ys), len(xs)), dtype=bool)
+    else:
+        slice_mask = out
+        slice_mask.fill(False)
+    slice_mask[jj, kk] = _points_in_polygon(polygon, xs[kk], ys[jj])
+    return slice_mask
+
+
+def _vase_mask_block(vase: VaseDefinition, times: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Return the ``(time, y, x)`` boolean vase mask for the given coordinates.
+
+    When every section shares one polygon the result is a read-only
+    ``np.broadcast_to`` view of a single slice.
+    """
+
+    if vase.interp not in {"nearest", "linear"}:
+        raise ValueError("interp must be either 'nearest' or 'linear'")
+
+    transform = _regular_grid_transform(xs, ys)
+    if transform is None:
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        grid_x = grid_x.ravel()
+        grid_y = grid_y.ravel()
+
+    first = vase.sections[0].polygon
+    if all(sec.polygon is first or sec.polygon.equals_exact(first, 0.0) for sec in vase.sections[1:]):
+        # A static footprint gives the same slice at every time: compute it
+        # once and broadcast it as a read-only view instead of copying it.
+        if transform is not None:
+            slice_mask = _rasterize_polygon(first, xs, ys, transform)
+        else:
+            slice_mask = _points_in_polygon(first, grid_x, grid_y).reshape(len(ys), len(xs))
+        return np.broadcast_to(slice_mask, (len(times), len(ys), len(xs)))
+
+    if vase.interp == "nearest" or len(vase.sections) == 1:
+        # Many cube timestamps snap to the same section: resolve all of them in
+        # one vectorized argmin and key the slice cache by section index.
+        polygons = [sec.polygon for sec in vase.sections]
+        keys = np.abs(vase._section_times[:, None] - times[None, :]).argmin(axis=0).tolist()
+    else:
+        unique_times, inverse = np.unique(times, return_inverse=True)
+        polygons = _polygons_at_times(vase, unique_times)
+        keys = inverse.ravel().tolist()
+
+    # Fill a preallocated output in place; repeated keys copy an earlier slice
+    # instead of recomputing it.
+    out = np.empty((len(times), len(ys), len(xs)), dtype=bool)
+    first_index: dict = {}
+    for i, key in enumerate(keys):
+        j = first_index.get(key)
+        if j is not None:
+            out[i] = out[j]
+            continue
+        first_index[key] = i
+        polygon = polygons[key]
+        if transform is not None:
+            _rasterize_polygon(polygon, xs, ys, transform, out=out[i])
+        else:
+            out[i] = _points_in_polygon(polygon, grid_x, grid_y).reshape(len(ys), len(xs))
+    return out
+
+
+def _lazy_vase_mask(
+    vase: VaseDefinition,
+    times: np.ndarray,
+    ys: np.ndarray,
+    xs: np.ndarray,
+    time_chunks: tuple[int, ...],
+):
+    """Dask-backed vase mask chunked along time like the source cube."""
+
+    import dask.array as dsa
+
+    template = dsa.empty(
+        (len(times), len(ys), len(xs)),
+        chunks=(time_chunks, (len(ys),), (len(xs),)),
+        dtype=bool,
+    )
+
+    def _block(block: np.ndarray, block_info=None) -> np.ndarray:
+        t0, t1 = block_info[0]["array-location"][0]
+        return _vase_mask_block(vase, times[t0:t1], ys, xs)
+
+    return dsa.map_blocks(_block, template, dtype=bool)
 
 
 def build_vase_mask(
@@ -247,6 +601,8 @@ def build_vase_mask(
     - Computation streams over time slices using coordinate arrays only (no
       ``cube.values``), keeping memory use low and working with dask-backed
       cubes or ``VirtualCube`` sources.
+    - For dask-backed cubes the mask is itself a lazy dask array chunked along
+      time like ``cube``; slices are only computed when the mask is used.
     """
 
     for dim in (time_dim, y_dim, x_dim):
@@ -257,20 +613,12 @@ def build_vase_mask(
     ys = cube.coords[y_dim].values
     xs = cube.coords[x_dim].values
 
-    mask_slices = []
-    for t in times:
-        polygon = _polygon_at_time(vase, t)
-        prepared = prep(polygon)
-        slice_mask = np.zeros((len(ys), len(xs)), dtype=bool)
-        for j, y in enumerate(ys):
-            for k, x in enumerate(xs):
-                pt = Point(x, y)
-                slice_mask[j, k] = prepared.intersects(pt)
-        mask_slices.append(slice_mask)
-
-    mask_np = np.stack(mask_slices, axis=0)
+    if cube.chunks is not None:
+        mask_data = _lazy_vase_mask(vase, times, ys, xs, cube.chunksizes[time_dim])
+    else:
+        mask_data = _vase_mask_block(vase, times, ys, xs)
     mask = xr.DataArray(
-        data=mask_np,
+        data=mask_data,
         coords={time_dim: cube.coords[time_dim], y_dim: cube.coords[y_dim], x_dim: cube.coords[x_dim]},
         dims=(time_dim, y_dim, x_dim),
         name="vase_mask",
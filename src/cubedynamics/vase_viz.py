@@ -41,25 +41,64 @@ def extract_vase_points(
 
     This MUST be streaming-friendly:
         - Do not call cube.values on the full cube.
-        - Use cube.where(mask).stack or .to_dataframe(dropna=True).
+        - Gather only the masked voxels by integer index (``np.nonzero`` on
+          the mask), so no cube-sized NaN array or DataFrame is built.
+    Voxels whose value is NaN are dropped, as before.
     """
 
     _validate_dims(cube, (time_dim, y_dim, x_dim))
 
-    masked = cube.where(mask)
-    df = masked.to_dataframe(name="value").dropna()
+    dims = (time_dim, y_dim, x_dim)
+    cube = cube.transpose(*dims)
+    mask = mask.reindex_like(cube, fill_value=False).transpose(*dims)
 
-    times = df.index.get_level_values(time_dim).to_numpy()
-    ys = df.index.get_level_values(y_dim).to_numpy()
-    xs = df.index.get_level_values(x_dim).to_numpy()
-    values = df["value"].to_numpy()
+    data = cube.data
+    if cube.chunks is None:
+        idx_t, idx_y, idx_x = np.nonzero(np.asarray(mask.data, dtype=bool))
+        values = np.asarray(data)[idx_t, idx_y, idx_x]
+    else:
+        idx_t, idx_y, idx_x, values = _gather_masked_by_time_chunk(data, mask.data, cube.chunks[0])
+
+    if values.dtype.kind in "fc":
+        keep = ~np.isnan(values)
+        if not keep.all():
+            idx_t, idx_y, idx_x, values = idx_t[keep], idx_y[keep], idx_x[keep], values[keep]
+
+    times = cube.coords[time_dim].values[idx_t]
+    ys = cube.coords[y_dim].values[idx_y]
+    xs = cube.coords[x_dim].values[idx_x]
 
     return {"time": times, "y": ys, "x": xs, "value": values}
 
 
+def _gather_masked_by_time_chunk(data, mask_data, time_chunks):
+    """Gather masked voxels from a dask array one time chunk at a time.
+
+    Only one mask slab is held in memory at a time, and ``vindex`` touches only
+    the cube chunks that contain selected voxels.
+    """
+
+    parts: list[tuple[np.ndarray, ...]] = []
+    t0 = 0
+    for size in time_chunks:
+        t1 = t0 + size
+        slab = np.asarray(mask_data[t0:t1], dtype=bool)
+        jt, jy, jx = np.nonzero(slab)
+        if jt.size:
+            vals = np.asarray(data[t0:t1].vindex[jt, jy, jx])
+            parts.append((jt + t0, jy, jx, vals))
+        t0 = t1
+
+    if not parts:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, empty, np.empty(0, dtype=data.dtype)
+    return tuple(np.concatenate(arrs) for arrs in zip(*parts))
+
+
 def _convert_time_to_numeric(t: np.ndarray) -> np.ndarray:
     if t.dtype.kind in ("M", "m"):
-        return t.astype("datetime64[ns]").astype(float) / 1e9
+        unit = "datetime64[ns]" if t.dtype.kind == "M" else "timedelta64[ns]"
+        return t.astype(unit, copy=False).view("i8") * 1e-9
     return t.astype(float)
 
 
@@ -137,8 +176,7 @@ def vase_to_mesh(
     except ImportError as exc:  # pragma: no cover - exercised via importorskip
         raise ImportError("vase_to_mesh requires trimesh.") from exc
 
-    vase_sorted = vase.sorted_sections()
-    sections = vase_sorted.sections
+    sections = vase.sections
 
     if not sections:
         raise ValueError("VaseDefinition must include at least one section")
@@ -0,0 +1,12 @@
+"""Matplotlib handles shared by the matplotlib-backed fire verbs.
+
+Imported lazily from the plotting functions so ``import cubedynamics.verbs``
+does not load pyplot, while repeated plot calls reuse one cached module.
+"""
+
+from __future__ import annotations
+
+import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+__all__ = ["Poly3DCollection", "plt"]
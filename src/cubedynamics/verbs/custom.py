@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial
 
 import xarray as xr
 
@@ -20,10 +21,11 @@ def apply(
     verb simply forwards the cube and keyword arguments.
     """
 
-    def _op(obj: xr.DataArray | xr.Dataset) -> xr.DataArray | xr.Dataset:
-        return func(obj, **kwargs)
-
-    return _op
+    # partial binds the keywords once and calls through C, so each pipe step
+    # skips a Python frame. It is used even without kwargs: handing back
+    # ``func`` itself would expose pipe markers such as
+    # ``_cd_passthrough_on_pipe`` that the wrapper has always hidden.
+    return partial(func, **kwargs)
 
 
 __all__ = ["apply"]
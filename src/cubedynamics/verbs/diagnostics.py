@@ -364,7 +364,7 @@ def _finite_clip(cube: xr.DataArray) -> xr.DataArray:
     vals = _finite_values(cube)
     if vals.size == 0:
         return cube
-    lo, hi = np.nanpercentile(vals, [2, 98])
+    lo, hi = np.percentile(vals, [2, 98])
     if np.isfinite(lo) and np.isfinite(hi) and hi > lo:
         return cube.clip(float(lo), float(hi))
     return cube
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional, Tuple, Dict
+import hashlib
+import warnings
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import xarray as xr
 import geopandas as gpd
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 from ..fire_time_hull import (
     build_fire_event_daily,
@@ -28,6 +29,13 @@ from ..fire_time_hull import (
     sample_inside_outside,
     time_hull_to_vase,
     log,
+    PreparedFireEvent,
+    _EMPTY_DAYS,
+    _EMPTY_META,
+    _inside_outside_hist_on_ax,
+    _prepare_event,
+    _vertex_layer_values,
+    infer_spatial_dims,
 )
 from ..piping import Verb
 from ..streaming import VirtualCube
@@ -37,12 +45,22 @@ from .vase import vase as _vase_base
 
 PRESCRIBED_PATTERN = r"prescrib|\brx\b|planned|broadcast|pile"
 
+# Upper bound for one dask chunk of whole image planes in ``extract``.
+_SAMPLING_CHUNK_BYTES = 128 * 1024 * 1024
+
 
 def _unwrap_fire_cube(obj):
+    """Return ``(base_da, original_obj)`` for a fire verb input.
+
+    VirtualCube tiles are assembled once with ``combine_by_coords`` and cached
+    on the cube, which does not compute dask-backed tiles; only the per-day
+    slices read by the inside/outside sampler are loaded.
+    """
+
     if obj is None:
         raise ValueError("fire verb requires an input cube/DataArray; got None.")
     if isinstance(obj, VirtualCube):
-        base_da = obj.materialize()
+        base_da = obj.materialize(cache=True)
         if not isinstance(base_da, xr.DataArray):
             raise TypeError("VirtualCube underlying data is not a DataArray.")
         return base_da, obj
@@ -51,6 +69,35 @@ def _unwrap_fire_cube(obj):
     raise TypeError(f"Unsupported type for fire verb: {type(obj)!r}")
 
 
+def _rechunk_for_spatial_sampling(da: xr.DataArray) -> xr.DataArray:
+    """Return ``da`` with whole image planes per chunk for per-day sampling.
+
+    The inside/outside sampler reads one time step at a time, so spatially
+    tiled dask chunks turn each day into many small chunk reads. Merging the
+    spatial chunks keeps the existing time chunks, so every new chunk is an
+    exact union of existing ones (no shuffle). A day still pulls in the other
+    days of its time chunk; when a time chunk of whole planes would exceed
+    ``_SAMPLING_CHUNK_BYTES`` the time chunks are also split to one day each.
+    Eager or already plane-chunked cubes are returned as is.
+    """
+
+    if da.chunks is None:
+        return da
+    try:
+        y_dim, x_dim = infer_spatial_dims(da)
+    except ValueError:
+        return da
+    chunks = dict(zip(da.dims, da.chunks))
+    target = {y_dim: -1, x_dim: -1}
+    if "time" in chunks and da.sizes["time"]:
+        day_bytes = da.nbytes // da.sizes["time"]
+        if max(chunks["time"]) > 1 and max(chunks["time"]) * day_bytes > _SAMPLING_CHUNK_BYTES:
+            target["time"] = 1
+    if all(len(chunks[dim]) == 1 for dim in (y_dim, x_dim)) and "time" not in target:
+        return da
+    return da.chunk(target)
+
+
 def _choose_fire_column(gdf: gpd.GeoDataFrame, candidates: tuple[str, ...]) -> str:
     lower = {name.lower(): name for name in gdf.columns}
     for candidate in candidates:
@@ -146,6 +193,9 @@ def _build_vase_panel_figure(
     if not results:
         raise ValueError("fire_vase_panel requires at least one successful fire_plot result.")
 
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     columns = max(1, int(columns))
     rows = int(np.ceil(len(results) / columns))
     specs = [[{"type": "scene"} for _ in range(columns)] for _ in range(rows)]
@@ -194,73 +244,178 @@ def _build_vase_panel_figure(
     return fig
 
 
-def _plot_time_hull_vase(
+def _plot_time_hull_vase_on_ax(
+    ax,
     vase_obj: Vase,
-    da: xr.DataArray,
     summary: HullClimateSummary | None,
     **plot_kwargs,
 ):
-    """Render a TimeHull-derived vase using matplotlib for compatibility."""
+    """Draw a TimeHull-derived vase onto an existing 3D axis.
+
+    Returns the face collection when it is colored by climate values, so
+    callers can pass it straight to ``fig.colorbar``, or ``None`` when the
+    vase is drawn in a flat color.
+    """
+
+    from ._plot_helpers import Poly3DCollection, plt
 
     verts = np.asarray(vase_obj.verts_km)
-    tris = np.asarray(vase_obj.tris)
-    meta = getattr(vase_obj, "metadata", {}) or {}
-    t_days_vert = np.asarray(meta.get("t_days_vert", []), dtype=float)
-    metrics = meta.get("metrics", {}) or {}
+    tris = np.asarray(vase_obj.tris, dtype=np.intp).reshape(-1, 3)
+    meta = getattr(vase_obj, "metadata", None) or _EMPTY_META
+    t_days_vert = meta.get("t_days_vert", _EMPTY_DAYS)
+    metrics = meta.get("metrics") or _EMPTY_META
 
     intensities = None
     if isinstance(summary, HullClimateSummary):
-        day_vals = np.asarray(summary.per_day_mean.sort_index().values, dtype=float)
+        day_vals = summary.day_values()
         M = int(metrics.get("days", day_vals.size if day_vals.size else 0) or 0)
         if M <= 0 and t_days_vert.size:
-            M = int(np.nanmax(t_days_vert)) if np.isfinite(t_days_vert).any() else day_vals.size
-        if M > 0 and day_vals.size:
-            if len(day_vals) < M:
-                day_vals = np.pad(day_vals, (0, M - len(day_vals)), mode="edge")
-            elif len(day_vals) > M:
-                day_vals = day_vals[:M]
-            if t_days_vert.size:
-                layer_indices = np.clip((t_days_vert - 1).astype(int), 0, M - 1)
-                intensities = day_vals[layer_indices]
-
-    from matplotlib import cm
-    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-
-    fig = plt.figure(figsize=plot_kwargs.get("figsize", (6, 4)))
-    ax = fig.add_subplot(111, projection="3d")
-    faces = [verts[idx] for idx in tris]
+            finite_days = t_days_vert[np.isfinite(t_days_vert)]
+            M = int(finite_days.max()) if finite_days.size else day_vals.size
+        if M > 0 and day_vals.size and t_days_vert.size:
+            intensities = _vertex_layer_values(t_days_vert, day_vals, M)
+
+    faces = verts[tris]
 
+    mappable = None
     if intensities is not None and intensities.size:
-        norm = plt.Normalize(vmin=float(np.nanmin(intensities)), vmax=float(np.nanmax(intensities)))
-        face_colors = []
-        for tri in tris:
-            vals = intensities[tri]
-            face_colors.append(cm.viridis(norm(np.nanmean(vals))))
+        # Colors are mapped at draw time from the face means, and the
+        # collection itself doubles as the colorbar mappable.
+        poly = Poly3DCollection(faces, linewidths=0.4, alpha=0.7)
+        poly.set_array(np.nanmean(intensities[tris], axis=1))
+        poly.set_cmap("viridis")
+        poly.set_norm(plt.Normalize(vmin=float(np.nanmin(intensities)), vmax=float(np.nanmax(intensities))))
+        mappable = poly
     else:
-        face_colors = "steelblue"
-
-    poly = Poly3DCollection(faces, facecolors=face_colors, linewidths=0.4, alpha=0.7)
+        poly = Poly3DCollection(faces, facecolors="steelblue", linewidths=0.4, alpha=0.7)
     poly.set_edgecolor(plot_kwargs.get("edgecolor", "#2c3e50"))
     ax.add_collection3d(poly)
     ax.set_xlabel("x (km)")
     ax.set_ylabel("y (km)")
     ax.set_zlabel("days")
+    ax.view_init(elev=plot_kwargs.get("elev", 26), azim=plot_kwargs.get("azim", -58))
+    ax.set_title(plot_kwargs.get("title", "Fire time-hull vase"))
+    return mappable
 
-    if isinstance(summary, HullClimateSummary) and intensities is not None and intensities.size:
-        mappable = cm.ScalarMappable(
-            cmap="viridis",
-            norm=plt.Normalize(vmin=float(np.nanmin(intensities)), vmax=float(np.nanmax(intensities))),
-        )
-        mappable.set_array([])
+
+def _plot_time_hull_vase(
+    vase_obj: Vase,
+    da: xr.DataArray,
+    summary: HullClimateSummary | None,
+    **plot_kwargs,
+):
+    """Render a TimeHull-derived vase using matplotlib for compatibility."""
+
+    from ._plot_helpers import plt
+
+    # constrained_layout packs the axes during the draw itself; tight_layout
+    # would add a full render pass over every 3D face just to measure bboxes.
+    fig = plt.figure(figsize=plot_kwargs.get("figsize", (6, 4)), constrained_layout=True)
+    ax = fig.add_subplot(111, projection="3d")
+    mappable = _plot_time_hull_vase_on_ax(ax, vase_obj, summary, **plot_kwargs)
+    if mappable is not None:
         fig.colorbar(mappable, ax=ax, label=da.name or "value")
 
-    ax.view_init(elev=plot_kwargs.get("elev", 26), azim=plot_kwargs.get("azim", -58))
-    ax.set_title(plot_kwargs.get("title", "Fire time-hull vase"))
-    plt.tight_layout()
     plt.show()
     return fig
 
 
+# Hull geometry depends only on the fire event and sampling parameters, so the
+# most recent builds are kept per event. Events are keyed by a digest of their
+# perimeters, so an event rebuilt from the same FIRED rows (as the legacy
+# fire_plot/fire_derivative paths do on every call) still hits. Events that
+# cannot be fingerprinted fall back to their object id; the cached hull
+# references its event, which keeps that id from being reused while the entry
+# is alive. Entries are ``[hull, vase]`` lists; the vase is filled in on first
+# request.
+_HULL_CACHE_SIZE = 32
+_HULL_CACHE: "OrderedDict[Tuple[Any, int, int], list]" = OrderedDict()
+
+
+def _event_fingerprint(fired_event: FireEventDaily) -> Optional[Tuple[Any, str]]:
+    """Return a content key for ``fired_event``'s perimeters, or ``None``."""
+
+    try:
+        gdf = fired_event.gdf
+        wkb = gdf.geometry.to_wkb().to_numpy()
+        columns = pd.util.hash_pandas_object(gdf.drop(columns=gdf.geometry.name), index=False)
+        digest = hashlib.blake2b(b"".join(w or b"" for w in wkb), digest_size=16)
+        digest.update(columns.to_numpy().tobytes())
+        key = (fired_event.event_id, digest.hexdigest())
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+def _cached_hull(
+    fired_event: FireEventDaily,
+    n_ring_samples: int,
+    n_theta: int,
+    verbose: bool = False,
+    prepared: PreparedFireEvent | None = None,
+) -> list:
+    """Return the ``[hull, vase]`` cache entry for ``fired_event``, building the hull if needed."""
+
+    fingerprint = _event_fingerprint(fired_event)
+    key = (fingerprint or ("id", id(fired_event)), n_ring_samples, n_theta)
+    cached = None if verbose else _HULL_CACHE.get(key)
+    if cached is not None and (
+        fingerprint is not None or getattr(cached[0], "event", None) is fired_event
+    ):
+        _HULL_CACHE.move_to_end(key)
+        return cached
+
+    hull = compute_time_hull_geometry(
+        fired_event,
+        n_ring_samples=n_ring_samples,
+        n_theta=n_theta,
+        verbose=verbose,
+        prepared=prepared,
+    )
+    entry = [hull, None]
+    _HULL_CACHE[key] = entry
+    _HULL_CACHE.move_to_end(key)
+    while len(_HULL_CACHE) > _HULL_CACHE_SIZE:
+        _HULL_CACHE.popitem(last=False)
+    return entry
+
+
+def _cached_hull_and_vase(
+    fired_event: FireEventDaily,
+    n_ring_samples: int,
+    n_theta: int,
+    verbose: bool = False,
+    prepared: PreparedFireEvent | None = None,
+) -> Tuple[FireHull, Vase]:
+    """Return the time hull and vase for ``fired_event``, reusing prior builds."""
+
+    entry = _cached_hull(fired_event, n_ring_samples, n_theta, verbose=verbose, prepared=prepared)
+    if entry[1] is None:
+        entry[1] = time_hull_to_vase(entry[0])
+    return entry[0], entry[1]
+
+
+# extract() results keyed by the annotated array's id. Each entry holds a weak
+# reference that must still resolve to the same array, and the entry is
+# dropped when that array is freed, so selections/copies that inherit its
+# attrs and arrays that later reuse the id never match.
+_EXTRACTED: Dict[int, Tuple["weakref.ref[xr.DataArray]", Tuple[Any, ...]]] = {}
+
+
+def _remember_extract(annotated: xr.DataArray, sig: Tuple[Any, ...]) -> None:
+    key = id(annotated)
+    ref = weakref.ref(annotated, lambda _ref, key=key: _EXTRACTED.pop(key, None))
+    _EXTRACTED[key] = (ref, sig)
+
+
+def _extracted_sig(da: xr.DataArray) -> Optional[Tuple[Any, ...]]:
+    entry = _EXTRACTED.get(id(da))
+    if entry is None or entry[0]() is not da:
+        return None
+    return entry[1]
+
+
 def extract(
     da: xr.DataArray | VirtualCube | None = None,
     *,
@@ -270,26 +425,61 @@ def extract(
     n_theta: int = 96,
     verbose: bool = False,
 ):
-    """Attach canonical fire hull and climate summaries to a cube."""
+    """Attach canonical fire hull and climate summaries to a cube.
+
+    Returns a shallow copy of the input (a new VirtualCube for VirtualCube
+    inputs) carrying ``fire_time_hull``, ``fire_climate_summary`` and
+    ``vase`` attrs; the input itself is not modified.
+
+    The hull and vase are cached per ``fired_event`` object and sampling
+    parameters, so extracting several climate cubes for one event only
+    rebuilds the climate summary. Re-running ``extract`` on a cube that
+    already carries the results for the same event and parameters returns
+    it unchanged.
+    """
 
     def _op(value: xr.DataArray | VirtualCube):
         base_da, original_obj = _unwrap_fire_cube(value)
-        hull: FireHull = compute_time_hull_geometry(
-            fired_event,
-            n_ring_samples=n_ring_samples,
-            n_theta=n_theta,
-            verbose=verbose,
+        # Only the exact array a previous call returned matches: attrs also
+        # survive selections and copies whose climate samples would differ.
+        # The event is compared by identity.
+        attrs = base_da.attrs
+        prev = _extracted_sig(base_da)
+        if (
+            not verbose
+            and prev is not None
+            and prev[0] is fired_event
+            and prev[1:] == (n_ring_samples, n_theta, date_col)
+            and attrs.get("fire_time_hull") is not None
+            and attrs.get("fire_climate_summary") is not None
+            and attrs.get("vase") is not None
+        ):
+            return original_obj
+
+        # Parse and sort the perimeters once for both the hull and the sampler.
+        prepared = _prepare_event(fired_event, date_col)
+        hull, vase_obj = _cached_hull_and_vase(
+            fired_event, n_ring_samples, n_theta, verbose=verbose, prepared=prepared
         )
         summary: HullClimateSummary = build_inside_outside_climate_samples(
             fired_event,
-            ClimateCube(da=base_da),
+            # Only the sampler sees the rechunked view; attrs go on base_da.
+            ClimateCube(da=_rechunk_for_spatial_sampling(base_da)),
             date_col=date_col,
             verbose=verbose,
+            prepared=prepared,
         )
-        base_da.attrs["fire_time_hull"] = hull
-        base_da.attrs["fire_climate_summary"] = summary
-        base_da.attrs["vase"] = time_hull_to_vase(hull)
-        return original_obj
+        # Annotate a shallow copy so the caller's cube and its attrs are left
+        # untouched; no data is copied or computed.
+        fire_attrs = {"fire_time_hull": hull, "fire_climate_summary": summary, "vase": vase_obj}
+        if isinstance(original_obj, VirtualCube):
+            annotated_obj = original_obj.with_attrs(fire_attrs)
+            annotated = annotated_obj.materialize(cache=True)
+        else:
+            annotated = annotated_obj = base_da.copy(deep=False)
+            annotated.attrs.update(fire_attrs)
+        _remember_extract(annotated, (fired_event, n_ring_samples, n_theta, date_col))
+        return annotated_obj
 
     if da is None:
         return Verb(_op)
@@ -396,11 +586,9 @@ def fire_plot(
         f"Built FireEventDaily id={event.event_id} window {event.t0.date()}–{event.t1.date()} centroid=({event.centroid_lat:.3f}, {event.centroid_lon:.3f})",
     )
 
-    hull = compute_time_hull_geometry(
-        event,
-        n_ring_samples=n_ring_samples,
-        n_theta=n_theta,
-    )
+    # Shares the extract() hull cache, so re-plotting an event (or plotting
+    # after fire_panel/extract) skips the geometry rebuild.
+    hull = _cached_hull(event, n_ring_samples, n_theta)[0]
     log(verbose, "TimeHull metrics:", hull.metrics)
 
     if cube_first:
@@ -419,10 +607,14 @@ def fire_plot(
             allow_synthetic=allow_synthetic,
             verbose=verbose,
         )
-    log(verbose, f"Cube shape {cube.da.shape} dims={cube.da.dims}")
-    if verbose and hasattr(cube, "da"):
-        src = cube.da.attrs.get("source")
-        log(verbose, f"GRIDMET source: {src}")
+    # Same chunk layout extract() hands the sampler: whole planes per day,
+    # time chunks untouched, eager cubes left alone.
+    planes = _rechunk_for_spatial_sampling(cube.da)
+    if planes is not cube.da:
+        cube = ClimateCube(da=planes)
+    if verbose:
+        log(verbose, f"Cube shape {cube.da.shape} dims={cube.da.dims}")
+        log(verbose, f"GRIDMET source: {cube.da.attrs.get('source')}")
 
     def _nan_guard(val):
         check = val.isnull().all()
@@ -477,37 +669,34 @@ def fire_plot(
     if hasattr(hull, "attach_environment"):
         hull = hull.attach_environment(cube.da, variables=[climate_variable])
 
+    # Colour limits and the debug summary only need the (days,) per-day means;
+    # filter NaNs once so every percentile below runs on the plain path
+    # instead of nanpercentile's masked copy per call.
+    day_vals = np.asarray(summary.per_day_mean.values, dtype=float)
+    finite = day_vals[np.isfinite(day_vals)]
+
     if color_limits is None:
-        vals = summary.per_day_mean.values
-        if vals.size == 0:
+        if finite.size == 0:
             color_limits = (0.0, 1.0)
         else:
-            color_limits = (
-                float(np.nanpercentile(vals, 2)),
-                float(np.nanpercentile(vals, 98)),
-            )
-        if not np.isfinite(color_limits[0]) or not np.isfinite(color_limits[1]) or color_limits[1] <= color_limits[0]:
-            finite = vals[np.isfinite(vals)]
-            if finite.size:
-                vmin = float(np.nanmin(finite))
-                vmax = float(np.nanmax(finite))
+            vmin, vmax = (float(q) for q in np.percentile(finite, [2, 98]))
+            if not vmax > vmin:
+                vmin, vmax = float(finite.min()), float(finite.max())
                 if vmax <= vmin:
                     vmax = vmin + 1e-9
-                color_limits = (vmin, vmax)
+            color_limits = (vmin, vmax)
 
     if debug_scalars:
-        vals = np.asarray(summary.per_day_mean.values, dtype=float)
-        finite = vals[np.isfinite(vals)]
         pct = [1, 5, 25, 50, 75, 95, 99]
-        pct_vals = np.nanpercentile(finite, pct).tolist() if finite.size else [float("nan")] * len(pct)
+        pct_vals = np.percentile(finite, pct).tolist() if finite.size else [float("nan")] * len(pct)
         log(
             True,
             "fire_plot scalar summary:",
             {
-                "per_day_mean_len": int(vals.size),
-                "nan_count": int(np.isnan(vals).sum()),
-                "min": float(np.nanmin(finite)) if finite.size else float("nan"),
-                "max": float(np.nanmax(finite)) if finite.size else float("nan"),
+                "per_day_mean_len": int(day_vals.size),
+                "nan_count": int(day_vals.size - finite.size),
+                "min": float(finite.min()) if finite.size else float("nan"),
+                "max": float(finite.max()) if finite.size else float("nan"),
                 "percentiles": dict(zip([str(p) for p in pct], pct_vals)),
             },
         )
@@ -598,12 +787,100 @@ def fire_panel(
 
     fig_hist = None
     if show_hist:
+        import matplotlib.pyplot as plt
+
         plot_inside_outside_hist(results["summary"], bins=bins, var_label=climate_variable)
         fig_hist = plt.gcf()
 
     return results, results["fig_hull"], fig_hist
 
 
+def fire_panel_many(
+    cube_factory: Callable[[FireEventDaily], xr.DataArray | VirtualCube],
+    events: Iterable[FireEventDaily],
+    *,
+    date_col: str = "date",
+    n_ring_samples: int = 100,
+    n_theta: int = 96,
+    bins: int = 40,
+    var_label: str | None = None,
+    figsize: tuple[float, float] = (11, 4),
+    save_path: str | None = None,
+    verbose: bool = False,
+    **plot_kwargs,
+) -> Iterator[tuple[FireEventDaily, xr.DataArray | VirtualCube, Any]]:
+    """Draw matplotlib vase + histogram panels for many fire events.
+
+    One figure with a 3D vase axis, a colorbar axis and a histogram axis is
+    built up front and cleared between events, so the cost of setting up the
+    3D axes is paid once for the whole batch rather than once per event.
+
+    Parameters
+    ----------
+    cube_factory
+        Callable returning the climate cube for a fire event.
+    events
+        Fire events to render, in order.
+    date_col, n_ring_samples, n_theta, verbose
+        Forwarded to :func:`extract`.
+    bins, var_label
+        Histogram options; ``var_label`` defaults to the cube name.
+    figsize
+        Size of the shared figure.
+    save_path
+        Optional format string such as ``"panel_{event_id}.png"``; when given
+        the figure is saved after each event is drawn. ``{index}`` is also
+        available.
+    **plot_kwargs
+        Extra vase options (``edgecolor``, ``elev``, ``azim``, ``title``).
+
+    Yields
+    ------
+    tuple
+        ``(fired_event, cube, fig)`` for each event. ``cube`` carries the
+        attrs added by :func:`extract`. ``fig`` is the shared figure and is
+        redrawn on the next iteration, so save or copy it before advancing.
+    """
+
+    from ._plot_helpers import plt
+
+    fig = plt.figure(figsize=figsize, constrained_layout=True)
+    grid = fig.add_gridspec(1, 3, width_ratios=[1.0, 0.04, 1.0])
+    ax3d = fig.add_subplot(grid[0, 0], projection="3d")
+    cax = fig.add_subplot(grid[0, 1])
+    ax_hist = fig.add_subplot(grid[0, 2])
+
+    for index, fired_event in enumerate(events):
+        ax3d.cla()
+        cax.cla()
+        ax_hist.cla()
+
+        cube = extract(
+            cube_factory(fired_event),
+            fired_event=fired_event,
+            date_col=date_col,
+            n_ring_samples=n_ring_samples,
+            n_theta=n_theta,
+            verbose=verbose,
+        )
+        base_da, _ = _unwrap_fire_cube(cube)
+        summary = base_da.attrs["fire_climate_summary"]
+        label = var_label or base_da.name or "value"
+
+        mappable = _plot_time_hull_vase_on_ax(ax3d, base_da.attrs["vase"], summary, **plot_kwargs)
+        if mappable is not None:
+            fig.colorbar(mappable, cax=cax, label=label)
+            cax.set_visible(True)
+        else:
+            cax.set_visible(False)
+        _inside_outside_hist_on_ax(ax_hist, summary, bins=bins, var_label=label)
+
+        if save_path is not None:
+            event_id = getattr(fired_event, "event_id", index)
+            fig.savefig(save_path.format(event_id=event_id, index=index))
+        yield fired_event, cube, fig
+
+
 def fire_vase_panel(
     da: xr.DataArray | None = None,
     *,
@@ -775,6 +1052,7 @@ def fire_derivative(
     n_ring_samples: int = 200,
     n_theta: int = 296,
     save_prefix: Optional[str] = None,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
     Fire derivative hull visualization verb.
@@ -809,6 +1087,9 @@ def fire_derivative(
         Optional filename stem to save a PNG/PDF of the derivative hull
         using Plotly static image export (requires `kaleido`).
 
+    verbose
+        Print event and hull-metric diagnostics. Silent by default.
+
     Returns
     -------
     dict
@@ -823,24 +1104,22 @@ def fire_derivative(
         raise ValueError("order must be 1 (speed) or 2 (acceleration).")
 
     # 1) Event geometry
-    event = build_fire_event(fired_daily, event_id)
-    print(
-        f"Built FireEventDaily for id={event_id}, "
-        f"t0={event.t0.date()}, t1={event.t1.date()}, "
-        f"centroid=({event.centroid_lat:.3f}, {event.centroid_lon:.3f})"
-    )
+    event = build_fire_event_daily(fired_daily=fired_daily, event_id=event_id)
+    if verbose:
+        log(
+            verbose,
+            f"Built FireEventDaily for id={event_id}, "
+            f"t0={event.t0.date()}, t1={event.t1.date()}, "
+            f"centroid=({event.centroid_lat:.3f}, {event.centroid_lon:.3f})",
+        )
 
     # 2) Base time-hull geometry in km,km,days
-    base_hull = compute_time_hull_geometry(
-        event,
-        n_ring_samples=n_ring_samples,
-        n_theta=n_theta,
-    )
-    print("Base TimeHull metrics:", base_hull.metrics)
+    base_hull = _cached_hull(event, n_ring_samples, n_theta)[0]
+    log(verbose, "Base TimeHull metrics:", base_hull.metrics)
 
     # 3) Derivative hull (speed or acceleration)
     deriv_hull = compute_derivative_hull(base_hull, order=order)
-    print("Derivative TimeHull metrics:", deriv_hull.metrics)
+    log(verbose, "Derivative TimeHull metrics:", deriv_hull.metrics)
 
     # 4) Plot the derivative hull
     fig = plot_derivative_hull(
@@ -855,9 +1134,9 @@ def fire_derivative(
         try:
             fig.write_image(f"{save_prefix}.png", scale=2)
             fig.write_image(f"{save_prefix}.pdf")
-            print(f"Saved derivative hull figure to {save_prefix}.png/.pdf")
+            log(verbose, f"Saved derivative hull figure to {save_prefix}.png/.pdf")
         except Exception as e:
-            print(
+            warnings.warn(
                 "Could not write PNG/PDF for derivative hull. "
                 "Make sure `kaleido` is installed.\n"
                 f"Error: {e}"
@@ -2,19 +2,57 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 import xarray as xr
 
 
+def _reshape_stack(obj: xr.DataArray, dims: Sequence[str], new_dim: str) -> xr.DataArray | None:
+    """Merge ``dims`` of ``obj`` into ``new_dim`` with a plain array reshape.
+
+    Produces the same layout as ``obj.stack({new_dim: dims})`` (remaining dims
+    first, ``dims`` raveled in C order) but without building a pandas
+    MultiIndex, so dask-backed data stays a graph-level reshape. Coordinates
+    defined on a subset of ``dims`` are kept as plain 1-D coordinates along
+    ``new_dim``. Returns ``None`` when a coordinate mixes ``dims`` with other
+    dimensions and the caller should fall back to ``stack``.
+    """
+
+    stacked = set(dims)
+    lead = [dim for dim in obj.dims if dim not in stacked]
+    arr = obj.transpose(*lead, *dims)
+    data = arr.data.reshape(arr.shape[: len(lead)] + (-1,))
+
+    coords = {}
+    for name, coord in obj.coords.items():
+        coord_dims = set(coord.dims)
+        if not coord_dims & stacked:
+            coords[name] = coord
+        elif coord_dims <= stacked:
+            full = coord.variable.set_dims({dim: obj.sizes[dim] for dim in dims})
+            coords[name] = (new_dim, full.values.reshape(-1), coord.attrs)
+        else:
+            return None
+
+    return xr.DataArray(data, dims=(*lead, new_dim), coords=coords, name=obj.name, attrs=obj.attrs)
+
+
 def flatten_space(
     time_dim: str = "time",
     y_dim: str = "y",
     x_dim: str = "x",
     new_dim: str = "pixel",
+    keep_index: bool = False,
 ):
     """Flatten spatial dimensions (``y`` and ``x``) into a ``pixel`` dimension.
 
     This breaks the cube layout (time, y, x) -> (time, pixel) which is useful for
     time-series or ML preprocessing but incompatible with Lexcube visualizations.
+
+    By default DataArrays are reshaped directly and ``y``/``x`` are carried as
+    plain coordinates along ``new_dim``. Pass ``keep_index=True`` to build the
+    ``(y, x)`` MultiIndex of :meth:`xarray.DataArray.stack` so the result can be
+    ``unstack``-ed back into a cube.
     """
 
     def _op(obj: xr.Dataset | xr.DataArray) -> xr.Dataset | xr.DataArray:
@@ -23,18 +61,24 @@ def flatten_space(
             raise ValueError(
                 f"flatten_space requires dims {y_dim!r} and {x_dim!r}; missing {missing}"
             )
+        if not keep_index and isinstance(obj, xr.DataArray):
+            flat = _reshape_stack(obj, (y_dim, x_dim), new_dim)
+            if flat is not None:
+                return flat
         return obj.stack({new_dim: (y_dim, x_dim)})
 
     return _op
 
 
-def flatten_cube(time_dim: str = "time", sample_dim: str = "sample"):
+def flatten_cube(time_dim: str = "time", sample_dim: str = "sample", keep_index: bool = False):
     """Flatten all non-time dimensions into a single ``sample`` dimension.
 
     This is an experimental modeling helper that reshapes the cube into (time,
     sample) so that each "sample" row can be consumed by ML tooling. It
     intentionally discards the cube layout and should not be passed to
-    :func:`cubedynamics.verbs.show_cube_lexcube` afterwards.
+    :func:`cubedynamics.verbs.show_cube_lexcube` afterwards. As with
+    :func:`flatten_space`, ``keep_index=True`` builds a stacked MultiIndex
+    instead of plain per-sample coordinates.
     """
 
     def _op(obj: xr.Dataset | xr.DataArray) -> xr.Dataset | xr.DataArray:
@@ -43,6 +87,10 @@ def flatten_cube(time_dim: str = "time", sample_dim: str = "sample"):
         other_dims = tuple(dim for dim in obj.dims if dim != time_dim)
         if not other_dims:
             return obj.rename({time_dim: sample_dim})
+        if not keep_index and isinstance(obj, xr.DataArray):
+            flat = _reshape_stack(obj, other_dims, sample_dim)
+            if flat is not None:
+                return flat
         return obj.stack({sample_dim: other_dims})
 
     return _op
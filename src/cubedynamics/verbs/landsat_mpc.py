@@ -21,18 +21,25 @@ Example
 from __future__ import annotations
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Mapping, Sequence
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Iterable
 
 import numpy as np
 import planetary_computer as pc
+import rasterio
 import rioxarray as rxr
 import xarray as xr
 from pystac_client import Client
 
 from ..piping import Verb
 
+try:  # Optional: stacks STAC items into one lazy (time, band, y, x) array.
+    import stackstac as _stackstac
+except ImportError:  # pragma: no cover - stackstac is optional
+    _stackstac = None
+
 MPC_STAC_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 
 BAND_MAP: Mapping[str, str] = {
@@ -40,6 +47,34 @@ BAND_MAP: Mapping[str, str] = {
     "nir": "SR_B5",
 }
 
+# Native ground sampling distance of the Collection 2 surface reflectance bands.
+_LANDSAT_RESOLUTION_M = 30
+
+# GDAL options for remote COG range reads: only probe .tif/.ovr URLs and
+# multiplex requests over HTTP/2.
+_GDAL_HTTP_ENV: Mapping[str, str] = {
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif,.TIF,.ovr",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+}
+# Opening a COG should not list its "directory" and should cache the header.
+_GDAL_OPEN_ENV: Mapping[str, str] = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "536870912",
+}
+# COG header fetches are latency-bound and GDAL releases the GIL, so the
+# rioxarray fallback opens assets on a thread pool of this size.
+_MAX_OPEN_WORKERS = 16
+
+
+@lru_cache(maxsize=4)
+def _open_catalog(stac_url: str) -> Client:
+    """Open (once per URL) the STAC client; repeated streams skip the landing-page fetch."""
+
+    return Client.open(stac_url)
+
 
 def pipeable(func):
     """Decorator that makes a verb callable or pipe-friendly.
@@ -67,18 +102,23 @@ def landsat8_mpc_stream(
     max_cloud_cover: float = 50,
     chunks_xy: Mapping[str, int] | None = None,
     stac_url: str = MPC_STAC_URL,
+    max_items: int | None = None,
 ) -> xr.DataArray:
     """Stream Landsat-8 Collection 2 Level-2 scenes from Microsoft Planetary Computer.
 
     The stream lazily opens surface reflectance COGs (SR_B4 for red and SR_B5 for
     near-infrared by default) and stacks them into a cube with dimensions
     ``(time, band, y, x)``. Data are returned as ``float32`` and remain dask-backed
-    so downstream computations trigger IO as needed.
+    so downstream computations trigger IO as needed. When :mod:`stackstac` is
+    installed the scenes are stacked in one pass; otherwise each asset is opened
+    with :func:`rioxarray.open_rasterio` and concatenated.
 
     Parameters
     ----------
     bbox
         Bounding box ``[minx, miny, maxx, maxy]`` in lon/lat for the STAC search.
+        The cube is cropped to this box, on a 30 m grid in the earliest
+        scene's CRS aligned to that scene's pixels.
     start, end
         ISO date strings delimiting the search interval.
     band_aliases
@@ -87,9 +127,15 @@ def landsat8_mpc_stream(
         Maximum allowable ``eo:cloud_cover`` percentage for candidate scenes.
     chunks_xy
         Optional mapping for dask chunk sizes along x/y passed to
-        :func:`rioxarray.open_rasterio`. Defaults to ``{"x": 1024, "y": 1024}``.
+        :func:`stackstac.stack` or :func:`rioxarray.open_rasterio`. Defaults to
+        ``{"x": 512, "y": 512}``, matching the internal tiling of Landsat COGs so
+        chunk reads line up with GDAL range requests.
     stac_url
         STAC API endpoint. Defaults to the MPC STAC service.
+    max_items
+        Optional cap on the number of STAC items fetched. Items are requested
+        in ascending date order, so the cap keeps the earliest scenes and stops
+        paging once it is reached.
 
     Returns
     -------
@@ -99,58 +145,234 @@ def landsat8_mpc_stream(
     """
 
     if chunks_xy is None:
-        chunks_xy = {"x": 1024, "y": 1024}
+        chunks_xy = {"x": 512, "y": 512}
 
-    catalog = Client.open(stac_url)
+    catalog = _open_catalog(stac_url)
 
     search = catalog.search(
         collections=["landsat-8-c2-l2"],
         bbox=bbox,
         datetime=f"{start}/{end}",
         query={"eo:cloud_cover": {"lt": max_cloud_cover}},
+        sortby=[{"field": "properties.datetime", "direction": "asc"}],
+        max_items=max_items,
     )
 
-    items = list(search.get_items())
-    if not items:
+    aliases = list(band_aliases)
+    assets = [BAND_MAP[alias] for alias in aliases]
+    # Items are paged lazily; scenes missing a requested band are dropped
+    # before signing. Each item is freshly parsed from the search page, so it
+    # is signed in place rather than deep-copied by ``pc.sign``.
+    n_items = 0
+    signed_items = []
+    for item in search.items():
+        n_items += 1
+        if all(asset in item.assets for asset in assets):
+            pc.sign_inplace(item)
+            signed_items.append(item)
+
+    if not n_items:
         raise RuntimeError("No Landsat-8 items found for this query.")
+    if not signed_items:
+        raise RuntimeError("No scenes could be stacked (missing assets?).")
 
-    signed_items = [pc.sign(item) for item in items]
-    scene_das: list[xr.DataArray] = []
+    if _stackstac is not None:
+        return _stack_items_stackstac(signed_items, aliases, chunks_xy, bbox)
+    return _stack_items_rioxarray(signed_items, aliases, chunks_xy, bbox)
 
-    for item in signed_items:
-        band_das: list[xr.DataArray] = []
-        skip_item = False
 
-        for alias in band_aliases:
-            asset_id = BAND_MAP[alias]
-            asset = item.assets.get(asset_id)
-            if asset is None:
-                skip_item = True
-                break
+def _stack_items_stackstac(
+    items: Sequence,
+    band_aliases: Iterable[str],
+    chunks_xy: Mapping[str, int],
+    bbox: Sequence[float],
+) -> xr.DataArray:
+    """Stack ``items`` with a single :func:`stackstac.stack` call.
+
+    stackstac builds the ``(time, band, y, x)`` dask graph directly from the
+    item list (one chunk per asset tile, sorted by date), avoiding the per-asset
+    open, ``xr.concat`` and ``sortby`` of :func:`_stack_items_rioxarray`.
+    Every item must carry all requested assets. The cube covers ``bbox`` on
+    the grid of :func:`_bbox_grid` (earliest item's CRS and pixel lattice,
+    30 m, centre coordinates), exactly as :func:`_stack_items_rioxarray`
+    does, so bboxes spanning several UTM zones still stack and both paths
+    return the same extent.
+    """
 
-            href = asset.href
-            da = rxr.open_rasterio(href, masked=True, chunks=chunks_xy)
-            if "band" in da.dims and da.sizes.get("band", 1) == 1:
-                da = da.squeeze("band", drop=True)
-            da = da.expand_dims(band=[alias])
-            band_das.append(da)
+    aliases = list(band_aliases)
+    assets = [BAND_MAP[alias] for alias in aliases]
+    epsg = _item_epsg(items[0])
+    if epsg is not None:
+        bounds, _, _ = _bbox_grid(bbox, f"EPSG:{epsg}", _item_anchor(items[0], assets[0]))
+        extent = {"bounds": bounds, "snap_bounds": False}
+    else:
+        extent = {"bounds_latlon": tuple(bbox)}
+    cube = _stackstac.stack(
+        items,
+        assets=assets,
+        epsg=epsg,
+        resolution=_LANDSAT_RESOLUTION_M,
+        xy_coords="center",
+        **extent,
+        chunksize=(chunks_xy.get("y", 512), chunks_xy.get("x", 512)),
+        dtype="float32",
+        fill_value=np.float32(np.nan),
+        rescale=False,
+        sortby_date="asc",
+        # stackstac already skips directory listings on open; layer the HTTP
+        # options over its defaults so they also apply to the dask reads.
+        gdal_env=_stackstac.DEFAULT_GDAL_ENV.updated(always=dict(_GDAL_HTTP_ENV)),
+    )
+    return cube.assign_coords(band=aliases)
 
-        if skip_item or not band_das:
-            continue
 
-        scene = xr.concat(band_das, dim="band")
-        dt = np.datetime64(item.properties["datetime"])
-        scene = scene.expand_dims(time=[dt])
-        scene_das.append(scene)
+def _item_epsg(item) -> int | None:
+    """Return the EPSG code from an item's projection extension, if present."""
+
+    props = item.properties
+    epsg = props.get("proj:epsg")
+    if epsg is None:
+        code = props.get("proj:code") or ""
+        if code.upper().startswith("EPSG:"):
+            epsg = code.split(":", 1)[1]
+    return int(epsg) if epsg is not None else None
+
+
+def _item_anchor(item, asset: str) -> tuple[float, float]:
+    """Return the top-left pixel corner of ``asset`` from ``proj:transform``.
+
+    Falls back to the item-level transform, then to the CRS origin, so the
+    output grid is always aligned to a fixed lattice.
+    """
+
+    fields = getattr(item.assets.get(asset), "extra_fields", None) or {}
+    transform = fields.get("proj:transform") or item.properties.get("proj:transform")
+    if not transform:
+        return 0.0, 0.0
+    return float(transform[2]), float(transform[5])
+
+
+def _bbox_grid(
+    bbox: Sequence[float], crs, anchor: tuple[float, float], res: float = _LANDSAT_RESOLUTION_M
+) -> tuple[tuple[float, float, float, float], np.ndarray, np.ndarray]:
+    """Return ``(bounds, x, y)`` of the ``res`` grid covering lon/lat ``bbox`` in ``crs``.
+
+    The projected bbox is snapped outward onto the pixel lattice whose corner
+    sits at ``anchor``; ``x``/``y`` are pixel centres (``y`` descending).
+    """
+
+    from rasterio.warp import transform_bounds
+
+    minx, miny, maxx, maxy = transform_bounds("EPSG:4326", crs, *bbox)
+    ax, ay = anchor
+    left = ax + math.floor((minx - ax) / res) * res
+    right = ax + math.ceil((maxx - ax) / res) * res
+    bottom = ay + math.floor((miny - ay) / res) * res
+    top = ay + math.ceil((maxy - ay) / res) * res
+    x = left + res * (np.arange(round((right - left) / res)) + 0.5)
+    y = top - res * (np.arange(round((top - bottom) / res)) + 0.5)
+    return (left, bottom, right, top), x, y
+
+
+def _stack_items_rioxarray(
+    items: Sequence,
+    band_aliases: Iterable[str],
+    chunks_xy: Mapping[str, int],
+    bbox: Sequence[float],
+) -> xr.DataArray:
+    """Stack ``items`` by opening each asset with :func:`rioxarray.open_rasterio`.
+
+    Assets are opened concurrently on up to ``_MAX_OPEN_WORKERS`` threads, each
+    inside its own GDAL environment, then regrouped per item in date order.
+    Every scene is then placed on the :func:`_bbox_grid` of ``bbox`` (earliest
+    scene's CRS and pixel lattice, 30 m), so the result is cropped to the query
+    bbox and matches :func:`_stack_items_stackstac`. Scenes in that CRS and on
+    that lattice are aligned lazily with a nearest ``reindex`` (NaN outside
+    their footprint); only scenes in another CRS are reprojected, which
+    rioxarray does eagerly.
+    """
+
+    aliases = list(band_aliases)
+    # Items missing a requested band are skipped; every remaining
+    # (item, alias) asset is opened concurrently.
+    tasks = []
+    for i, item in enumerate(items):
+        if not all(BAND_MAP[alias] in item.assets for alias in aliases):
+            continue
+        for alias in aliases:
+            tasks.append((i, alias, item.assets[BAND_MAP[alias]].href))
+
+    def _open_asset(task: tuple[int, str, str]) -> tuple[int, str, xr.DataArray]:
+        i, alias, href = task
+        # rasterio.Env is thread-local, so each worker enters its own.
+        with rasterio.Env(**_GDAL_HTTP_ENV, **_GDAL_OPEN_ENV):
+            # Cast per asset so concat and alignment run at float32 rather
+            # than the float64 that masked=True produces.
+            da = rxr.open_rasterio(href, masked=True, chunks=chunks_xy).astype("float32", copy=False)
+        if "band" in da.dims and da.sizes.get("band", 1) == 1:
+            da = da.squeeze("band", drop=True)
+        return i, alias, da.expand_dims(band=[alias])
+
+    opened: dict[int, dict[str, xr.DataArray]] = {}
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(_MAX_OPEN_WORKERS, len(tasks))) as pool:
+            for i, alias, da in pool.map(_open_asset, tasks):
+                opened.setdefault(i, {})[alias] = da
+
+    scene_das: list[tuple[np.datetime64, xr.DataArray]] = []
+    for i, band_das in opened.items():
+        scene = xr.concat([band_das[alias] for alias in aliases], dim="band")
+        scene_das.append((np.datetime64(items[i].properties["datetime"]), scene))
 
     if not scene_das:
         raise RuntimeError("No scenes could be stacked (missing assets?).")
 
-    cube = xr.concat(scene_das, dim="time", join="outer").sortby("time")
-    cube = cube.astype("float32")
+    # Items arrive date-sorted from the search; a stable sort of the scene list
+    # keeps that guarantee without a sortby reindex over the stacked graph.
+    scene_das.sort(key=lambda pair: pair[0])
+
+    reference = scene_das[0][1]
+    crs = reference.rio.crs
+    if crs is None:
+        # Without a CRS the bbox cannot be projected; keep the union of the
+        # scene footprints.
+        scenes = [scene.expand_dims(time=[dt]) for dt, scene in scene_das]
+        return xr.concat(scenes, dim="time", join="outer")
+
+    res = float(_LANDSAT_RESOLUTION_M)
+    ref_transform = reference.rio.transform()
+    anchor = (ref_transform.c, ref_transform.f)
+    _, grid_x, grid_y = _bbox_grid(bbox, crs, anchor, res)
+
+    scenes = []
+    for dt, scene in scene_das:
+        if scene.rio.crs == crs and _on_lattice(scene, anchor, res):
+            # Lazy: reindexing a dask array only rewrites the graph.
+            scene = scene.reindex(x=grid_x, y=grid_y, method="nearest", tolerance=res / 4)
+        else:
+            grid = xr.DataArray(
+                np.empty((grid_y.size, grid_x.size), dtype="float32"),
+                coords={"y": grid_y, "x": grid_x},
+                dims=("y", "x"),
+            ).rio.write_crs(crs)
+            scene = scene.rio.reproject_match(grid, nodata=np.nan)
+        scene = scene.assign_coords(x=grid_x, y=grid_y).chunk(dict(chunks_xy))
+        scenes.append(scene.expand_dims(time=[dt]))
+
+    cube = xr.concat(scenes, dim="time", join="override")
     return cube
 
 
+def _on_lattice(scene: xr.DataArray, anchor: tuple[float, float], res: float) -> bool:
+    """Return True if ``scene`` has ``res`` pixels aligned to the lattice at ``anchor``."""
+
+    t = scene.rio.transform()
+    if not (math.isclose(t.a, res) and math.isclose(t.e, -res)):
+        return False
+    offsets = ((t.c - anchor[0]) / res, (t.f - anchor[1]) / res)
+    return all(math.isclose(o, round(o), abs_tol=1e-6) for o in offsets)
+
+
 @pipeable
 def landsat8_mpc(
     value,
@@ -162,6 +384,7 @@ def landsat8_mpc(
     max_cloud_cover=50,
     chunks_xy=None,
     stac_url="https://planetarycomputer.microsoft.com/api/stac/v1",
+    max_items=None,
 ):
     """
     Landsat 8 (MPC) streaming verb for cubedynamics.
@@ -181,9 +404,11 @@ def landsat8_mpc(
     max_cloud_cover : int
         Maximum cloud cover percentage
     chunks_xy : dict or None
-        Dask spatial chunking, e.g. {"x": 1024, "y": 1024}
+        Dask spatial chunking, e.g. {"x": 512, "y": 512} (the default)
     stac_url : str
         STAC endpoint, defaults to the Microsoft Planetary Computer.
+    max_items : int or None
+        Cap on the number of (earliest) STAC items fetched.
 
     Returns
     -------
@@ -198,6 +423,7 @@ def landsat8_mpc(
         max_cloud_cover=max_cloud_cover,
         chunks_xy=chunks_xy,
         stac_url=stac_url,
+        max_items=max_items,
     )
 
 
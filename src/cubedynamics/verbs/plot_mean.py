@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import xarray as xr
-from IPython.display import display
 
 from cubedynamics.plotting.cube_plot import CubePlot
 from cubedynamics.piping import Verb, _attach_viewer
@@ -63,6 +62,8 @@ def plot_mean(
             **options,
         )
 
+        from IPython.display import display
+
         display(mean_plot)
         display(var_plot)
         _attach_viewer(value, mean_plot)
@@ -39,14 +39,19 @@ def show_cube_lexcube(
 def _prepare_lexcube_cube(cube: xr.DataArray) -> xr.DataArray:
     """Validate and normalize a cube before handing it to Lexcube."""
 
-    expected_dims = {TIME_DIM, Y_DIM, X_DIM}
-    if cube.ndim != 3 or set(cube.dims) != expected_dims:
-        raise ValueError(
-            "Lexcube visualization requires dims exactly (time, y, x); "
-            f"received dims {cube.dims}"
-        )
-
-    prepared = cube.transpose(TIME_DIM, Y_DIM, X_DIM).copy(deep=False)
+    message = (
+        "Lexcube visualization requires dims exactly (time, y, x); "
+        f"received dims {cube.dims}"
+    )
+    if cube.ndim != 3:
+        raise ValueError(message)
+    # transpose validates the dim names while reordering them.
+    if cube.dims != (TIME_DIM, Y_DIM, X_DIM):
+        try:
+            cube = cube.transpose(TIME_DIM, Y_DIM, X_DIM)
+        except ValueError:
+            raise ValueError(message) from None
+    prepared = cube.copy(deep=False)
 
     # Lexcube treats integer time values in [0, 365] as day-of-year data and
     # reads encoding["source"] while doing that detection. In-memory xarray
@@ -24,6 +24,24 @@ except ImportError:  # pragma: no cover
     da = None
 
 
+@pytest.fixture(autouse=True)
+def _empty_fire_hull_cache():
+    """Start every test with an empty fire hull cache.
+
+    Hulls are cached by perimeter content, so equal synthetic events (or fake
+    hulls patched in by a test) would otherwise leak between tests. The module
+    is looked up rather than imported to keep import-laziness tests honest.
+    """
+
+    fire = sys.modules.get("cubedynamics.verbs.fire")
+    if fire is not None:
+        fire._HULL_CACHE.clear()
+    yield
+    fire = sys.modules.get("cubedynamics.verbs.fire")
+    if fire is not None:
+        fire._HULL_CACHE.clear()
+
+
 @pytest.fixture
 def tiny_cube() -> xr.DataArray:
     """Small synthetic cube for testing with dims (time=6, y=2, x=3)."""
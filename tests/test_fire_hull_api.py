@@ -97,3 +97,21 @@ def test_public_fire_verbs_bind_to_canonical_fire_module():
     assert v.vase is fire_verbs.vase
     assert v.fire_plot is fire_verbs.fire_plot
     assert v.fire_panel is fire_verbs.fire_panel
+
+
+def test_fire_derivative_is_silent_unless_verbose(monkeypatch, capsys):
+    import plotly.graph_objects as go
+
+    monkeypatch.setattr(go.Figure, "show", lambda self, *a, **k: None)
+    event = FireEventDaily.example()
+
+    out = fire_verbs.fire_derivative(
+        fired_daily=event.gdf, event_id=event.event_id, n_ring_samples=16, n_theta=12
+    )
+    assert out["derivative_hull"].metrics["field_name"] == "speed_km_per_day"
+    assert capsys.readouterr().out == ""
+
+    fire_verbs.fire_derivative(
+        fired_daily=event.gdf, event_id=event.event_id, n_ring_samples=16, n_theta=12, verbose=True
+    )
+    assert "Derivative TimeHull metrics" in capsys.readouterr().out
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 import geopandas as gpd
 import shapely.geometry as geom
 import xarray as xr
@@ -74,6 +75,111 @@ def test_sample_inside_outside_counts():
     assert summary.values_outside.size > 1
 
 
+def test_sample_inside_outside_vectorized_cells_match_scalar_loop(monkeypatch):
+    import cubedynamics.fire_time_hull as fth
+
+    if fth._shapely_box is None:
+        pytest.skip("requires shapely>=2")
+    event = _synthetic_event()
+    subset = _grid_like_cube().sel(time=slice(event.t0, event.t1))
+
+    vectorized = sample_inside_outside(event, subset)
+    monkeypatch.setattr(fth, "_shapely_box", None)
+    scalar = sample_inside_outside(event, subset)
+
+    np.testing.assert_array_equal(vectorized.values_inside, scalar.values_inside)
+    np.testing.assert_array_equal(vectorized.values_outside, scalar.values_outside)
+    pd.testing.assert_series_equal(vectorized.per_day_mean, scalar.per_day_mean)
+
+def test_sample_inside_outside_vectorized_centers_match_scalar_loop(monkeypatch):
+    import cubedynamics.fire_time_hull as fth
+
+    if fth._shapely_points is None:
+        pytest.skip("requires shapely>=2")
+    event = _synthetic_event()
+    # A single column has no x spacing, so every day goes through the
+    # pixel-centre path.
+    subset = _grid_like_cube().sel(time=slice(event.t0, event.t1)).isel(x=[2])
+
+    vectorized = sample_inside_outside(event, subset)
+    monkeypatch.setattr(fth, "_shapely_points", None)
+    scalar = sample_inside_outside(event, subset)
+
+    assert vectorized.values_inside.size
+    np.testing.assert_array_equal(vectorized.values_inside, scalar.values_inside)
+    np.testing.assert_array_equal(vectorized.values_outside, scalar.values_outside)
+
+def test_sample_inside_outside_fast_handles_descending_y():
+    pytest.importorskip("rasterio")
+    event = _synthetic_event()
+    subset = _grid_like_cube().sel(time=slice(event.t0, event.t1))
+
+    ascending = sample_inside_outside(event, subset, fast=True)
+    descending = sample_inside_outside(event, subset.isel(y=slice(None, None, -1)), fast=True)
+
+    assert ascending.values_inside.size
+    np.testing.assert_array_equal(np.sort(ascending.values_inside), np.sort(descending.values_inside))
+    pd.testing.assert_series_equal(ascending.per_day_mean, descending.per_day_mean)
+
+def test_sample_inside_outside_classifies_each_perimeter_once(monkeypatch):
+    import cubedynamics.fire_time_hull as fth
+
+    calls = []
+    original = fth.PreparedFireEvent.polygon
+
+    def counting(self, crs, row):
+        calls.append(row)
+        return original(self, crs, row)
+
+    monkeypatch.setattr(fth.PreparedFireEvent, "polygon", counting)
+    event = _synthetic_event()
+    da = _grid_like_cube()
+
+    summary = sample_inside_outside(event, da)
+
+    # Days after the last perimeter reuse its mask; the day before the fire is skipped.
+    assert calls == [0, 1, 2]
+    assert summary.per_day_mean.size == da.sizes["time"] - 1
+
+
+def test_sample_inside_outside_dask_matches_eager():
+    pytest.importorskip("dask.array")
+    event = _synthetic_event()
+    da = _grid_like_cube()
+
+    eager = sample_inside_outside(event, da)
+    lazy = sample_inside_outside(event, da.chunk({"time": 1}))
+
+    np.testing.assert_array_equal(lazy.values_inside, eager.values_inside)
+    np.testing.assert_array_equal(lazy.values_outside, eager.values_outside)
+    pd.testing.assert_series_equal(lazy.per_day_mean, eager.per_day_mean)
+
+def test_clean_event_daily_rows_vectorized_matches_scalar_loop(monkeypatch):
+    import cubedynamics.fire_time_hull as fth
+
+    if fth._shapely_equals is None:
+        pytest.skip("requires shapely>=2")
+    geoms = [
+        geom.box(0, 0, 1, 1),
+        geom.box(0, 0, 1, 1),
+        None,
+        geom.Polygon(),
+        geom.MultiPolygon([geom.box(0, 0, 1, 1), geom.box(0.5, 0, 2, 1)]),
+        geom.box(0, 0, 2, 1),
+        geom.box(0, 0, 3, 3),
+    ]
+    gdf = gpd.GeoDataFrame(
+        {"id": 1, "date": pd.date_range("2020-07-01", periods=len(geoms)), "geometry": geoms},
+        crs="EPSG:4326",
+    )
+
+    vectorized = fth.clean_event_daily_rows(gdf, 1)
+    monkeypatch.setattr(fth, "_shapely_equals", None)
+    scalar = fth.clean_event_daily_rows(gdf, 1)
+
+    assert len(vectorized) == 3
+    pd.testing.assert_frame_equal(pd.DataFrame(vectorized), pd.DataFrame(scalar))
+
 def test_cube_first_fire_plot_does_not_fetch(monkeypatch):
     def _fail_loader(*args, **kwargs):  # pragma: no cover - will fail test if called
         raise AssertionError("Loader should not be called in cube-first mode")
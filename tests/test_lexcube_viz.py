@@ -62,3 +62,17 @@ def test_show_cube_lexcube_requires_time_y_x_dims() -> None:
 
     with pytest.raises(ValueError):
         show_cube_lexcube(bad_cube)
+
+
+def test_show_cube_lexcube_verb_unpacks_single_variable_dataset() -> None:
+    from cubedynamics.verbs import _as_single_da
+    from cubedynamics.verbs import show_cube_lexcube as lexcube_verb
+
+    da = xr.DataArray(np.zeros((2, 2, 2)), dims=("time", "y", "x"), name="t2m")
+
+    assert _as_single_da(da, "verb") is da
+    assert _as_single_da(da.to_dataset(), "verb").identical(da)
+
+    multi = xr.Dataset({"a": da, "b": da})
+    with pytest.raises(ValueError, match="exactly one data variable"):
+        lexcube_verb()(multi)
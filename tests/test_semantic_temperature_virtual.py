@@ -57,3 +57,28 @@ def test_temperature_streaming_strategy_auto_switches(monkeypatch, tiny_temp_cub
     monkeypatch.setattr(variables, "estimate_cube_size", lambda *args, **kwargs: 1e12)
     large = variables.temperature(lat=40.0, lon=-105.0, start="2020-01-01", end="2020-01-02", streaming_strategy="auto")
     assert isinstance(large, VirtualCube)
+
+
+def test_temperature_anomaly_virtual_pushes_down_baseline_window(monkeypatch, tiny_temp_cube):
+    requested = []
+
+    def fake_loader(**kwargs):
+        requested.append((kwargs.get("start"), kwargs.get("end")))
+        return tiny_temp_cube.sel(time=slice(kwargs.get("start"), kwargs.get("end")))
+
+    monkeypatch.setattr(variables, "_load_temperature", fake_loader)
+    monkeypatch.setattr(variables, "estimate_cube_size", lambda *args, **kwargs: 1e12)
+
+    anom = variables.temperature_anomaly(
+        lat=40.0,
+        lon=-105.0,
+        start="2020-01-01",
+        end="2020-01-02",
+        baseline_start="2020-01-01",
+        baseline_end="2020-01-01",
+        streaming_strategy="virtual",
+    )
+
+    assert requested[0] == ("2020-01-01", "2020-01-01")
+    expected = tiny_temp_cube - tiny_temp_cube.isel(time=0)
+    xr.testing.assert_allclose(anom.transpose(*expected.dims), expected)
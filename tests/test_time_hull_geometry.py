@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pytest
 from shapely.geometry import Polygon
 
 from cubedynamics.ops_fire.time_hull import FireEventDaily, compute_time_hull_geometry
@@ -47,3 +48,70 @@ def test_compute_time_hull_geometry_basic():
     assert hull.verts_km.shape[1] == 3
     assert hull.tris.shape[1] == 3
     assert hull.tris.shape[0] > 0
+
+
+def test_ring_sampling_matches_shapely_interpolation():
+    from shapely.geometry import LineString
+
+    from cubedynamics.fire_time_hull import _sample_ring_equal_steps
+
+    poly = Polygon([(0.0, 0.0), (3.0, 0.0), (3.0, 1.0), (1.0, 2.5), (0.0, 1.0)])
+    xy = _sample_ring_equal_steps(poly, n_samples=37)
+
+    ring = LineString(list(poly.exterior.coords)[:-1])
+    distances = np.linspace(0.0, ring.length, 37, endpoint=False)
+    expected = np.array([[p.x, p.y] for p in (ring.interpolate(d) for d in distances)])
+    np.testing.assert_allclose(xy, expected, atol=1e-12)
+
+
+def test_hull_triangles_cover_every_quad_with_positive_surface():
+    event = _synthetic_fire_event(n_days=3)
+    hull = compute_time_hull_geometry(event, n_ring_samples=16, n_theta=12)
+
+    # Two triangles per quad between consecutive day rings, angles wrapping.
+    assert hull.tris.shape == (2 * 2 * 12, 3)
+    np.testing.assert_array_equal(hull.tris[:2], [[0, 1, 13], [0, 13, 12]])
+    np.testing.assert_array_equal(hull.tris[22:24], [[11, 0, 12], [11, 12, 23]])
+    assert hull.metrics["surface_km_day"] > 0
+
+
+def test_derivative_hull_radius_matches_speed_and_acceleration():
+    from cubedynamics.fire_time_hull import compute_derivative_hull
+
+    event = _synthetic_fire_event(n_days=4)
+    hull = compute_time_hull_geometry(event, n_ring_samples=16, n_theta=12)
+    P = hull.verts_km.reshape(4, 12, 3)
+    speed = np.linalg.norm(np.gradient(P[..., :2], axis=0), axis=-1)
+    expected = {1: speed, 2: np.abs(np.gradient(speed, axis=0))}
+
+    for order, field in expected.items():
+        deriv = compute_derivative_hull(hull, order=order)
+        Q = deriv.verts_km.reshape(4, 12, 3)
+        np.testing.assert_allclose(np.hypot(Q[..., 0], Q[..., 1]), field, atol=1e-12)
+        np.testing.assert_array_equal(Q[..., 2], P[..., 2])
+        np.testing.assert_array_equal(deriv.tris, hull.tris)
+
+
+def test_derivative_hull_plot_limits_are_robust_percentiles():
+    from cubedynamics.fire_time_hull import compute_derivative_hull, plot_derivative_hull
+
+    event = _synthetic_fire_event(n_days=4)
+    hull = compute_time_hull_geometry(event, n_ring_samples=16, n_theta=12)
+    deriv = compute_derivative_hull(hull, order=1)
+
+    mesh = plot_derivative_hull(hull, deriv, order=1).data[0]
+    intensities = np.asarray(mesh.intensity, dtype=float)
+    np.testing.assert_allclose([mesh.cmin, mesh.cmax], np.nanpercentile(intensities, [5, 95]))
+
+
+def test_derivative_hull_plot_reuses_stored_field(monkeypatch):
+    import cubedynamics.fire_time_hull as fth
+
+    event = _synthetic_fire_event(n_days=4)
+    hull = compute_time_hull_geometry(event, n_ring_samples=16, n_theta=12)
+    deriv = fth.compute_derivative_hull(hull, order=2)
+
+    monkeypatch.setattr(fth, "_derivative_field", lambda *a: pytest.fail("field recomputed"))
+    mesh = fth.plot_derivative_hull(hull, deriv, order=2).data[0]
+
+    np.testing.assert_array_equal(mesh.intensity, np.abs(deriv.vertex_field))
@@ -149,3 +149,207 @@ def test_ndvi_uses_sentinel_ndvi_helper(monkeypatch):
     assert isinstance(out, xr.DataArray)
     assert out.dims == ("time", "y", "x")
     assert called["kwargs"]["lat"] == 40.0
+
+
+def test_year_chunks_clamps_to_requested_range():
+    from cubedynamics.variables import _year_chunks
+
+    chunks = _year_chunks("2019-06-01", "2023-03-01", years_per_chunk=2)
+
+    assert chunks == [
+        ("2019-06-01", "2020-12-31"),
+        ("2021-01-01", "2022-12-31"),
+        ("2023-01-01", "2023-03-01"),
+    ]
+    assert _year_chunks("2020-01-01", "2019-01-01") == []
+
+
+def test_temperature_tags_attrs_without_copying_data(monkeypatch):
+    source = fake_cube("tmmx").to_dataset(name="tmmx")
+    source["tmmx"].attrs.pop("variable")
+
+    monkeypatch.setattr(
+        "cubedynamics.variables.load_gridmet_cube",
+        lambda *args, **kwargs: source,
+    )
+
+    da = cd.temperature(lat=40.0, lon=-105.25, start="2000-01-01", end="2000-01-03")
+
+    assert da.attrs["variable"] == "tmmx"
+    assert da.attrs["source"] == "gridmet"
+    assert "variable" not in source["tmmx"].attrs
+    assert np.shares_memory(da.values, source["tmmx"].values)
+
+
+def test_temperature_anomaly_with_baseline_window(monkeypatch):
+    def fake_gridmet_loader(*args, **kwargs):
+        variable = kwargs.pop("variable", "unknown")
+        time = pd.date_range("2000-01-01", periods=4, freq="D")
+        data = xr.DataArray(
+            np.arange(8, dtype=float).reshape(4, 1, 2),
+            coords={"time": time, "y": [0], "x": [0, 1]},
+            dims=("time", "y", "x"),
+        )
+        return data.to_dataset(name=variable)
+
+    monkeypatch.setattr(
+        "cubedynamics.variables.load_gridmet_cube",
+        fake_gridmet_loader,
+    )
+
+    anom = cd.temperature_anomaly(
+        lat=0.0,
+        lon=0.0,
+        start="2000-01-01",
+        end="2000-01-04",
+        baseline_start="2000-01-01",
+        baseline_end="2000-01-02",
+    )
+
+    assert anom.dims == ("time", "y", "x")
+    np.testing.assert_allclose(anom.isel(time=0).values, [[-1.0, -1.0]])
+    np.testing.assert_allclose(anom.isel(time=-1).values, [[5.0, 5.0]])
+
+
+def test_temperature_forwards_size_aware_chunks(monkeypatch):
+    calls = []
+
+    def fake_gridmet_loader(*args, **kwargs):
+        variable = kwargs.pop("variable", "unknown")
+        calls.append(kwargs.get("chunks"))
+        return fake_cube(variable).to_dataset(name=variable)
+
+    monkeypatch.setattr(
+        "cubedynamics.variables.load_gridmet_cube",
+        fake_gridmet_loader,
+    )
+
+    cd.temperature_min(lat=40.0, lon=-105.25, start="2000-01-01", end="2000-01-03")
+    cd.temperature_min(bbox=(-120.0, 30.0, -100.0, 50.0), start="1990-01-01", end="2020-12-31")
+    cd.temperature_min(lat=40.0, lon=-105.25, start="2000-01-01", end="2000-01-03", chunks={"time": 1})
+
+    assert calls == [None, {"time": 365, "y": 256, "x": 256}, {"time": 1}]
+
+
+def test_temperature_anomaly_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unsupported temperature anomaly kind"):
+        cd.temperature_anomaly(lat=0.0, lon=0.0, start="2000-01-01", end="2000-01-03", kind="median")
+
+
+@pytest.mark.parametrize("time_chunk", [None, 10])
+def test_ndvi_chunked_appends_chunks_to_zarr_cache(monkeypatch, tmp_path, time_chunk):
+    pytest.importorskip("zarr")
+
+    def fake_ndvi(*, lat, lon, start, end, **kwargs):
+        time = pd.date_range(start, end, freq="30D")
+        da = xr.DataArray(
+            np.full((time.size, 3, 2), float(time[0].year)),
+            coords={"time": time, "y": [0, 1, 2], "x": [0, 1]},
+            dims=("time", "y", "x"),
+            name="ndvi",
+        )
+        # The real loader returns dask-backed cubes whose time chunks do not
+        # line up with the year boundaries of the appends.
+        return da if time_chunk is None else da.chunk({"time": time_chunk, "y": 2})
+
+    monkeypatch.setattr(cd, "ndvi", fake_ndvi)
+
+    store = tmp_path / "ndvi.zarr"
+    out = cd.ndvi_chunked(
+        lat=40.0,
+        lon=-105.25,
+        start="2019-01-01",
+        end="2021-12-31",
+        drop_bad=False,
+        zarr_cache=store,
+    )
+    expected = cd.ndvi_chunked(
+        lat=40.0,
+        lon=-105.25,
+        start="2019-01-01",
+        end="2021-12-31",
+        drop_bad=False,
+    )
+
+    assert store.exists()
+    assert out.chunks is not None
+    xr.testing.assert_allclose(out.compute(), expected)
+
+
+def test_estimate_cube_size_accepts_array_bbox():
+    from cubedynamics.variables import estimate_cube_size
+
+    size = estimate_cube_size(None, None, np.array([0.0, 0.0, 4.0, 2.0]), None, "2000-01-01", "2000-01-11", "gridmet")
+    tiny = estimate_cube_size(None, None, (0.0, 0.0, 0.1, 0.1), None, "2000-01-01", "2000-01-11", "gridmet")
+
+    assert size == 80.0
+    assert tiny == 10.0
+
+
+def test_ndvi_quantize_packs_int16(monkeypatch):
+    def fake_ndvi_loader(*args, **kwargs):
+        time = pd.date_range("2020-01-01", periods=2, freq="D")
+        return xr.DataArray(
+            np.array([[[0.12345]], [[np.nan]]]),
+            coords={"time": time, "y": [0], "x": [0]},
+            dims=("time", "y", "x"),
+            name="ndvi",
+        )
+
+    monkeypatch.setattr("cubedynamics.variables.load_sentinel2_ndvi_cube", fake_ndvi_loader)
+
+    out = cd.ndvi(lat=40.0, lon=-105.25, start="2020-01-01", end="2020-01-31", quantize=True)
+
+    assert out.dtype == np.int16
+    assert out.values.ravel().tolist() == [1234, -32768]
+    decoded = xr.decode_cf(out.to_dataset())["ndvi"]
+    np.testing.assert_allclose(decoded.values.ravel(), [0.1234, np.nan])
+
+
+def test_temperature_anomaly_fetches_baseline_outside_window_once(monkeypatch):
+    requested = []
+    time = pd.date_range("2000-01-01", periods=4, freq="D")
+    cube = xr.DataArray(np.arange(4, dtype=float), coords={"time": time}, dims=("time",))
+
+    def fake_loader(**kwargs):
+        requested.append((kwargs["start"], kwargs["end"]))
+        return cube.sel(time=slice(kwargs["start"], kwargs["end"]))
+
+    monkeypatch.setattr("cubedynamics.variables._load_temperature", fake_loader)
+
+    anom = cd.temperature_anomaly(
+        lat=0.0,
+        lon=0.0,
+        start="2000-01-03",
+        end="2000-01-04",
+        baseline_start="2000-01-01",
+        baseline_end="2000-01-02",
+        streaming_strategy="materialize",
+    )
+
+    assert requested == [("2000-01-01", "2000-01-04")]
+    assert list(anom.time.values) == list(time[2:].values)
+    np.testing.assert_allclose(anom.values, [1.5, 2.5])
+
+
+def test_temperature_anomaly_groupby_month_climatology(monkeypatch):
+    time = pd.to_datetime(["2000-01-01", "2000-01-02", "2000-02-01", "2000-02-02"])
+    cube = xr.DataArray(
+        np.array([1.0, 3.0, 10.0, 14.0]).reshape(4, 1, 1),
+        coords={"time": time, "y": [0], "x": [0]},
+        dims=("time", "y", "x"),
+    )
+    monkeypatch.setattr("cubedynamics.variables._load_temperature", lambda **kwargs: cube)
+
+    anom = cd.temperature_anomaly(
+        lat=0.0,
+        lon=0.0,
+        start="2000-01-01",
+        end="2000-02-02",
+        groupby="time.month",
+        streaming_strategy="materialize",
+    )
+
+    assert anom.dims == ("time", "y", "x")
+    assert "month" not in anom.coords
+    np.testing.assert_allclose(anom.values.ravel(), [-1.0, 1.0, -2.0, 2.0])
@@ -99,6 +99,7 @@ def test_build_vase_mask_with_dask_streaming():
 
     assert mask.shape == (len(times), len(ys), len(xs))
     assert mask.dtype == bool
+    assert mask.chunks == (cube.chunks[0], (len(ys),), (len(xs),))
     assert mask.all()
 
 
@@ -122,3 +123,237 @@ def test_vase_pipeline_and_viewer():
 
     result = (pipe(vase_cube) | v.plot()).unwrap()
     assert isinstance(result, CubePlot)
+
+
+def test_build_vase_mask_matches_pointwise_check():
+    ys = np.linspace(-1.0, 6.0, 15)
+    xs = np.linspace(-2.0, 7.0, 19)
+    cube = xr.DataArray(
+        np.zeros((2, len(ys), len(xs))),
+        coords={"time": np.arange(2), "y": ys, "x": xs},
+        dims=("time", "y", "x"),
+    )
+    circle = Point(2.5, 2.5).buffer(2.2)
+    vase = VaseDefinition([VaseSection(time=0, polygon=circle)])
+
+    mask = build_vase_mask(cube, vase)
+
+    expected = np.array([[circle.intersects(Point(x, y)) for x in xs] for y in ys])
+    np.testing.assert_array_equal(mask.values[0], expected)
+    np.testing.assert_array_equal(mask.values[1], expected)
+
+
+def test_build_vase_mask_regular_grid_descending_y_keeps_boundary_points():
+    ys = np.arange(6.0, -1.0, -1.0)
+    xs = np.arange(0.0, 6.0, 0.5)
+    cube = xr.DataArray(
+        np.zeros((1, len(ys), len(xs))),
+        coords={"time": [0], "y": ys, "x": xs},
+        dims=("time", "y", "x"),
+    )
+    tri = Polygon([(0.5, 0.0), (5.0, 1.0), (2.0, 5.0)])
+    vase = VaseDefinition([VaseSection(time=0, polygon=tri)])
+
+    mask = build_vase_mask(cube, vase)
+
+    expected = np.array([[tri.intersects(Point(x, y)) for x in xs] for y in ys])
+    np.testing.assert_array_equal(mask.values[0], expected)
+    assert mask.sel(y=1.0, x=5.0).item()
+
+
+def test_build_vase_mask_reuses_slices_for_shared_sections(monkeypatch):
+    import cubedynamics.vase as vase_mod
+
+    calls = []
+    original = vase_mod._rasterize_polygon
+
+    def counting(polygon, *args, **kwargs):
+        calls.append(polygon)
+        return original(polygon, *args, **kwargs)
+
+    monkeypatch.setattr(vase_mod, "_rasterize_polygon", counting)
+
+    times = np.arange(6)
+    cube = xr.DataArray(
+        np.zeros((len(times), 5, 5)),
+        coords={"time": times, "y": np.arange(5), "x": np.arange(5)},
+        dims=("time", "y", "x"),
+    )
+    vase = VaseDefinition(
+        [VaseSection(time=0, polygon=square(0, 2, 0, 2)), VaseSection(time=5, polygon=square(2, 4, 2, 4))],
+        interp="nearest",
+    )
+
+    mask = build_vase_mask(cube, vase)
+
+    assert len(calls) == 2
+    assert mask.isel(time=0).values[0, 0]
+    assert mask.isel(time=5).values[4, 4]
+
+
+def test_build_vase_mask_lazy_matches_eager():
+    pytest.importorskip("dask.array")
+
+    times = np.arange(5)
+    cube = xr.DataArray(
+        np.zeros((len(times), 6, 6)),
+        coords={"time": times, "y": np.arange(6), "x": np.arange(6)},
+        dims=("time", "y", "x"),
+    )
+    vase = VaseDefinition(
+        [VaseSection(time=0, polygon=square(0, 2, 0, 2)), VaseSection(time=4, polygon=square(1, 5, 1, 5))],
+        interp="nearest",
+    )
+
+    eager = build_vase_mask(cube, vase)
+    lazy = build_vase_mask(cube.chunk({"time": 2}), vase)
+
+    assert lazy.chunks[0] == (2, 2, 1)
+    np.testing.assert_array_equal(lazy.values, eager.values)
+
+
+def test_sample_polygon_boundary_walks_exterior():
+    from cubedynamics.vase import _sample_polygon_boundary
+
+    pts = _sample_polygon_boundary(square(0, 2, 0, 2), 8)
+
+    assert pts.shape == (8, 2)
+    np.testing.assert_allclose(pts[:3], [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]])
+
+
+def test_build_vase_panels_layout():
+    from cubedynamics.vase import build_vase_panels
+
+    vase = VaseDefinition(
+        [VaseSection(time=0, polygon=square(0, 2, 0, 2)), VaseSection(time=10, polygon=square(0, 2, 0, 2))]
+    )
+
+    panels = build_vase_panels(vase, 0, 10, angle_samples=8)
+
+    assert len(panels) == 8
+    assert all(p.z == 0.5 and p.height == 1.0 for p in panels)
+    assert all(0.0 <= p.x <= 1.0 and 0.0 <= p.y <= 1.0 for p in panels)
+    assert panels[0].width == 0.0 and panels[0].yaw == 0.0
+
+
+def test_build_vase_panels_returns_structure_of_arrays():
+    from cubedynamics.vase import VasePanel, VasePanels, build_vase_panels
+
+    vase = VaseDefinition(
+        [
+            VaseSection(time=0, polygon=square(0, 2, 0, 2)),
+            VaseSection(time=5, polygon=square(0, 3, 0, 3)),
+            VaseSection(time=10, polygon=square(1, 3, 1, 3)),
+        ]
+    )
+
+    panels = build_vase_panels(vase, 0, 10, angle_samples=6)
+
+    assert isinstance(panels, VasePanels)
+    assert len(panels) == 12
+    assert panels.x.shape == (12,)
+    np.testing.assert_allclose(panels.z[:6], 0.25)
+    np.testing.assert_allclose(panels.z[6:], 0.75)
+    assert isinstance(panels[7], VasePanel)
+    assert panels[7].x == panels.x[7]
+    assert len(list(panels)) == 12
+
+    single = build_vase_panels(VaseDefinition([VaseSection(time=0, polygon=square(0, 1, 0, 1))]), 0, 1)
+    assert not single
+
+
+def test_polygons_at_times_matches_scalar_linear():
+    from cubedynamics.vase import _polygons_at_times
+
+    tri_a = Polygon([(0, 0), (2, 0), (0, 2)])
+    tri_b = Polygon([(2, 2), (4, 2), (2, 4)])
+    tri_c = Polygon([(0, 0), (4, 0), (0, 4)])
+    vase = VaseDefinition(
+        [VaseSection(time=0, polygon=tri_a), VaseSection(time=2, polygon=tri_b), VaseSection(time=6, polygon=tri_c)],
+        interp="linear",
+    )
+    t_values = np.array([-1.0, 0.0, 0.5, 2.0, 3.0, 6.0, 9.0])
+
+    batched = _polygons_at_times(vase, t_values)
+
+    for t, poly in zip(t_values, batched):
+        np.testing.assert_allclose(
+            np.asarray(poly.exterior.coords),
+            np.asarray(_polygon_at_time(vase, t).exterior.coords),
+        )
+
+
+def test_build_vase_mask_linear_datetime_times():
+    times = np.array(["2020-01-01", "2020-01-02", "2020-01-03"], dtype="datetime64[ns]")
+    cube = xr.DataArray(
+        np.zeros((3, 5, 5)),
+        coords={"time": times, "y": np.arange(5), "x": np.arange(5)},
+        dims=("time", "y", "x"),
+    )
+    vase = VaseDefinition(
+        [VaseSection(time=times[0], polygon=square(0, 2, 0, 2)), VaseSection(time=times[2], polygon=square(2, 4, 2, 4))],
+        interp="linear",
+    )
+
+    mask = build_vase_mask(cube, vase)
+
+    assert mask.isel(time=0).values[0, 0]
+    assert mask.isel(time=1).values[1:4, 1:4].all()
+    assert not mask.isel(time=1).values[0, 0]
+    assert mask.isel(time=2).values[4, 4]
+
+
+def test_build_vase_mask_constant_polygon_is_broadcast_once(monkeypatch):
+    import cubedynamics.vase as vase_mod
+
+    calls = []
+    original = vase_mod._rasterize_polygon
+
+    def counting(polygon, *args, **kwargs):
+        calls.append(polygon)
+        return original(polygon, *args, **kwargs)
+
+    monkeypatch.setattr(vase_mod, "_rasterize_polygon", counting)
+
+    cube = xr.DataArray(
+        np.zeros((4, 5, 5)),
+        coords={"time": np.arange(4), "y": np.arange(5), "x": np.arange(5)},
+        dims=("time", "y", "x"),
+    )
+    vase = VaseDefinition(
+        [VaseSection(time=0, polygon=square(1, 3, 1, 3)), VaseSection(time=3, polygon=square(1, 3, 1, 3))],
+        interp="linear",
+    )
+
+    mask = build_vase_mask(cube, vase)
+
+    assert len(calls) == 1
+    assert mask.values[:, 1:4, 1:4].all()
+    assert mask.sum().item() == 4 * 9
+
+
+def test_scanline_fill_matches_point_in_polygon():
+    pytest.importorskip("numba")
+    from shapely import intersects_xy
+
+    from cubedynamics.vase import _make_scanline_fill, _polygon_edges, _scanline_kernel
+
+    xs = np.arange(10, dtype=float)
+    ys = np.arange(9, -1, -1, dtype=float)
+    polygon = Polygon([(1, 1), (8, 2), (7, 8), (2, 6)]).difference(Point(4.5, 4.5).buffer(1.2))
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    expected = intersects_xy(polygon, grid_x.ravel(), grid_y.ravel()).reshape(grid_x.shape)
+
+    for kernel in (_scanline_kernel(), _make_scanline_fill(range)):
+        out = np.empty((ys.size, xs.size), dtype=bool)
+        kernel(_polygon_edges(polygon), xs, ys, out)
+        np.testing.assert_array_equal(out, expected)
+
+
+def test_sorted_sections_does_not_revalidate():
+    vase = VaseDefinition(
+        [VaseSection(time=1, polygon=square(0, 1, 0, 1)), VaseSection(time=0, polygon=square(0, 2, 0, 2))]
+    )
+
+    assert vase.sorted_sections() is vase
+    assert [s.time for s in vase.sorted_sections().sections] == [0, 1]
@@ -5,6 +5,7 @@ from shapely.geometry import Polygon
 
 from cubedynamics.vase import VaseDefinition, VaseSection
 from cubedynamics.vase_viz import (
+    _convert_time_to_numeric,
     extract_vase_points,
     vase_scatter_plot,
     vase_to_mesh,
@@ -85,3 +86,43 @@ def test_vase_to_mesh():
     mesh = vase_to_mesh(vase)
     assert len(mesh.vertices) > 0
     assert len(mesh.faces) > 0
+
+
+def test_extract_vase_points_skips_nan_and_supports_dask():
+    pytest.importorskip("dask.array")
+    cube = _make_cube().astype(float)
+    cube[0, 0, 1] = np.nan
+    mask = xr.DataArray(np.zeros(cube.shape, dtype=bool), coords=cube.coords, dims=cube.dims)
+    mask[0, 0, 1] = True
+    mask[1, 2, 0] = True
+    mask[2, 1, 1] = True
+
+    eager = extract_vase_points(cube, mask)
+    lazy = extract_vase_points(cube.chunk({"time": 1}), mask)
+
+    np.testing.assert_array_equal(eager["value"], [15.0, 22.0])
+    np.testing.assert_array_equal(eager["time"], [1, 2])
+    for key in ("time", "y", "x", "value"):
+        np.testing.assert_array_equal(lazy[key], eager[key])
+
+
+def test_extract_vase_points_with_lazy_mask_and_empty_chunks():
+    pytest.importorskip("dask.array")
+    cube = _make_cube().chunk({"time": 1})
+    mask = xr.DataArray(np.zeros(cube.shape, dtype=bool), coords=cube.coords, dims=cube.dims)
+    mask[2, 0, 2] = True
+
+    points = extract_vase_points(cube, mask.chunk({"time": 1}))
+    np.testing.assert_array_equal(points["value"], [20])
+    np.testing.assert_array_equal(points["time"], [2])
+
+    none = extract_vase_points(cube, mask & False)
+    assert none["value"].size == 0
+
+
+def test_convert_time_to_numeric_seconds():
+    times = np.array(["1970-01-01T00:00:00", "1970-01-02T00:00:00"], dtype="datetime64[s]")
+
+    np.testing.assert_allclose(_convert_time_to_numeric(times), [0.0, 86400.0])
+    np.testing.assert_allclose(_convert_time_to_numeric(np.diff(times)), [86400.0])
+    np.testing.assert_allclose(_convert_time_to_numeric(np.arange(3)), [0.0, 1.0, 2.0])
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from cubedynamics import pipe
+from cubedynamics.indices.vegetation import compute_ndvi_from_s2
+from cubedynamics.ops.ndvi import ndvi_from_s2
+
+
+def _s2_cube(chunks=None):
+    rng = np.random.default_rng(0)
+    data = rng.uniform(100, 3000, size=(3, 4, 5, 2))
+    da = xr.DataArray(
+        data,
+        coords={
+            "time": pd.date_range("2023-06-01", periods=3),
+            "y": np.arange(4),
+            "x": np.arange(5),
+            "band": ["B04", "B08"],
+        },
+        dims=("time", "y", "x", "band"),
+    )
+    return da.chunk(chunks) if chunks else da
+
+
+def test_ndvi_from_s2_matches_band_math_in_float32():
+    s2 = _s2_cube()
+    nir, red = s2.sel(band="B08"), s2.sel(band="B04")
+
+    ndvi = (pipe(s2) | ndvi_from_s2()).unwrap()
+
+    assert ndvi.dtype == np.float32
+    assert ndvi.name == "ndvi"
+    assert ndvi.dims == ("time", "y", "x")
+    np.testing.assert_allclose(ndvi.values, ((nir - red) / (nir + red)).values, atol=1e-6)
+
+
+def test_compute_ndvi_from_s2_stays_lazy():
+    s2 = _s2_cube(chunks={"time": 1})
+
+    ndvi = compute_ndvi_from_s2(s2)
+
+    assert ndvi.chunks is not None
+    assert ndvi.dtype == np.float32
+    eager = compute_ndvi_from_s2(s2.load())
+    np.testing.assert_allclose(ndvi.values, eager.values)
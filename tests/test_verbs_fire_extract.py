@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pytest
 import xarray as xr
 from shapely.geometry import Polygon
 
@@ -71,3 +72,421 @@ def test_extract_attaches_attrs_and_verbs_run():
 
     v.climate_hist(base_da)
     v.vase(base_da)
+
+
+def test_extract_reuses_hull_for_same_event(monkeypatch):
+    import cubedynamics.verbs.fire as fire_verbs
+
+    calls = []
+    original = fire_verbs.compute_time_hull_geometry
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fire_verbs, "compute_time_hull_geometry", counting)
+    fired_evt = _synthetic_fire_event()
+
+    first = v.extract(_synthetic_climate_cube(), fired_event=fired_evt)
+    second = v.extract(_synthetic_climate_cube(), fired_event=fired_evt)
+
+    assert len(calls) == 1
+    assert first.attrs["vase"] is second.attrs["vase"]
+
+    monkeypatch.setattr(fire_verbs, "_HULL_CACHE_SIZE", 1)
+    v.extract(_synthetic_climate_cube(), fired_event=fired_evt, n_theta=48)
+    assert len(calls) == 2
+
+    v.extract(_synthetic_climate_cube(), fired_event=fired_evt)
+    assert len(calls) == 3
+    assert len(fire_verbs._HULL_CACHE) == 1
+
+
+def test_hull_cache_hits_for_rebuilt_equal_event(monkeypatch):
+    import cubedynamics.verbs.fire as fire_verbs
+
+    calls = []
+    original = fire_verbs.compute_time_hull_geometry
+    monkeypatch.setattr(
+        fire_verbs,
+        "compute_time_hull_geometry",
+        lambda *args, **kwargs: calls.append(kwargs) or original(*args, **kwargs),
+    )
+
+    first = fire_verbs._cached_hull(_synthetic_fire_event(), 20, 16)
+    second = fire_verbs._cached_hull(_synthetic_fire_event(), 20, 16)
+    assert len(calls) == 1 and second is first
+
+    moved = _synthetic_fire_event()
+    moved.gdf.loc[1, "date"] = pd.Timestamp("2000-01-03")
+    fire_verbs._cached_hull(moved, 20, 16)
+    assert len(calls) == 2
+
+
+def test_finite_1d_drops_non_finite_and_keeps_float32():
+    from cubedynamics.fire_time_hull import _finite_1d
+
+    values = np.array([[1.0, np.nan], [np.inf, 3.0]], dtype="float32")
+
+    finite = _finite_1d(values)
+
+    assert finite.dtype == np.float32
+    np.testing.assert_array_equal(finite, [1.0, 3.0])
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_vertex_layer_values_matches_pad_and_clip(monkeypatch, use_numba):
+    import cubedynamics.fire_time_hull as fth
+    from cubedynamics.fire_time_hull import _vertex_layer_values
+
+    if not use_numba:
+        monkeypatch.setattr(fth, "_vertex_intensity_kernel", lambda: None)
+    elif fth._vertex_intensity_kernel() is None:
+        pytest.skip("numba not installed")
+
+    t_days_vert = np.array([0.0, 1.0, 1.5, 2.9, 4.0, 9.0, np.nan])
+    day_vals = np.array([10.0, 20.0, 30.0])
+    n_layers = 5
+
+    padded = np.pad(day_vals, (0, n_layers - day_vals.size), mode="edge")
+    layers = np.clip(np.nan_to_num(t_days_vert - 1), 0, n_layers - 1).astype(int)
+
+    np.testing.assert_array_equal(_vertex_layer_values(t_days_vert, day_vals, n_layers), padded[layers])
+    np.testing.assert_array_equal(_vertex_layer_values(t_days_vert, day_vals, 2), [10, 10, 10, 20, 20, 20, 10])
+
+
+def test_prepared_event_is_shared_by_hull_and_sampler():
+    from cubedynamics.fire_time_hull import (
+        _prepare_event,
+        compute_time_hull_geometry,
+        sample_inside_outside,
+    )
+
+    fired_evt = _synthetic_fire_event()
+    da = _synthetic_climate_cube()
+    prepared = _prepare_event(fired_evt, "date")
+
+    hull = compute_time_hull_geometry(fired_evt, prepared=prepared)
+    summary = sample_inside_outside(fired_evt, da, prepared=prepared)
+    expected = sample_inside_outside(fired_evt, da)
+
+    assert prepared.gdf["date"].is_monotonic_increasing
+    assert len(prepared._polygons) == 2
+    np.testing.assert_array_equal(hull.verts_km, compute_time_hull_geometry(fired_evt).verts_km)
+    np.testing.assert_array_equal(summary.values_inside, expected.values_inside)
+    pd.testing.assert_series_equal(summary.per_day_mean, expected.per_day_mean)
+
+
+def test_shared_hist_bins_cover_both_samples():
+    from cubedynamics.fire_time_hull import _shared_hist_bins
+
+    inside = np.array([1.0, 3.0])
+    outside = np.array([0.5, 2.0])
+
+    np.testing.assert_allclose(_shared_hist_bins(5, inside, outside), np.linspace(0.5, 3.0, 6))
+    edges = _shared_hist_bins("auto", inside, outside)
+    assert edges[0] == 0.5 and edges[-1] == 3.0
+    assert _shared_hist_bins(5, np.array([]), np.array([2.0])) == 5
+
+
+def test_fire_panel_many_reuses_one_figure(tmp_path):
+    import matplotlib.pyplot as plt
+
+    events = [_synthetic_fire_event(), _synthetic_fire_event()]
+    panels = v.fire_panel_many(
+        lambda evt: _synthetic_climate_cube(),
+        events,
+        save_path=str(tmp_path / "panel_{index}.png"),
+    )
+
+    figs = []
+    for evt, cube, fig in panels:
+        assert "fire_climate_summary" in cube.attrs
+        figs.append(fig)
+    plt.close(figs[0])
+
+    assert len(figs) == 2 and figs[0] is figs[1]
+    assert len(figs[0].axes) == 3
+    assert (tmp_path / "panel_0.png").exists() and (tmp_path / "panel_1.png").exists()
+
+
+def test_hull_climate_summary_stores_flat_float32():
+    from cubedynamics.fire_time_hull import HullClimateSummary
+
+    summary = HullClimateSummary(
+        values_inside=[[1, 2], [3, 4]],
+        values_outside=np.array([0.5, np.nan]),
+        per_day_mean=pd.Series(dtype=float),
+    )
+
+    assert summary.values_inside.dtype == np.float32 and summary.values_inside.shape == (4,)
+    assert summary.values_outside.dtype == np.float32 and summary.values_outside.flags.c_contiguous
+
+    built = v.extract(_synthetic_climate_cube(), fired_event=_synthetic_fire_event())
+    assert built.attrs["fire_climate_summary"].values_inside.dtype == np.float32
+
+
+def test_time_hull_to_vase_stores_float64_days():
+    from cubedynamics.fire_time_hull import compute_time_hull_geometry, time_hull_to_vase
+
+    hull = compute_time_hull_geometry(_synthetic_fire_event(), n_ring_samples=8, n_theta=8)
+    days = time_hull_to_vase(hull).metadata["t_days_vert"]
+
+    assert isinstance(days, np.ndarray) and days.dtype == np.float64
+    assert days.shape == (np.asarray(hull.verts_km).shape[0],)
+
+
+def test_extract_twice_on_same_cube_skips_resampling(monkeypatch):
+    import cubedynamics.verbs.fire as fire_verbs
+
+    calls = []
+    original = fire_verbs.build_inside_outside_climate_samples
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fire_verbs, "build_inside_outside_climate_samples", counting)
+
+    da = _synthetic_climate_cube()
+    fired_evt = _synthetic_fire_event()
+
+    out = fire_verbs.extract(da, fired_event=fired_evt)
+    summary = out.attrs["fire_climate_summary"]
+    again = fire_verbs.extract(out, fired_event=fired_evt)
+
+    assert again is out and again.attrs["fire_climate_summary"] is summary
+    assert len(calls) == 1
+
+    fire_verbs.extract(out.isel(time=slice(0, 1)), fired_event=fired_evt)
+    fire_verbs.extract(out, fired_event=fired_evt, n_theta=12)
+    fire_verbs.extract(out, fired_event=_synthetic_fire_event())
+    assert len(calls) == 4
+    assert "_fire_extract_sig" not in out.attrs
+
+
+def test_extract_signature_dies_with_the_annotated_array():
+    import gc
+
+    import cubedynamics.verbs.fire as fire_verbs
+
+    out = fire_verbs.extract(_synthetic_climate_cube(), fired_event=_synthetic_fire_event())
+    key = id(out)
+    assert fire_verbs._extracted_sig(out) is not None
+    # Copies and slices inherit the attrs but never the signature.
+    assert fire_verbs._extracted_sig(out.copy()) is None
+
+    del out
+    gc.collect()
+    assert key not in fire_verbs._EXTRACTED
+
+
+def test_inside_outside_hist_draws_precomputed_densities():
+    import matplotlib.pyplot as plt
+
+    from cubedynamics.fire_time_hull import HullClimateSummary, _inside_outside_hist_on_ax
+
+    summary = HullClimateSummary(
+        values_inside=np.array([0.0, 1.0, 1.0, np.nan]),
+        values_outside=np.array([2.0, 3.0]),
+        per_day_mean=pd.Series(dtype=float),
+    )
+    fig, ax = plt.subplots()
+    _inside_outside_hist_on_ax(ax, summary, bins=3)
+
+    inside, outside = ax.patches
+    np.testing.assert_allclose(inside.get_data().edges, [0.0, 1.0, 2.0, 3.0])
+    np.testing.assert_allclose(inside.get_data().values, [1 / 3, 2 / 3, 0.0])
+    np.testing.assert_allclose(outside.get_data().values, [0.0, 0.0, 1.0])
+    plt.close(fig)
+
+
+def test_extract_keeps_virtual_cube_tiles_lazy():
+    pytest.importorskip("dask.array")
+    import cubedynamics.verbs.fire as fire_verbs
+    from cubedynamics.streaming import VirtualCube
+
+    vc = VirtualCube(
+        dims=("time", "y", "x"),
+        coords_metadata={},
+        loader=lambda: _synthetic_climate_cube().chunk({"time": 1}),
+        loader_kwargs={},
+        time_tiler=lambda _kw: [{}],
+        spatial_tiler=lambda _kw: [{}],
+    )
+
+    out = fire_verbs.extract(vc, fired_event=_synthetic_fire_event())
+    base_da = out.materialize(cache=True)
+
+    assert isinstance(out, VirtualCube) and out is not vc
+    assert base_da.chunks is not None
+    assert base_da.attrs["fire_climate_summary"].values_inside.size > 0
+    assert "fire_climate_summary" not in vc.materialize(cache=True).attrs
+    assert base_da.data is vc.materialize(cache=True).data
+
+
+def test_extract_annotates_a_copy_and_leaves_input_attrs_alone():
+    da = _synthetic_climate_cube()
+
+    out = v.extract(da, fired_event=_synthetic_fire_event())
+
+    assert out is not da and out.data is da.data
+    assert "fire_climate_summary" in out.attrs
+    assert set(da.attrs) == {"epsg"}
+
+
+def test_fire_plot_reuses_hull_built_by_extract(monkeypatch):
+    import cubedynamics.verbs.fire as fire_verbs
+
+    calls = []
+    original = fire_verbs.compute_time_hull_geometry
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fire_verbs, "compute_time_hull_geometry", counting)
+    fired_evt = _synthetic_fire_event()
+    da = _synthetic_climate_cube()
+
+    annotated = fire_verbs.extract(da, fired_event=fired_evt, n_ring_samples=20, n_theta=16)
+    result = fire_verbs.fire_plot(da, fired_event=fired_evt, climate_variable="synthetic", n_ring_samples=20, n_theta=16)
+
+    assert len(calls) == 1
+    assert result["hull"].verts_km is annotated.attrs["fire_time_hull"].verts_km
+
+
+def test_fire_plot_color_limits_ignore_nan_days(monkeypatch):
+    import cubedynamics.verbs.fire as fire_verbs
+    from cubedynamics.fire_time_hull import HullClimateSummary
+
+    days = pd.date_range("2000-01-01", periods=4)
+    summary = HullClimateSummary(
+        values_inside=np.ones(3),
+        values_outside=np.ones(3),
+        per_day_mean=pd.Series([np.nan, 1.0, 2.0, 3.0], index=days),
+    )
+    monkeypatch.setattr(fire_verbs, "sample_inside_outside", lambda *a, **k: summary)
+
+    result = fire_verbs.fire_plot(
+        _synthetic_climate_cube(),
+        fired_event=_synthetic_fire_event(),
+        climate_variable="synthetic",
+        n_ring_samples=20,
+        n_theta=16,
+    )
+
+    np.testing.assert_allclose(result["color_limits"], np.percentile([1.0, 2.0, 3.0], [2, 98]))
+
+def test_fire_plot_passes_lazy_plane_chunked_cube_to_sampler(monkeypatch):
+    pytest.importorskip("dask.array")
+    import cubedynamics.verbs.fire as fire_verbs
+
+    seen = []
+    original = fire_verbs.sample_inside_outside
+
+    def recording(event, da, **kwargs):
+        seen.append(da.chunks)
+        return original(event, da, **kwargs)
+
+    monkeypatch.setattr(fire_verbs, "sample_inside_outside", recording)
+    tiled = _synthetic_climate_cube().chunk({"time": 1, "y": 2, "x": 2})
+
+    result = fire_verbs.fire_plot(
+        tiled,
+        fired_event=_synthetic_fire_event(),
+        climate_variable="synthetic",
+        n_ring_samples=20,
+        n_theta=16,
+    )
+
+    assert seen == [((1, 1), (4,), (4,))]
+    assert result["cube"].da.chunks is not None
+
+def test_extract_samples_spatially_tiled_cube_as_whole_planes():
+    pytest.importorskip("dask.array")
+    from cubedynamics.verbs.fire import _rechunk_for_spatial_sampling
+
+    da = _synthetic_climate_cube()
+    tiled = da.chunk({"time": 1, "y": 2, "x": 2})
+
+    planes = _rechunk_for_spatial_sampling(tiled)
+    assert planes.chunks == ((1, 1), (4,), (4,))
+    assert _rechunk_for_spatial_sampling(planes) is planes
+    assert _rechunk_for_spatial_sampling(da) is da
+
+    eager = v.extract(da.copy(), fired_event=_synthetic_fire_event())
+    lazy = v.extract(tiled, fired_event=_synthetic_fire_event())
+
+    assert lazy.chunks == tiled.chunks
+    np.testing.assert_array_equal(
+        lazy.attrs["fire_climate_summary"].values_inside,
+        eager.attrs["fire_climate_summary"].values_inside,
+    )
+
+
+def test_spatial_sampling_rechunk_caps_time_chunk_bytes(monkeypatch):
+    pytest.importorskip("dask.array")
+    from cubedynamics.verbs import fire as fire_verbs
+
+    da = _synthetic_climate_cube().chunk({"time": 2, "y": 2, "x": 2})
+    day_bytes = da.nbytes // da.sizes["time"]
+
+    monkeypatch.setattr(fire_verbs, "_SAMPLING_CHUNK_BYTES", 2 * day_bytes)
+    assert fire_verbs._rechunk_for_spatial_sampling(da).chunks == ((2,), (4,), (4,))
+
+    monkeypatch.setattr(fire_verbs, "_SAMPLING_CHUNK_BYTES", day_bytes)
+    planes = fire_verbs._rechunk_for_spatial_sampling(da)
+    assert planes.chunks == ((1, 1), (4,), (4,))
+    assert fire_verbs._rechunk_for_spatial_sampling(planes) is planes
+
+
+def test_hull_climate_summary_day_values_sorted_once():
+    from cubedynamics.fire_time_hull import HullClimateSummary
+
+    days = pd.to_datetime(["2000-01-03", "2000-01-01", "2000-01-02"])
+    summary = HullClimateSummary(
+        values_inside=np.empty(0),
+        values_outside=np.empty(0),
+        per_day_mean=pd.Series([3.0, 1.0, 2.0], index=days),
+    )
+
+    vals = summary.day_values()
+    np.testing.assert_array_equal(vals, [1.0, 2.0, 3.0])
+    assert vals.dtype == np.float64
+    assert summary.day_values() is vals
+
+
+def test_time_hull_vase_colors_faces_through_collection_array():
+    import matplotlib.pyplot as plt
+
+    import cubedynamics.verbs.fire as fire_verbs
+
+    annotated = fire_verbs.extract(_synthetic_climate_cube(), fired_event=_synthetic_fire_event())
+    vase_obj = annotated.attrs["vase"]
+    fig = fire_verbs._plot_time_hull_vase(vase_obj, annotated, annotated.attrs["fire_climate_summary"])
+
+    ax3d, cbar_ax = fig.axes
+    (poly,) = ax3d.collections
+    assert poly.get_array().shape == (np.asarray(vase_obj.tris).reshape(-1, 3).shape[0],)
+    assert poly.get_cmap().name == "viridis"
+    assert cbar_ax.get_ylabel() == "synthetic"
+    plt.close(fig)
+
+
+def test_climate_hist_skips_plot_when_samples_empty(monkeypatch):
+    import matplotlib.pyplot as plt
+
+    from cubedynamics.fire_time_hull import HullClimateSummary
+
+    summary = HullClimateSummary(
+        values_inside=np.array([np.nan]),
+        values_outside=np.empty(0),
+        per_day_mean=pd.Series(dtype=float),
+    )
+    da = _synthetic_climate_cube()
+    da.attrs["fire_climate_summary"] = summary
+    monkeypatch.setattr(plt, "figure", lambda *a, **k: pytest.fail("figure allocated"))
+
+    with pytest.warns(UserWarning, match="no finite values"):
+        assert v.climate_hist(da) is da
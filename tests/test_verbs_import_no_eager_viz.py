@@ -20,3 +20,42 @@ def test_verbs_import_does_not_eager_import_viz_modules():
     assert callable(verbs.plot)
     assert "cubedynamics.viz" not in sys.modules
     assert "cubedynamics.viz.lexcube_viz" not in sys.modules
+
+
+def test_package_import_defers_pyplot_and_ipython():
+    """``import cubedynamics`` should not pay for pyplot or IPython up front."""
+
+    import subprocess
+
+    code = (
+        "import sys, cubedynamics; "
+        "print('matplotlib.pyplot' in sys.modules, 'IPython' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_package_import_does_not_load_numba():
+    """numba kernels are compiled on first use, not when the package loads."""
+
+    import subprocess
+
+    code = "import sys, cubedynamics, cubedynamics.verbs; print('numba' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.split() == ["False"]
+
+
+def test_lazy_verbs_resolve_on_first_access():
+    import subprocess
+
+    code = (
+        "import sys, cubedynamics.verbs as v; "
+        "before = 'cubedynamics.verbs.diagnostics' in sys.modules; "
+        "from cubedynamics.verbs import diagnostic_panel; "
+        "print(before, callable(diagnostic_panel), 'fit_model' in dir(v), v.__dict__['diagnostic_panel'] is diagnostic_panel)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.split() == ["False", "True", "True", "True"]
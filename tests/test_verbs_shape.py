@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 import xarray as xr
 
 from cubedynamics import pipe, verbs as v
@@ -20,6 +21,14 @@ def test_apply_handles_dataset():
     np.testing.assert_allclose(result["var"].values, [3, 6, 9])
 
 
+def test_apply_forwards_keywords(tiny_cube):
+    def scale(da, *, factor, offset=0):
+        return da * factor + offset
+
+    result = (pipe(tiny_cube) | v.apply(scale, factor=2, offset=1)).unwrap()
+    np.testing.assert_allclose(result.values, tiny_cube.values * 2 + 1)
+
+
 def test_flatten_space_replaces_spatial_dims(tiny_cube):
     flattened = (pipe(tiny_cube) | v.flatten_space(new_dim="pixel")).unwrap()
     assert flattened.dims == ("time", "pixel")
@@ -31,3 +40,27 @@ def test_flatten_cube_stacks_all_non_time_dims(tiny_cube):
     flattened = (pipe(cube) | v.flatten_cube(sample_dim="sample")).unwrap()
     assert flattened.dims == ("time", "sample")
     assert flattened.sizes["sample"] == cube.sizes["y"] * cube.sizes["x"] * cube.sizes["band"]
+
+
+def test_flatten_space_reshape_matches_stack_without_multiindex(tiny_cube):
+    ny, nx = tiny_cube.sizes["y"], tiny_cube.sizes["x"]
+    cube = tiny_cube.assign_coords(mask=(("y", "x"), np.arange(ny * nx).reshape(ny, nx)))
+    flattened = (pipe(cube) | v.flatten_space(new_dim="pixel")).unwrap()
+    stacked = (pipe(cube) | v.flatten_space(new_dim="pixel", keep_index=True)).unwrap()
+
+    assert "pixel" not in flattened.indexes
+    np.testing.assert_array_equal(flattened.values, stacked.values)
+    for name in ("y", "x", "mask"):
+        np.testing.assert_array_equal(flattened[name].values, stacked[name].values)
+
+
+def test_flatten_cube_reshape_stays_lazy(tiny_cube):
+    pytest.importorskip("dask.array")
+    cube = tiny_cube.expand_dims(band=["B04", "B08"]).chunk({"time": 1})
+    flattened = (pipe(cube) | v.flatten_cube(sample_dim="sample")).unwrap()
+    stacked = (pipe(cube) | v.flatten_cube(sample_dim="sample", keep_index=True)).unwrap()
+
+    assert flattened.chunks is not None
+    assert flattened.dims == stacked.dims
+    np.testing.assert_array_equal(flattened.values, stacked.values)
+    np.testing.assert_array_equal(flattened["band"].values, stacked["band"].values)
@@ -73,3 +73,51 @@ def test_virtual_cube_tiles_and_materialize_match():
     materialized = vc.materialize().transpose(*combined.dims)
     xr.testing.assert_allclose(materialized, combined)
     xr.testing.assert_allclose(materialized, base)
+
+
+def test_virtual_cube_materialize_cache_and_invalidate():
+    times = pd.date_range("2020-01-01", periods=2, freq="D")
+    base = xr.DataArray(
+        np.arange(8, dtype=float).reshape(2, 2, 2),
+        coords={"time": times, "y": [0.0, 1.0], "x": [0.0, 1.0]},
+        dims=("time", "y", "x"),
+        name="fake",
+    )
+    calls = []
+    loader = _fake_loader_factory(base)
+
+    def counting_loader(**kwargs):
+        calls.append(kwargs)
+        return loader(**kwargs)
+
+    vc = VirtualCube(
+        dims=("time", "y", "x"),
+        coords_metadata={},
+        loader=counting_loader,
+        loader_kwargs={},
+        time_tiler=lambda _kw: [{}],
+        spatial_tiler=lambda _kw: [{}],
+    )
+
+    first = vc.materialize(cache=True)
+    assert vc.materialize(cache=True) is first
+    assert len(calls) == 1
+
+    vc.materialize()
+    assert len(calls) == 2
+
+    vc.invalidate_cache()
+    assert vc.materialize(cache=True) is not first
+    assert len(calls) == 3
+
+    annotated = vc.with_attrs({"note": "fire"})
+    assert len(calls) == 3
+    assert annotated is not vc and annotated.loader is vc.loader
+    assert annotated.materialize(cache=True).attrs["note"] == "fire"
+    assert "note" not in vc.materialize(cache=True).attrs
+
+    # The attrs belong to the annotated cube, not just to its cached array.
+    assert annotated.materialize().attrs["note"] == "fire"
+    annotated.invalidate_cache()
+    assert annotated.materialize(cache=True).attrs["note"] == "fire"
+    assert annotated.with_attrs({"other": 1}).materialize().attrs == {"note": "fire", "other": 1}
@@ -3,7 +3,7 @@ import pandas as pd
 import xarray as xr
 
 from cubedynamics import pipe, verbs as v
-from cubedynamics.streaming import VirtualCube, make_spatial_tiler, make_time_tiler
+from cubedynamics.streaming import VirtualCube, make_spatial_tiler, make_time_tiler, no_spatial_tiler
 from cubedynamics import variables
 
 
@@ -103,4 +103,21 @@ def test_temperature_streaming_strategy(monkeypatch):
         streaming_strategy="virtual",
     )
     assert isinstance(virtual, VirtualCube)
+    assert virtual.spatial_tiler is no_spatial_tiler
     xr.testing.assert_allclose(virtual.materialize(), base)
+
+
+def test_virtual_cube_no_spatial_tiler_matches_materialized():
+    base = _make_base_cube()
+    loader = _tile_loader_factory(base)
+    vc = VirtualCube(
+        dims=("time", "y", "x"),
+        coords_metadata={},
+        loader=loader,
+        loader_kwargs={"start": base.time.values[0], "end": base.time.values[-1]},
+        time_tiler=make_time_tiler(base.time.values[0], base.time.values[-1], freq="2D"),
+        spatial_tiler=no_spatial_tiler,
+    )
+
+    assert len(list(vc.iter_spatial_tiles())) == 1
+    xr.testing.assert_allclose(vc.materialize(), base)
@@ -0,0 +1,299 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import cubedynamics.verbs.landsat_mpc as landsat_mpc
+
+
+def _item(item_id, assets, datetime="2019-07-01T00:00:00", epsg=32613):
+    return SimpleNamespace(
+        id=item_id,
+        assets={name: SimpleNamespace(href=f"https://example/{item_id}/{name}.tif") for name in assets},
+        properties={"datetime": datetime, "proj:epsg": epsg},
+    )
+
+
+class _FakeSearch:
+    def __init__(self, items, max_items=None, **kwargs):
+        self._items = items[:max_items]
+        self.kwargs = kwargs
+
+    def items(self):
+        return iter(self._items)
+
+
+@pytest.fixture
+def fake_catalog(monkeypatch):
+    items = [
+        _item("a", ["SR_B4", "SR_B5"], "2019-07-09T00:00:00"),
+        _item("b", ["SR_B4"]),
+        _item("c", ["SR_B4", "SR_B5"], "2019-07-01T00:00:00"),
+    ]
+    catalog = SimpleNamespace(searches=[], signed=[])
+
+    def search(**kwargs):
+        catalog.searches.append(_FakeSearch(items, **kwargs))
+        return catalog.searches[-1]
+
+    def sign(item):
+        catalog.signed.append(item.id)
+        return item
+
+    catalog.search = search
+    catalog.opened = []
+
+    def open_catalog(url):
+        catalog.opened.append(url)
+        return catalog
+
+    landsat_mpc._open_catalog.cache_clear()
+    monkeypatch.setattr(landsat_mpc.Client, "open", open_catalog)
+    monkeypatch.setattr(landsat_mpc.pc, "sign_inplace", sign)
+    yield catalog
+    landsat_mpc._open_catalog.cache_clear()
+
+
+def test_stream_stacks_complete_items_with_stackstac(monkeypatch, fake_catalog):
+    calls = []
+
+    def fake_stack(items, *, assets, chunksize, **kwargs):
+        calls.append(([item.id for item in items], assets, chunksize, kwargs))
+        return xr.DataArray(
+            np.zeros((len(items), len(assets), 2, 2), dtype="float32"),
+            dims=("time", "band", "y", "x"),
+            coords={"band": assets},
+        )
+
+    stackstac = pytest.importorskip("stackstac")
+    monkeypatch.setattr(
+        landsat_mpc,
+        "_stackstac",
+        SimpleNamespace(stack=fake_stack, DEFAULT_GDAL_ENV=stackstac.DEFAULT_GDAL_ENV),
+    )
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", lambda *a, **k: pytest.fail("per-asset open"))
+
+    cube = landsat_mpc.landsat8_mpc_stream(
+        bbox=[0, 0, 1, 1], start="2019-07-01", end="2019-07-10", chunks_xy={"x": 256, "y": 512}
+    )
+
+    ((ids, assets, chunksize, kwargs),) = calls
+    assert ids == ["a", "c"]
+    assert assets == ["SR_B4", "SR_B5"]
+    assert chunksize == (512, 256)
+    assert kwargs["dtype"] == "float32" and kwargs["sortby_date"] == "asc"
+    assert kwargs["epsg"] == 32613 and kwargs["resolution"] == 30
+    assert kwargs["xy_coords"] == "center" and kwargs["snap_bounds"] is False
+    assert kwargs["bounds"] == landsat_mpc._bbox_grid([0, 0, 1, 1], "EPSG:32613", (0.0, 0.0))[0]
+    assert kwargs["gdal_env"].always.options["GDAL_HTTP_MULTIPLEX"] == "YES"
+    assert list(cube["band"].values) == ["red", "nir"]
+
+
+def test_stream_falls_back_to_rioxarray_without_stackstac(monkeypatch, fake_catalog):
+    opened = []
+
+    def fake_open(href, **kwargs):
+        opened.append(kwargs["chunks"])
+        return xr.DataArray(np.ones((1, 2, 2)), dims=("band", "y", "x"), coords={"y": [0, 1], "x": [0, 1]})
+
+    concat_dtypes = []
+    original_concat = xr.concat
+
+    def recording_concat(objs, *args, **kwargs):
+        concat_dtypes.extend(obj.dtype for obj in objs)
+        return original_concat(objs, *args, **kwargs)
+
+    monkeypatch.setattr(landsat_mpc, "_stackstac", None)
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", fake_open)
+    monkeypatch.setattr(landsat_mpc.xr, "concat", recording_concat)
+
+    cube = landsat_mpc.landsat8_mpc_stream(bbox=[0, 0, 1, 1], start="2019-07-01", end="2019-07-10")
+
+    assert cube.dims == ("time", "band", "y", "x")
+    assert cube.sizes["time"] == 2
+    assert cube["time"].values[0] < cube["time"].values[1]
+    assert cube.dtype == "float32"
+    assert opened == [{"x": 512, "y": 512}] * 4
+    assert concat_dtypes and all(dtype == np.float32 for dtype in concat_dtypes)
+
+
+def test_stream_sorts_caps_and_signs_only_complete_items(monkeypatch, fake_catalog):
+    monkeypatch.setattr(landsat_mpc, "_stackstac", None)
+    monkeypatch.setattr(
+        landsat_mpc.rxr,
+        "open_rasterio",
+        lambda href, **kwargs: xr.DataArray(np.ones((2, 2)), dims=("y", "x"), coords={"y": [0, 1], "x": [0, 1]}),
+    )
+
+    cube = landsat_mpc.landsat8_mpc_stream(bbox=[0, 0, 1, 1], start="2019-07-01", end="2019-07-10", max_items=2)
+
+    (search,) = fake_catalog.searches
+    assert fake_catalog.opened == [landsat_mpc.MPC_STAC_URL]
+    assert search.kwargs["sortby"] == [{"field": "properties.datetime", "direction": "asc"}]
+    assert fake_catalog.signed == ["a"]
+    assert cube.sizes["time"] == 1
+
+    with pytest.raises(RuntimeError, match="No Landsat-8 items"):
+        landsat_mpc.landsat8_mpc_stream(bbox=[0, 0, 1, 1], start="2019-07-01", end="2019-07-10", max_items=0)
+    # The STAC client is opened once per URL and reused by later streams.
+    assert fake_catalog.opened == [landsat_mpc.MPC_STAC_URL]
+
+
+def _lonlat_bbox(left, bottom, right, top, crs="EPSG:32613"):
+    from rasterio.warp import transform_bounds
+
+    return list(transform_bounds(crs, "EPSG:4326", left, bottom, right, top))
+
+
+def _utm_scene(x0, crs="EPSG:32613", n=4):
+    # Pixel-centre coords of an n x n 30 m scene whose first centre is (x0, 500_000).
+    da = xr.DataArray(
+        np.ones((1, n, n), dtype="float32"),
+        dims=("band", "y", "x"),
+        coords={"y": 500_000 - 30.0 * np.arange(n), "x": x0 + 30.0 * np.arange(n)},
+    ).chunk({"x": 2, "y": 2})
+    return da.rio.write_crs(crs)
+
+
+def test_stream_fallback_aligns_same_crs_scenes_lazily_onto_bbox_grid(monkeypatch, fake_catalog):
+    pytest.importorskip("rioxarray")
+    from rioxarray.raster_array import RasterArray
+
+    def fake_open(href, **kwargs):
+        # Scene "a" (the later one) is shifted by one pixel relative to "c".
+        return _utm_scene(400_030 if "/a/" in href else 400_000)
+
+    monkeypatch.setattr(landsat_mpc, "_stackstac", None)
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", fake_open)
+    monkeypatch.setattr(RasterArray, "reproject_match", lambda *a, **k: pytest.fail("eager reprojection"))
+    bbox = _lonlat_bbox(400_000, 499_910, 400_090, 500_000)
+
+    cube = landsat_mpc.landsat8_mpc_stream(bbox=bbox, start="2019-07-01", end="2019-07-10")
+
+    _, grid_x, grid_y = landsat_mpc._bbox_grid(bbox, "EPSG:32613", (399_985.0, 500_015.0))
+    np.testing.assert_array_equal(cube["x"].values, grid_x)
+    np.testing.assert_array_equal(cube["y"].values, grid_y)
+    assert cube.chunks is not None
+    first = cube.isel(time=0, band=0).compute()
+    second = cube.isel(time=1, band=0).compute()
+    assert (first.sel(x=400_000, y=500_000) == 1).item()
+    assert np.isnan(second.sel(x=400_000, y=500_000)).item()
+    assert (second.sel(x=400_090, y=500_000) == 1).item()
+    # Pixels of the bbox grid outside every footprint stay NaN.
+    assert np.isnan(first.sel(x=grid_x[grid_x < 400_000]).values).all()
+
+
+def test_stream_fallback_reprojects_only_scenes_in_another_crs(monkeypatch, fake_catalog):
+    pytest.importorskip("rioxarray")
+    from rioxarray.raster_array import RasterArray
+
+    def fake_open(href, **kwargs):
+        if "/a/" in href:
+            return _utm_scene(800_000, crs="EPSG:32612")
+        return _utm_scene(400_000)
+
+    reprojected = []
+    original = RasterArray.reproject_match
+
+    def spy(self, match, **kwargs):
+        reprojected.append(self._obj.rio.crs)
+        return original(self, match, **kwargs)
+
+    monkeypatch.setattr(landsat_mpc, "_stackstac", None)
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", fake_open)
+    monkeypatch.setattr(RasterArray, "reproject_match", spy)
+    bbox = _lonlat_bbox(400_000, 499_910, 400_090, 500_000)
+
+    cube = landsat_mpc.landsat8_mpc_stream(bbox=bbox, start="2019-07-01", end="2019-07-10")
+
+    assert [str(crs) for crs in reprojected] == ["EPSG:32612"]
+    assert cube.rio.crs == "EPSG:32613"
+    assert cube.sizes["time"] == 2
+
+
+def test_stream_fallback_opens_assets_on_worker_threads_with_gdal_env(monkeypatch, fake_catalog):
+    import threading
+
+    import rasterio
+
+    seen = []
+
+    def fake_open(href, **kwargs):
+        seen.append((threading.current_thread() is threading.main_thread(), rasterio.env.getenv()))
+        return xr.DataArray(np.ones((1, 2, 2)), dims=("band", "y", "x"), coords={"y": [0, 1], "x": [0, 1]})
+
+    monkeypatch.setattr(landsat_mpc, "_stackstac", None)
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", fake_open)
+
+    cube = landsat_mpc.landsat8_mpc_stream(bbox=[0, 0, 1, 1], start="2019-07-01", end="2019-07-10")
+
+    assert len(seen) == 4
+    assert not any(on_main for on_main, _ in seen)
+    assert all(env["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR" for _, env in seen)
+    assert all(env["GDAL_HTTP_MULTIPLEX"] == "YES" for _, env in seen)
+    assert list(cube["band"].values) == ["red", "nir"]
+
+
+def _pystac_item(i, epsg, x0, y0=500_015):
+    import datetime
+
+    pystac = pytest.importorskip("pystac")
+    it = pystac.Item(
+        id=f"s{i}",
+        geometry=None,
+        bbox=None,
+        datetime=datetime.datetime(2019, 7, 1 + i),
+        properties={"proj:epsg": epsg},
+    )
+    for asset in ("SR_B4", "SR_B5"):
+        it.add_asset(
+            asset,
+            pystac.Asset(
+                href=f"https://example/{i}/{asset}.tif",
+                media_type="image/tiff",
+                extra_fields={
+                    "proj:shape": [4, 4],
+                    "proj:transform": [30, 0, x0, 0, -30, y0, 0, 0, 1],
+                    "proj:bbox": [x0, y0 - 120, x0 + 120, y0],
+                },
+            ),
+        )
+    return it
+
+
+def test_stackstac_puts_scenes_from_two_utm_zones_on_first_crs():
+    stackstac = pytest.importorskip("stackstac")
+
+    # The second scene covers the same ground from the neighbouring UTM zone.
+    items = [_pystac_item(0, 32613, 399_985), _pystac_item(1, 32612, 1_066_300, 501_945)]
+    with pytest.raises(ValueError, match="common CRS"):
+        stackstac.stack(items, assets=["SR_B4", "SR_B5"])
+
+    bbox = _lonlat_bbox(400_000, 499_910, 400_090, 500_000)
+    cube = landsat_mpc._stack_items_stackstac(items, ["red", "nir"], {"x": 512, "y": 512}, bbox)
+
+    assert cube.sizes["time"] == 2
+    assert cube.attrs["crs"].upper() == "EPSG:32613"
+    assert float(cube["x"].diff("x")[0]) == 30
+    assert list(cube["band"].values) == ["red", "nir"]
+
+
+def test_stackstac_and_fallback_return_the_same_bbox_grid(monkeypatch):
+    pytest.importorskip("stackstac")
+    pytest.importorskip("rioxarray")
+
+    items = [_pystac_item(0, 32613, 399_985), _pystac_item(1, 32613, 400_015)]
+    bbox = _lonlat_bbox(400_000, 499_910, 400_090, 500_000)
+
+    def fake_open(href, **kwargs):
+        return _utm_scene(400_030 if "/1/" in href else 400_000)
+
+    monkeypatch.setattr(landsat_mpc.rxr, "open_rasterio", fake_open)
+
+    fast = landsat_mpc._stack_items_stackstac(items, ["red", "nir"], {"x": 512, "y": 512}, bbox)
+    fallback = landsat_mpc._stack_items_rioxarray(items, ["red", "nir"], {"x": 512, "y": 512}, bbox)
+
+    np.testing.assert_allclose(fast["x"].values, fallback["x"].values)
+    np.testing.assert_allclose(fast["y"].values, fallback["y"].values)
+    assert fast.sizes == fallback.sizes